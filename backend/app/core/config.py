@@ -46,10 +46,16 @@ class Settings(BaseSettings):
     # EPA AirNow API (for air quality - PM2.5, Ozone)
     airnow_api_key: Optional[str] = None
 
+    # eBird API (recent bird sightings for Essex County)
+    ebird_api_key: Optional[str] = None
+
     # ERDDAP settings for ocean data (CoastWatch)
     coastwatch_erddap_url: str = "https://coastwatch.noaa.gov/erddap"
     erddap_timeout: int = 20
 
+    # On-disk cache for daily environmental data (defaults to the system temp dir)
+    environmental_cache_path: Optional[str] = None
+
     # Bounding box for Ipswich coastal queries
     ipswich_bbox_lat_min: float = 42.55
     ipswich_bbox_lat_max: float = 42.80
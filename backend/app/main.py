@@ -9,6 +9,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.api.v1 import api_router
 from app.core.config import get_settings
 from app.core.database import init_db
+from app.services.environmental.base import close_http_client
 
 # Configure logging
 logging.basicConfig(
@@ -36,6 +37,7 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down...")
+    await close_http_client()
 
 
 app = FastAPI(
@@ -263,7 +263,11 @@ def environmental_context_to_schema(context) -> EnvironmentalContextSchema:
         if obj is None:
             return None
         if hasattr(obj, "__dataclass_fields__"):
-            return {k: getattr(obj, k) for k in obj.__dataclass_fields__}
+            data = {k: getattr(obj, k) for k in obj.__dataclass_fields__}
+            # Some contexts build their description on demand as a property
+            if "description" not in data and hasattr(obj, "description"):
+                data["description"] = obj.description
+            return data
         return obj
 
     return EnvironmentalContextSchema(
@@ -1,5 +1,6 @@
 """Context builder for assembling story generation context."""
 
+import asyncio
 from datetime import date
 from typing import Optional
 
@@ -37,9 +38,12 @@ class ContextBuilder:
         """Build complete story context for a given date."""
         max_news_items = max_news_items or settings.max_news_items_per_story
 
-        # Gather all context components
-        weather = await self.weather_service.get_weather_for_date(target_date)
-        tide = await self.tide_service.get_tide_for_date(target_date)
+        # Gather all context components. The tide lookup is HTTP only, so it
+        # can run alongside the weather lookup, which holds the DB session.
+        weather, tide = await asyncio.gather(
+            self.weather_service.get_weather_for_date(target_date),
+            self.tide_service.get_tide_for_date(target_date),
+        )
         season = self._build_season_context(target_date)
 
         news_items = []
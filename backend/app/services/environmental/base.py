@@ -3,17 +3,32 @@
 This module provides:
 - Common constants for Ipswich, MA location
 - ERDDAPClient for querying NOAA CoastWatch ERDDAP servers
+- A shared, connection-pooled httpx client for ERDDAP requests
+- An in-memory TTL cache for slowly-updating data sources
+- A persistent SQLite cache for daily products that survives restarts
 - Shared dataclasses used across multiple services
 - Error handling utilities
 """
 
+import asyncio
+import csv
+import functools
+import json
 import logging
-from dataclasses import dataclass
-from datetime import datetime, timedelta
-from typing import Any, Optional
+import os
+import statistics
+import sqlite3
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Optional
 
 import httpx
 
+from app.core.config import get_settings
+
 logger = logging.getLogger(__name__)
 
 # Ipswich, MA coordinates
@@ -31,6 +46,230 @@ IPSWICH_BBOX = {
 # Default timeout for external API calls
 DEFAULT_TIMEOUT = 15.0
 
+# Upper bound on an ERDDAP response body; a mis-bounded query can return many MB
+MAX_ERDDAP_RESPONSE_BYTES = 5_000_000
+
+# Connection pool limits for the shared HTTP client
+HTTP_POOL_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=50)
+
+_shared_client: Optional[httpx.AsyncClient] = None
+_shared_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared pooled HTTP client for ERDDAP, NOAA tide and LLM API requests.
+
+    Reusing one client keeps TCP/TLS connections alive between requests to
+    the same host. A new client is created if the previous one was closed
+    or belongs to a different event loop (e.g. one Lambda invocation each).
+    """
+    global _shared_client, _shared_client_loop
+
+    loop = asyncio.get_running_loop()
+    if _shared_client is None or _shared_client.is_closed or _shared_client_loop is not loop:
+        _shared_client = httpx.AsyncClient(
+            timeout=DEFAULT_TIMEOUT,
+            http2=True,
+            follow_redirects=True,
+            limits=HTTP_POOL_LIMITS,
+        )
+        _shared_client_loop = loop
+    return _shared_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client (called at application shutdown)."""
+    global _shared_client, _shared_client_loop
+
+    if _shared_client is not None and not _shared_client.is_closed:
+        await _shared_client.aclose()
+    _shared_client = None
+    _shared_client_loop = None
+
+
+# In-memory TTL cache: key -> (expiry monotonic time, value)
+_ttl_cache: dict[tuple, tuple[float, Any]] = {}
+
+
+def async_ttl_cache(
+    ttl_seconds: float,
+    cache_if: Optional[Callable[[Any], bool]] = None,
+    negative_ttl: Optional[float] = None,
+):
+    """Cache the result of an async service method for ttl_seconds.
+
+    Entries are shared across service instances and keyed on the service
+    class, its DATASET_ID/VARIABLE (when present), and the call arguments.
+    Instance state such as a station id is not part of the key, so pass it
+    as an argument when results depend on it.
+
+    Args:
+        ttl_seconds: How long a cached result stays valid
+        cache_if: Optional predicate; results failing it (e.g. "data
+                  unavailable" defaults) are returned but not cached
+        negative_ttl: If set, results failing cache_if are cached for this
+                      many seconds instead, so an outage isn't retried on
+                      every call
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            key = (
+                type(self).__name__,
+                func.__name__,
+                getattr(self, "DATASET_ID", None),
+                getattr(self, "VARIABLE", None),
+                args,
+                tuple(sorted(kwargs.items())),
+            )
+            now = time.monotonic()
+            cached = _ttl_cache.get(key)
+            if cached is not None and cached[0] > now:
+                return cached[1]
+
+            result = await func(self, *args, **kwargs)
+            if cache_if is None or cache_if(result):
+                ttl = ttl_seconds
+            elif negative_ttl is not None:
+                ttl = negative_ttl
+            else:
+                return result
+            _prune_expired(now)
+            _ttl_cache[key] = (now + ttl, result)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def _prune_expired(now: float) -> None:
+    """Drop expired entries so keys that are never requested again don't pile up."""
+    expired = [key for key, (expires, _) in _ttl_cache.items() if expires <= now]
+    for key in expired:
+        del _ttl_cache[key]
+
+
+def clear_ttl_cache() -> None:
+    """Drop all cached environmental results."""
+    _ttl_cache.clear()
+
+
+class PersistentCache:
+    """Small SQLite-backed key/value store that survives process restarts.
+
+    Values are JSON-serializable dicts. Any SQLite error is logged and
+    treated as a cache miss so a broken cache never blocks a data fetch.
+    The methods block; async callers run them with asyncio.to_thread, and
+    a lock serializes use of the shared connection across those threads.
+    """
+
+    def __init__(self, path: str):
+        """Initialize the cache.
+
+        Args:
+            path: Path to the SQLite database file (created on first use)
+        """
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache "
+                "(key TEXT PRIMARY KEY, expires REAL NOT NULL, value TEXT NOT NULL)"
+            )
+        return self._conn
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return the stored value for key, or None if missing or expired."""
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT expires, value FROM cache WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.debug(f"Persistent cache read failed for {key}: {e}")
+            return None
+
+        if row is None or row[0] <= time.time():
+            return None
+        return json.loads(row[1])
+
+    def set(self, key: str, value: dict, ttl_seconds: float) -> None:
+        """Store value under key for ttl_seconds."""
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO cache (key, expires, value) VALUES (?, ?, ?)",
+                        (key, time.time() + ttl_seconds, json.dumps(value)),
+                    )
+        except sqlite3.Error as e:
+            logger.debug(f"Persistent cache write failed for {key}: {e}")
+
+
+_persistent_cache: Optional[PersistentCache] = None
+
+
+def get_persistent_cache() -> PersistentCache:
+    """Get the process-wide persistent cache."""
+    global _persistent_cache
+
+    if _persistent_cache is None:
+        path = get_settings().environmental_cache_path or os.path.join(
+            tempfile.gettempdir(), "ipswich-story-weaver-cache.sqlite3"
+        )
+        _persistent_cache = PersistentCache(path)
+    return _persistent_cache
+
+
+def persistent_daily_cache(
+    ttl_seconds: float,
+    context_cls: type,
+    cache_if: Optional[Callable[[Any], bool]] = None,
+):
+    """Persist a service method's dataclass result on disk for the current day.
+
+    Intended for daily products (SST, chlorophyll). The key is built from
+    the service's DATASET_ID, VARIABLE and today's date. Results are stored
+    with dataclasses.asdict and rebuilt as context_cls.
+
+    Args:
+        ttl_seconds: How long a stored result stays valid
+        context_cls: Dataclass used to rebuild the stored result
+        cache_if: Optional predicate; results failing it are not stored
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            key = (
+                f"{getattr(self, 'DATASET_ID', type(self).__name__)}:"
+                f"{getattr(self, 'VARIABLE', func.__name__)}:"
+                f"{date.today().isoformat()}"
+            )
+            cache = get_persistent_cache()
+            # SQLite calls block, so keep them off the event loop
+            stored = await asyncio.to_thread(cache.get, key)
+            if stored is not None:
+                try:
+                    return context_cls(**stored)
+                except TypeError:
+                    # Stored under an older field layout; refetch
+                    pass
+
+            result = await func(self, *args, **kwargs)
+            if cache_if is None or cache_if(result):
+                await asyncio.to_thread(cache.set, key, asdict(result), ttl_seconds)
+            return result
+
+        return wrapper
+
+    return decorator
+
 
 @dataclass
 class DataFetchResult:
@@ -41,6 +280,85 @@ class DataFetchResult:
     source: str = ""
 
 
+class ResponseTooLargeError(Exception):
+    """Raised when a response body exceeds the allowed size."""
+
+
+async def fetch_limited_text(
+    client: httpx.AsyncClient,
+    url: str,
+    timeout: float = DEFAULT_TIMEOUT,
+    max_bytes: int = MAX_ERDDAP_RESPONSE_BYTES,
+) -> str:
+    """GET a URL and return its body, refusing bodies larger than max_bytes.
+
+    The body is streamed so an oversized response is abandoned as soon as
+    the limit is crossed instead of being buffered in full.
+
+    Raises:
+        ResponseTooLargeError: If the declared or actual size exceeds max_bytes
+        httpx.HTTPStatusError: On a non-2xx response
+    """
+    async with client.stream("GET", url, timeout=timeout) as response:
+        response.raise_for_status()
+
+        declared = response.headers.get("content-length")
+        if declared and declared.isdigit() and int(declared) > max_bytes:
+            raise ResponseTooLargeError(f"Content-Length {declared} exceeds {max_bytes} bytes")
+
+        chunks = []
+        size = 0
+        async for chunk in response.aiter_bytes():
+            size += len(chunk)
+            if size > max_bytes:
+                raise ResponseTooLargeError(f"Response exceeds {max_bytes} bytes")
+            chunks.append(chunk)
+
+        encoding = response.encoding or "utf-8"
+
+    return b"".join(chunks).decode(encoding, errors="replace")
+
+
+def parse_griddap_csv(text: str, drop_missing: bool = True) -> dict[str, list]:
+    """Parse an ERDDAP griddap .csv response into columns.
+
+    ERDDAP's .csv output is one header row of column names, one row of
+    units, then data rows with "NaN" for missing cells. The rows are
+    transposed once so callers read a variable's values directly instead
+    of indexing into every row.
+
+    Args:
+        text: Raw .csv response body
+        drop_missing: Drop NaN cells from numeric columns. Pass False to keep
+            columns aligned row-for-row (e.g. to pair values with lat/lon).
+
+    Returns:
+        Mapping of column name to its values. Numeric columns are lists of
+        floats (NaN for missing cells unless dropped); other columns (e.g.
+        time) are kept as strings. Rows with the wrong number of cells are
+        skipped.
+    """
+    reader = csv.reader(text.splitlines())
+    column_names = next(reader, [])
+    next(reader, None)  # units row
+
+    # Skip blank or truncated rows rather than letting them shorten every column
+    rows = [row for row in reader if len(row) == len(column_names)]
+
+    columns: dict[str, list] = {name: [] for name in column_names}
+    for name, cells in zip(column_names, zip(*rows)):
+        try:
+            values = list(map(float, cells))
+        except ValueError:
+            columns[name] = list(cells)
+            continue
+        if drop_missing:
+            values = [val for val in values if val == val]  # drop NaN
+        columns[name] = values
+
+    return columns
+
+
 class ERDDAPClient:
     """Client for querying NOAA CoastWatch ERDDAP servers.
 
@@ -50,15 +368,22 @@ class ERDDAPClient:
 
     DEFAULT_BASE_URL = "https://coastwatch.noaa.gov/erddap"
 
-    def __init__(self, base_url: Optional[str] = None, timeout: float = DEFAULT_TIMEOUT):
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        client: Optional[httpx.AsyncClient] = None,
+    ):
         """Initialize ERDDAP client.
 
         Args:
             base_url: ERDDAP server URL. Defaults to NOAA CoastWatch.
             timeout: Request timeout in seconds.
+            client: Optional HTTP client. Defaults to the shared pooled client.
         """
         self.base_url = base_url or self.DEFAULT_BASE_URL
         self.timeout = timeout
+        self._client = client
 
     async def query_griddap(
         self,
@@ -67,6 +392,8 @@ class ERDDAPClient:
         lat_range: tuple[float, float],
         lon_range: tuple[float, float],
         time_range: Optional[tuple[str, str]] = None,
+        altitude: Optional[float] = None,
+        drop_missing: bool = True,
     ) -> Optional[dict]:
         """Query a griddap dataset for the specified region and time.
 
@@ -77,9 +404,11 @@ class ERDDAPClient:
             lon_range: (min_lon, max_lon) tuple
             time_range: Optional (start_time, end_time) in ISO format.
                        Defaults to latest available data.
+            altitude: Value for datasets with an altitude/depth dimension
+            drop_missing: See parse_griddap_csv
 
         Returns:
-            JSON response data or None on error
+            Parsed response columns (see parse_griddap_csv) or None on error
         """
         # Build the constraint string
         var_str = ",".join(variables)
@@ -90,21 +419,27 @@ class ERDDAPClient:
         else:
             time_constraint = "[(last)]"
 
+        # Altitude/depth dimension, for datasets that have one
+        if altitude is not None:
+            time_constraint += f"[({altitude})]"
+
         # Spatial constraints
         lat_constraint = f"[({lat_range[0]}):1:({lat_range[1]})]"
         lon_constraint = f"[({lon_range[0]}):1:({lon_range[1]})]"
 
         # Build URL
         url = (
-            f"{self.base_url}/griddap/{dataset_id}.json?"
+            f"{self.base_url}/griddap/{dataset_id}.csv?"
             f"{var_str}{time_constraint}{lat_constraint}{lon_constraint}"
         )
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout, follow_redirects=True) as client:
-                response = await client.get(url)
-                response.raise_for_status()
-                return response.json()
+            client = self._client or get_http_client()
+            text = await fetch_limited_text(client, url, timeout=self.timeout)
+            return parse_griddap_csv(text, drop_missing=drop_missing)
+        except ResponseTooLargeError as e:
+            logger.warning(f"ERDDAP response too large for {dataset_id}: {e}")
+            return None
         except httpx.TimeoutException:
             logger.warning(f"ERDDAP request timed out for {dataset_id}")
             return None
@@ -150,37 +485,73 @@ class ERDDAPClient:
         if not data:
             return None
 
+        values = data.get(variable)
+        if not values:
+            return None
+
         try:
-            # ERDDAP returns data in a table format
-            table = data.get("table", {})
-            rows = table.get("rows", [])
+            # Return average of available values in the region
+            return statistics.fmean(values)
+        except TypeError as e:
+            logger.error(f"Error parsing ERDDAP response for {dataset_id}: {e}")
+            return None
 
-            if not rows:
-                return None
+    async def get_values_at(
+        self,
+        dataset_id: str,
+        variable: str,
+        points: list[tuple[float, float]],
+        padding: float = 0.05,
+        altitude: Optional[float] = None,
+    ) -> dict[tuple[float, float], Optional[float]]:
+        """Get the latest value of a variable at several points in one request.
 
-            # Find the column index for our variable
-            column_names = table.get("columnNames", [])
-            if variable not in column_names:
-                return None
+        Fetches a single grid covering every point, then picks the nearest
+        grid cell with data for each point.
 
-            var_idx = column_names.index(variable)
+        Args:
+            dataset_id: ERDDAP dataset identifier
+            variable: Variable name to fetch
+            points: (lat, lon) pairs to look up
+            padding: Degrees added around the points' bounding box
+            altitude: Value for datasets with an altitude/depth dimension
 
-            # Get values, filtering out NaN
-            values = []
-            for row in rows:
-                val = row[var_idx]
-                if val is not None and val == val:  # NaN check
-                    values.append(val)
+        Returns:
+            Mapping of each (lat, lon) point to its value (None if unavailable)
+        """
+        results: dict[tuple[float, float], Optional[float]] = {point: None for point in points}
+        if not points:
+            return results
 
-            if not values:
-                return None
+        lats = [lat for lat, _ in points]
+        lons = [lon for _, lon in points]
 
-            # Return average of available values in the region
-            return sum(values) / len(values)
+        data = await self.query_griddap(
+            dataset_id=dataset_id,
+            variables=[variable],
+            lat_range=(min(lats) - padding, max(lats) + padding),
+            lon_range=(min(lons) - padding, max(lons) + padding),
+            altitude=altitude,
+            drop_missing=False,
+        )
 
-        except (KeyError, IndexError, TypeError) as e:
-            logger.error(f"Error parsing ERDDAP response for {dataset_id}: {e}")
-            return None
+        if not data or variable not in data:
+            return results
+
+        # Grid cells that have data (land and cloud cells are NaN)
+        cells = [
+            (cell_lat, cell_lon, val)
+            for cell_lat, cell_lon, val in zip(data["latitude"], data["longitude"], data[variable])
+            if val == val
+        ]
+        if not cells:
+            return results
+
+        for lat, lon in points:
+            nearest = min(cells, key=lambda cell: (cell[0] - lat) ** 2 + (cell[1] - lon) ** 2)
+            results[(lat, lon)] = nearest[2]
+
+        return results
 
 
 def kelvin_to_fahrenheit(kelvin: float) -> float:
@@ -198,14 +569,15 @@ def meters_to_feet(meters: float) -> float:
     return meters * 3.28084
 
 
+COMPASS_16 = (
+    "N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE",
+    "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW",
+)
+
+
 def degrees_to_compass(degrees: float) -> str:
     """Convert degrees (0-360) to compass direction."""
-    directions = [
-        "N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE",
-        "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW"
-    ]
-    idx = round(degrees / 22.5) % 16
-    return directions[idx]
+    return COMPASS_16[round(degrees / 22.5) % 16]
 
 
 def get_season(date: Optional[datetime] = None) -> str:
@@ -7,8 +7,9 @@ This module provides:
 - CoastalErosionService: MA CZM coastal change data (static)
 """
 
+import functools
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, date, timedelta
 from typing import Optional
 
@@ -18,7 +19,6 @@ from app.services.environmental.base import (
     IPSWICH_LAT,
     IPSWICH_LON,
     DEFAULT_TIMEOUT,
-    get_season,
 )
 
 logger = logging.getLogger(__name__)
@@ -26,8 +26,21 @@ logger = logging.getLogger(__name__)
 # Essex County, MA FIPS code
 ESSEX_COUNTY_FIPS = "25009"
 
+# Most weekly drought maps kept per service instance (about two years)
+DROUGHT_CACHE_MAX_ENTRIES = 104
+
+# Meteorological season by month (index 1-12)
+_MONTH_TO_SEASON = (
+    None,
+    "winter", "winter",
+    "spring", "spring", "spring",
+    "summer", "summer", "summer",
+    "autumn", "autumn", "autumn",
+    "winter",
+)
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DroughtContext:
     """Drought conditions for story generation."""
     severity: str = "none"  # "none", "D0", "D1", "D2", "D3", "D4"
@@ -36,7 +49,7 @@ class DroughtContext:
     description: str = "No drought conditions in Essex County"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SnowCoverContext:
     """Snow cover conditions for story generation."""
     depth_inches: Optional[float] = None
@@ -45,7 +58,7 @@ class SnowCoverContext:
     description: str = "No snow cover"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VegetationContext:
     """Vegetation index for story generation."""
     ndvi_value: Optional[float] = None
@@ -53,17 +66,13 @@ class VegetationContext:
     seasonal_note: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CoastalErosionContext:
     """Coastal erosion status for story generation."""
     status: str = "stable"  # "stable", "eroding", "accreting"
-    high_risk_areas: list[str] = None
+    high_risk_areas: tuple[str, ...] = field(default_factory=tuple)
     recent_changes: Optional[str] = None
 
-    def __post_init__(self):
-        if self.high_risk_areas is None:
-            self.high_risk_areas = []
-
 
 # Drought severity descriptions
 DROUGHT_LEVELS = {
@@ -76,6 +85,38 @@ DROUGHT_LEVELS = {
 }
 
 
+def _parse_map_date(value) -> Optional[date]:
+    """Parse a USDM MapDate ("20240102" or ISO timestamp) into a date."""
+    if not value:
+        return None
+
+    text = str(value)
+    for fmt, length in (("%Y%m%d", 8), ("%Y-%m-%d", 10)):
+        try:
+            return datetime.strptime(text[:length], fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+def _parse_drought_record(record: dict) -> DroughtContext:
+    """Find the highest drought severity with coverage in a USDM record."""
+    # Check severity levels from worst to best
+    for level in ["D4", "D3", "D2", "D1", "D0"]:
+        pct = record.get(level, 0)
+        if pct and float(pct) > 0:
+            pct = float(pct)
+            severity, name, desc = DROUGHT_LEVELS[level]
+            return DroughtContext(
+                severity=severity,
+                severity_name=name,
+                percent_area_affected=pct,
+                description=f"{name}: {desc}. {pct:.1f}% of Essex County affected.",
+            )
+
+    return DroughtContext()
+
+
 class DroughtMonitorService:
     """Service for US Drought Monitor data.
 
@@ -85,6 +126,10 @@ class DroughtMonitorService:
 
     BASE_URL = "https://usdmdataservices.unl.edu/api/CountyStatistics"
 
+    def __init__(self):
+        """Initialize drought service with an empty per-date cache."""
+        self._drought_cache: dict[date, DroughtContext] = {}
+
     async def get_drought_status(self, target_date: Optional[date] = None) -> DroughtContext:
         """Get current drought status for Essex County.
 
@@ -98,63 +143,91 @@ class DroughtMonitorService:
             # USDM updates weekly on Thursdays; get most recent
             target_date = date.today()
 
-        # Format date as YYYY-MM-DD
-        date_str = target_date.strftime("%Y-%m-%d")
+        if target_date in self._drought_cache:
+            return self._drought_cache[target_date]
+
+        results = await self.get_drought_range(target_date, target_date)
+        if not results:
+            return DroughtContext()
+
+        # USDM keys records by weekly map date; use the latest one returned
+        context = results[max(results)]
+        self._remember(target_date, context)
+        return context
+
+    async def get_drought_range(self, start: date, end: date) -> dict[date, DroughtContext]:
+        """Get drought status for every weekly map between two dates.
+
+        USDM accepts a date range, so a single request covers any number
+        of weeks instead of one call per date.
+
+        Args:
+            start: First date of the range (inclusive)
+            end: Last date of the range (inclusive)
 
+        Returns:
+            Mapping of USDM map date to DroughtContext, empty on error
+        """
         try:
             async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
                 response = await client.get(
                     f"{self.BASE_URL}/GetDroughtSeverityStatisticsByAreaPercent",
                     params={
                         "aoi": ESSEX_COUNTY_FIPS,
-                        "startdate": date_str,
-                        "enddate": date_str,
+                        "startdate": start.strftime("%Y-%m-%d"),
+                        "enddate": end.strftime("%Y-%m-%d"),
                         "statisticsType": "1",
                     },
                 )
                 response.raise_for_status()
                 data = response.json()
 
-                if not data:
-                    return DroughtContext()
-
-                # Parse the response - find the highest severity with coverage
-                latest = data[-1] if isinstance(data, list) else data
-
-                # Check severity levels from worst to best
-                for level in ["D4", "D3", "D2", "D1", "D0"]:
-                    pct = latest.get(level, 0)
-                    if pct and float(pct) > 0:
-                        severity, name, desc = DROUGHT_LEVELS[level]
-                        return DroughtContext(
-                            severity=severity,
-                            severity_name=name,
-                            percent_area_affected=float(pct),
-                            description=f"{name}: {desc}. {pct:.1f}% of Essex County affected.",
-                        )
-
-                return DroughtContext()
-
         except httpx.TimeoutException:
             logger.warning("Drought Monitor request timed out")
-            return DroughtContext()
+            return {}
         except httpx.HTTPStatusError as e:
             logger.warning(f"Drought Monitor HTTP error: {e.response.status_code}")
-            return DroughtContext()
+            return {}
         except Exception as e:
             logger.error(f"Drought Monitor unexpected error: {e}")
-            return DroughtContext()
+            return {}
+
+        if not data:
+            return {}
+
+        records = data if isinstance(data, list) else [data]
+        results = {}
+        for record in records:
+            map_date = _parse_map_date(record.get("MapDate")) or end
+            context = _parse_drought_record(record)
+            results[map_date] = context
+            self._remember(map_date, context)
+
+        return results
+
+    def _remember(self, key: date, context: DroughtContext) -> None:
+        """Cache a drought context, evicting the oldest entries past the cap."""
+        self._drought_cache.pop(key, None)
+        self._drought_cache[key] = context
+        while len(self._drought_cache) > DROUGHT_CACHE_MAX_ENTRIES:
+            del self._drought_cache[next(iter(self._drought_cache))]
 
     def format_for_story(self, context: DroughtContext) -> str:
         """Format drought info for story context."""
-        if context.severity == "none":
-            return ""
+        return _format_drought(context)
+
+
+@functools.lru_cache(maxsize=256)
+def _format_drought(context: DroughtContext) -> str:
+    """Format drought info for story context."""
+    if context.severity == "none":
+        return ""
 
-        lines = ["## Drought Conditions (US Drought Monitor)"]
-        lines.append(f"- {context.severity_name}")
-        lines.append(f"- {context.description}")
+    lines = ["## Drought Conditions (US Drought Monitor)"]
+    lines.append(f"- {context.severity_name}")
+    lines.append(f"- {context.description}")
 
-        return "\n".join(lines)
+    return "\n".join(lines)
 
 
 class SnowCoverService:
@@ -247,15 +320,21 @@ class SnowCoverService:
 
     def format_for_story(self, context: SnowCoverContext) -> str:
         """Format snow cover info for story context."""
-        if context.coverage == "none":
-            return ""
+        return _format_snow_cover(context)
 
-        lines = ["## Snow Cover (NOAA SNODAS)"]
-        lines.append(f"- {context.description}")
-        if context.water_equivalent_inches:
-            lines.append(f"- Snow water equivalent: {context.water_equivalent_inches:.1f} inches")
 
-        return "\n".join(lines)
+@functools.lru_cache(maxsize=256)
+def _format_snow_cover(context: SnowCoverContext) -> str:
+    """Format snow cover info for story context."""
+    if context.coverage == "none":
+        return ""
+
+    lines = ["## Snow Cover (NOAA SNODAS)"]
+    lines.append(f"- {context.description}")
+    if context.water_equivalent_inches:
+        lines.append(f"- Snow water equivalent: {context.water_equivalent_inches:.1f} inches")
+
+    return "\n".join(lines)
 
 
 class NDVIService:
@@ -302,7 +381,7 @@ class NDVIService:
         if target_date is None:
             target_date = date.today()
 
-        season = get_season(datetime.combine(target_date, datetime.min.time()))
+        season = _MONTH_TO_SEASON[target_date.month]
         base_min, base_max, status, note = self.SEASONAL_NDVI[season]
 
         # Apply monthly adjustment
@@ -338,14 +417,20 @@ class NDVIService:
 
     def format_for_story(self, context: VegetationContext) -> str:
         """Format vegetation info for story context."""
-        lines = ["## Vegetation Status (NDVI estimate)"]
-        lines.append(f"- Status: {context.status.replace('_', ' ').title()}")
-        if context.ndvi_value:
-            lines.append(f"- NDVI: {context.ndvi_value:.2f}")
-        if context.seasonal_note:
-            lines.append(f"- {context.seasonal_note}")
+        return _format_vegetation(context)
+
 
-        return "\n".join(lines)
+@functools.lru_cache(maxsize=256)
+def _format_vegetation(context: VegetationContext) -> str:
+    """Format vegetation info for story context."""
+    lines = ["## Vegetation Status (NDVI estimate)"]
+    lines.append(f"- Status: {context.status.replace('_', ' ').title()}")
+    if context.ndvi_value:
+        lines.append(f"- NDVI: {context.ndvi_value:.2f}")
+    if context.seasonal_note:
+        lines.append(f"- {context.seasonal_note}")
+
+    return "\n".join(lines)
 
 
 class CoastalErosionService:
@@ -386,10 +471,10 @@ class CoastalErosionService:
         Returns:
             CoastalErosionContext with erosion information
         """
-        high_risk = [
+        high_risk = tuple(
             area for area, data in self.EROSION_HOTSPOTS.items()
             if data["status"] == "eroding"
-        ]
+        )
 
         # Determine overall status
         if high_risk:
@@ -407,19 +492,25 @@ class CoastalErosionService:
 
     def format_for_story(self, context: CoastalErosionContext) -> str:
         """Format coastal erosion info for story context."""
-        if context.status == "stable" and not context.high_risk_areas:
-            return ""
-
-        lines = ["## Coastal Change (MA CZM)"]
-        if context.high_risk_areas:
-            lines.append(f"- Areas with active erosion: {', '.join(context.high_risk_areas)}")
-        if context.recent_changes:
-            lines.append(f"- {context.recent_changes}")
-
-        # Add specific notes for key areas
-        for area in context.high_risk_areas:
-            if area in self.EROSION_HOTSPOTS:
-                info = self.EROSION_HOTSPOTS[area]
-                lines.append(f"- {area}: {info['notes']}")
-
-        return "\n".join(lines)
+        return _format_coastal_erosion(context)
+
+
+@functools.lru_cache(maxsize=256)
+def _format_coastal_erosion(context: CoastalErosionContext) -> str:
+    """Format coastal erosion info for story context."""
+    if context.status == "stable" and not context.high_risk_areas:
+        return ""
+
+    lines = ["## Coastal Change (MA CZM)"]
+    if context.high_risk_areas:
+        lines.append(f"- Areas with active erosion: {', '.join(context.high_risk_areas)}")
+    if context.recent_changes:
+        lines.append(f"- {context.recent_changes}")
+
+    # Add specific notes for key areas
+    for area in context.high_risk_areas:
+        if area in CoastalErosionService.EROSION_HOTSPOTS:
+            info = CoastalErosionService.EROSION_HOTSPOTS[area]
+            lines.append(f"- {area}: {info['notes']}")
+
+    return "\n".join(lines)
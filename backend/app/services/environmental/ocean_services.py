@@ -7,8 +7,11 @@ This module provides:
 - HABForecastService: Harmful algal bloom status
 """
 
+import bisect
+import functools
 import logging
 import math
+import statistics
 from dataclasses import dataclass
 from datetime import datetime, date, timedelta
 from typing import Optional
@@ -21,6 +24,11 @@ from app.services.environmental.base import (
     IPSWICH_LON,
     IPSWICH_BBOX,
     DEFAULT_TIMEOUT,
+    async_ttl_cache,
+    fetch_limited_text,
+    get_http_client,
+    parse_griddap_csv,
+    persistent_daily_cache,
     kelvin_to_fahrenheit,
     celsius_to_fahrenheit,
     meters_to_feet,
@@ -31,24 +39,47 @@ from app.services.environmental.base import (
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SeaSurfaceTempContext:
     """Sea surface temperature for story generation."""
     temp_fahrenheit: Optional[float] = None
     temp_celsius: Optional[float] = None
     anomaly: Optional[str] = None  # "warmer", "cooler", "normal"
-    description: str = "Sea surface temperature data unavailable"
+    anomaly_degrees: Optional[float] = None  # °F relative to the monthly normal
 
+    @property
+    def description(self) -> str:
+        """Human-readable summary, built only when needed."""
+        if self.temp_fahrenheit is None:
+            return "Sea surface temperature data unavailable"
 
-@dataclass
+        if self.anomaly == "warmer":
+            anomaly_desc = f"{abs(self.anomaly_degrees):.1f}°F above normal"
+        elif self.anomaly == "cooler":
+            anomaly_desc = f"{abs(self.anomaly_degrees):.1f}°F below normal"
+        else:
+            anomaly_desc = "near normal"
+        return f"Sea surface temperature: {self.temp_fahrenheit:.1f}°F ({anomaly_desc})"
+
+
+@dataclass(slots=True, frozen=True)
 class OceanColorContext:
     """Ocean color/chlorophyll for story generation."""
     chlorophyll_mg_m3: Optional[float] = None
     bloom_status: str = "normal"  # "normal", "elevated", "bloom"
-    description: str = "Ocean color data unavailable"
+    seasonal_note: Optional[str] = None  # set when this is a seasonal estimate
+
+    @property
+    def description(self) -> str:
+        """Human-readable summary, built only when needed."""
+        if self.seasonal_note is not None:
+            return f"{self.seasonal_note} (seasonal estimate)"
+        if self.chlorophyll_mg_m3 is None:
+            return "Ocean color data unavailable"
+        return _CHLOR_TEMPLATES[self.bloom_status].format(self.chlorophyll_mg_m3)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WaveContext:
     """Wave conditions for story generation."""
     significant_height_ft: Optional[float] = None
@@ -56,10 +87,22 @@ class WaveContext:
     direction: Optional[str] = None  # compass direction
     direction_degrees: Optional[float] = None
     energy_description: str = "calm"  # "calm", "light", "moderate", "rough", "high"
-    description: str = "Wave data unavailable"
+
+    @property
+    def description(self) -> str:
+        """Human-readable summary, built only when needed."""
+        if self.significant_height_ft is None:
+            return "Wave data unavailable"
+
+        desc_parts = [f"{_WAVE_LABELS[self.energy_description]} ({self.significant_height_ft:.1f} ft)"]
+        if self.peak_period_seconds:
+            desc_parts.append(f"{self.peak_period_seconds:.0f}s period")
+        if self.direction:
+            desc_parts.append(f"from {self.direction}")
+        return " - ".join(desc_parts)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HABContext:
     """Harmful algal bloom status for story generation."""
     status: str = "none"  # "none", "watch", "warning", "advisory", "closure"
@@ -74,6 +117,15 @@ MONTHLY_SST_NORMALS = {
     7: 66, 8: 68, 9: 64, 10: 56, 11: 48, 12: 42
 }
 
+# MONTHLY_SST_NORMALS indexed directly by month number (index 0 unused)
+_SST_NORMALS_BY_MONTH = (None,) + tuple(MONTHLY_SST_NORMALS[m] for m in range(1, 13))
+
+# Cache lifetimes, matched to each source's update cadence
+SST_CACHE_TTL = 6 * 3600  # MUR SST is a daily product
+OCEAN_COLOR_CACHE_TTL = 6 * 3600  # Daily chlorophyll composite
+WAVE_CACHE_TTL = 3600  # WaveWatch III runs every 3 hours
+HAB_CACHE_TTL = 24 * 3600  # Advisories change slowly
+
 # Chlorophyll thresholds (mg/m³)
 CHLOROPHYLL_THRESHOLDS = {
     "low": 0.5,
@@ -82,6 +134,27 @@ CHLOROPHYLL_THRESHOLDS = {
     "bloom": 10.0,
 }
 
+# Bloom classification: upper edges (exclusive) and (status, description template)
+# per band, looked up with bisect
+_CHLOR_EDGES = (CHLOROPHYLL_THRESHOLDS["normal"], CHLOROPHYLL_THRESHOLDS["elevated"])
+_CHLOR_CLASSES = (
+    ("normal", "Normal ocean color (chlorophyll: {:.2f} mg/m³)"),
+    ("elevated", "Elevated chlorophyll ({:.2f} mg/m³) - increased phytoplankton"),
+    ("bloom", "Phytoplankton bloom detected ({:.2f} mg/m³)"),
+)
+_CHLOR_TEMPLATES = dict(_CHLOR_CLASSES)
+
+# Wave energy classification by significant height in feet
+_WAVE_EDGES = (1, 3, 6, 10)
+_WAVE_CLASSES = (
+    ("calm", "Calm seas"),
+    ("light", "Light chop"),
+    ("moderate", "Moderate swells"),
+    ("rough", "Rough seas"),
+    ("high", "High seas"),
+)
+_WAVE_LABELS = dict(_WAVE_CLASSES)
+
 
 class SeaSurfaceTempService:
     """Service for sea surface temperature from NOAA CoastWatch.
@@ -93,13 +166,24 @@ class SeaSurfaceTempService:
     DATASET_ID = "jplMURSST41"
     VARIABLE = "analysed_sst"
 
-    def __init__(self):
-        """Initialize SST service with ERDDAP client."""
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        """Initialize SST service with ERDDAP client.
+
+        Args:
+            client: Optional HTTP client. Defaults to the shared pooled client.
+        """
         self.erddap = ERDDAPClient(
             base_url="https://coastwatch.pfeg.noaa.gov/erddap",
-            timeout=20.0
+            timeout=20.0,
+            client=client,
         )
 
+    @async_ttl_cache(SST_CACHE_TTL, cache_if=lambda ctx: ctx.temp_fahrenheit is not None)
+    @persistent_daily_cache(
+        SST_CACHE_TTL,
+        SeaSurfaceTempContext,
+        cache_if=lambda ctx: ctx.temp_fahrenheit is not None,
+    )
     async def get_sst(self) -> SeaSurfaceTempContext:
         """Get current sea surface temperature for Ipswich Bay area.
 
@@ -123,42 +207,63 @@ class SeaSurfaceTempService:
             sst_fahrenheit = celsius_to_fahrenheit(sst_celsius)
 
             # Determine anomaly relative to climatology
-            month = datetime.now().month
-            normal_temp = MONTHLY_SST_NORMALS.get(month, 50)
+            normal_temp = _SST_NORMALS_BY_MONTH[datetime.now().month]
             diff = sst_fahrenheit - normal_temp
 
             if diff > 3:
                 anomaly = "warmer"
-                anomaly_desc = f"{abs(diff):.1f}°F above normal"
             elif diff < -3:
                 anomaly = "cooler"
-                anomaly_desc = f"{abs(diff):.1f}°F below normal"
             else:
                 anomaly = "normal"
-                anomaly_desc = "near normal"
-
-            description = f"Sea surface temperature: {sst_fahrenheit:.1f}°F ({anomaly_desc})"
 
             return SeaSurfaceTempContext(
                 temp_fahrenheit=round(sst_fahrenheit, 1),
                 temp_celsius=round(sst_celsius, 1),
                 anomaly=anomaly,
-                description=description,
+                anomaly_degrees=round(diff, 1),
             )
 
         except Exception as e:
             logger.error(f"SST service error: {e}")
             return SeaSurfaceTempContext()
 
+    async def get_many_locations(
+        self, points: list[tuple[float, float]]
+    ) -> dict[tuple[float, float], Optional[float]]:
+        """Get current SST at several points with a single ERDDAP request.
+
+        Args:
+            points: (lat, lon) pairs, e.g. inner harbor and outer bay
+
+        Returns:
+            Mapping of each point to its SST in °F (None if unavailable)
+        """
+        values = await self.erddap.get_values_at(
+            dataset_id=self.DATASET_ID,
+            variable=self.VARIABLE,
+            points=points,
+        )
+        return {
+            point: round(celsius_to_fahrenheit(val), 1) if val is not None else None
+            for point, val in values.items()
+        }
+
     def format_for_story(self, context: SeaSurfaceTempContext) -> str:
         """Format SST info for story context."""
-        if context.temp_fahrenheit is None:
-            return ""
+        return _format_sst(context)
+
 
-        lines = ["## Sea Surface Temperature (NOAA MUR SST)"]
-        lines.append(f"- {context.description}")
+@functools.lru_cache(maxsize=256)
+def _format_sst(context: SeaSurfaceTempContext) -> str:
+    """Format SST info for story context."""
+    if context.temp_fahrenheit is None:
+        return ""
 
-        return "\n".join(lines)
+    lines = ["## Sea Surface Temperature (NOAA MUR SST)"]
+    lines.append(f"- {context.description}")
+
+    return "\n".join(lines)
 
 
 class OceanColorService:
@@ -171,11 +276,25 @@ class OceanColorService:
     DATASET_ID = "noaacwNPPN20S3ASCIDINEOFDaily"
     VARIABLE = "chlor_a"
 
-    def __init__(self):
-        """Initialize ocean color service with ERDDAP client."""
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        """Initialize ocean color service.
+
+        Args:
+            client: Optional HTTP client. Defaults to the shared pooled client.
+        """
         self.base_url = "https://coastwatch.noaa.gov/erddap"
         self.timeout = 20.0
-
+        self._client = client
+
+    @async_ttl_cache(
+        OCEAN_COLOR_CACHE_TTL,
+        cache_if=lambda ctx: ctx.seasonal_note is None,
+    )
+    @persistent_daily_cache(
+        OCEAN_COLOR_CACHE_TTL,
+        OceanColorContext,
+        cache_if=lambda ctx: ctx.seasonal_note is None,
+    )
     async def get_ocean_color(self) -> OceanColorContext:
         """Get current chlorophyll concentration for Ipswich Bay.
 
@@ -186,56 +305,31 @@ class OceanColorService:
             # Query ERDDAP directly with proper format
             # This dataset has altitude dimension at 0.0
             url = (
-                f"{self.base_url}/griddap/{self.DATASET_ID}.json?"
+                f"{self.base_url}/griddap/{self.DATASET_ID}.csv?"
                 f"{self.VARIABLE}[(last)][(0.0)]"
                 f"[({IPSWICH_LAT - 0.5}):({IPSWICH_LAT + 0.5})]"
                 f"[({IPSWICH_LON - 0.5}):({IPSWICH_LON + 0.5})]"
             )
 
-            async with httpx.AsyncClient(timeout=self.timeout, follow_redirects=True) as client:
-                response = await client.get(url)
-                response.raise_for_status()
-                data = response.json()
-
-            # Parse the response
-            table = data.get("table", {})
-            rows = table.get("rows", [])
-            column_names = table.get("columnNames", [])
-
-            if not rows or self.VARIABLE not in column_names:
-                return await self._get_fallback_estimate()
-
-            var_idx = column_names.index(self.VARIABLE)
+            client = self._client or get_http_client()
+            text = await fetch_limited_text(client, url, timeout=self.timeout)
+            data = parse_griddap_csv(text)
 
-            # Get valid (non-null) values
-            values = [row[var_idx] for row in rows if row[var_idx] is not None]
+            # Valid (non-NaN) values come straight from the variable's column
+            values = data.get(self.VARIABLE)
 
             if not values:
                 return await self._get_fallback_estimate()
 
             # Use median to avoid outliers
-            values.sort()
-            chlor_a = values[len(values) // 2]
-
-            if chlor_a is None:
-                # Try alternate dataset
-                return await self._get_fallback_estimate()
+            chlor_a = statistics.median_high(values)
 
             # Classify bloom status
-            if chlor_a < CHLOROPHYLL_THRESHOLDS["normal"]:
-                status = "normal"
-                description = f"Normal ocean color (chlorophyll: {chlor_a:.2f} mg/m³)"
-            elif chlor_a < CHLOROPHYLL_THRESHOLDS["elevated"]:
-                status = "elevated"
-                description = f"Elevated chlorophyll ({chlor_a:.2f} mg/m³) - increased phytoplankton"
-            else:
-                status = "bloom"
-                description = f"Phytoplankton bloom detected ({chlor_a:.2f} mg/m³)"
+            status, _ = _CHLOR_CLASSES[bisect.bisect_right(_CHLOR_EDGES, chlor_a)]
 
             return OceanColorContext(
                 chlorophyll_mg_m3=round(chlor_a, 2),
                 bloom_status=status,
-                description=description,
             )
 
         except Exception as e:
@@ -261,18 +355,47 @@ class OceanColorService:
         return OceanColorContext(
             chlorophyll_mg_m3=chlor,
             bloom_status=status,
-            description=f"{desc} (seasonal estimate)",
+            seasonal_note=desc,
         )
 
+    async def get_many_locations(
+        self, points: list[tuple[float, float]]
+    ) -> dict[tuple[float, float], Optional[float]]:
+        """Get current chlorophyll at several points with a single ERDDAP request.
+
+        Args:
+            points: (lat, lon) pairs, e.g. inner harbor and outer bay
+
+        Returns:
+            Mapping of each point to chlorophyll in mg/m³ (None if unavailable)
+        """
+        erddap = ERDDAPClient(base_url=self.base_url, timeout=self.timeout, client=self._client)
+        values = await erddap.get_values_at(
+            dataset_id=self.DATASET_ID,
+            variable=self.VARIABLE,
+            points=points,
+            altitude=0.0,
+        )
+        return {
+            point: round(val, 2) if val is not None else None
+            for point, val in values.items()
+        }
+
     def format_for_story(self, context: OceanColorContext) -> str:
         """Format ocean color info for story context."""
-        if context.bloom_status == "normal" and "unavailable" in context.description:
-            return ""
+        return _format_ocean_color(context)
+
+
+@functools.lru_cache(maxsize=256)
+def _format_ocean_color(context: OceanColorContext) -> str:
+    """Format ocean color info for story context."""
+    if context.chlorophyll_mg_m3 is None and context.seasonal_note is None:
+        return ""
 
-        lines = ["## Ocean Color (NOAA VIIRS)"]
-        lines.append(f"- {context.description}")
+    lines = ["## Ocean Color (NOAA VIIRS)"]
+    lines.append(f"- {context.description}")
 
-        return "\n".join(lines)
+    return "\n".join(lines)
 
 
 class WaveWatchService:
@@ -285,10 +408,15 @@ class WaveWatchService:
     # ERDDAP dataset for WaveWatch III global
     DATASET_ID = "NWW3_Global_Best"
 
-    def __init__(self):
-        """Initialize wave service."""
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        """Initialize wave service.
+
+        Args:
+            client: Optional HTTP client. Defaults to the shared pooled client.
+        """
         self.base_url = "https://coastwatch.pfeg.noaa.gov/erddap"
         self.timeout = 20.0
+        self._client = client
 
     def _lon_to_360(self, lon: float) -> float:
         """Convert longitude from -180/180 to 0-360 format."""
@@ -296,47 +424,53 @@ class WaveWatchService:
             return 360 + lon
         return lon
 
-    async def _query_variable(self, variable: str) -> Optional[float]:
-        """Query a single WaveWatch III variable."""
+    async def _query_variables(self, variables: list[str]) -> dict[str, Optional[float]]:
+        """Query several WaveWatch III variables in a single griddap request.
+
+        All variables share the same grid, so ERDDAP returns them as extra
+        columns of one table rather than as separate responses.
+
+        Returns:
+            Mapping of variable name to its area average (None if unavailable)
+        """
+        results: dict[str, Optional[float]] = {variable: None for variable in variables}
+
         # Convert Ipswich longitude to 0-360 format
         lon_360 = self._lon_to_360(IPSWICH_LON)  # -70.84 -> ~289.16
 
         # Build ERDDAP query with depth dimension at 0.0
-        url = (
-            f"{self.base_url}/griddap/{self.DATASET_ID}.json?"
-            f"{variable}[(last)][(0.0)]"
+        constraint = (
+            f"[(last)][(0.0)]"
             f"[({IPSWICH_LAT - 0.5}):({IPSWICH_LAT + 0.5})]"
             f"[({lon_360 - 0.5}):({lon_360 + 0.5})]"
         )
+        url = (
+            f"{self.base_url}/griddap/{self.DATASET_ID}.csv?"
+            + ",".join(f"{variable}{constraint}" for variable in variables)
+        )
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout, follow_redirects=True) as client:
-                response = await client.get(url)
-                response.raise_for_status()
-                data = response.json()
-
-            table = data.get("table", {})
-            rows = table.get("rows", [])
-            column_names = table.get("columnNames", [])
+            client = self._client or get_http_client()
+            text = await fetch_limited_text(client, url, timeout=self.timeout)
+            data = parse_griddap_csv(text)
 
-            if not rows or variable not in column_names:
-                return None
+            for variable in variables:
+                values = data.get(variable)
+                if values:
+                    # Average of values in the area
+                    results[variable] = statistics.fmean(values)
 
-            var_idx = column_names.index(variable)
-
-            # Get valid (non-null) values
-            values = [row[var_idx] for row in rows if row[var_idx] is not None]
-
-            if not values:
-                return None
+        except Exception as e:
+            logger.warning(f"WaveWatch query error for {', '.join(variables)}: {e}")
 
-            # Return average of values in the area
-            return sum(values) / len(values)
+        return results
 
-        except Exception as e:
-            logger.warning(f"WaveWatch query error for {variable}: {e}")
-            return None
+    async def _query_variable(self, variable: str) -> Optional[float]:
+        """Query a single WaveWatch III variable."""
+        results = await self._query_variables([variable])
+        return results[variable]
 
+    @async_ttl_cache(WAVE_CACHE_TTL, cache_if=lambda ctx: ctx.significant_height_ft is not None)
     async def get_wave_conditions(self) -> WaveContext:
         """Get current wave conditions for Ipswich Bay.
 
@@ -349,14 +483,11 @@ class WaveWatchService:
             # Tper = Peak period (seconds)
             # Tdir = Peak direction (degrees)
 
-            # Query for significant wave height
-            hs_meters = await self._query_variable("Thgt")
-
-            # Query for peak period
-            tp_seconds = await self._query_variable("Tper")
-
-            # Query for direction
-            dp_degrees = await self._query_variable("Tdir")
+            # All three share one grid, so fetch them in a single request
+            values = await self._query_variables(["Thgt", "Tper", "Tdir"])
+            hs_meters = values["Thgt"]
+            tp_seconds = values["Tper"]
+            dp_degrees = values["Tdir"]
 
             if hs_meters is None:
                 return WaveContext()
@@ -365,31 +496,10 @@ class WaveWatchService:
             hs_feet = meters_to_feet(hs_meters)
 
             # Convert direction to compass
-            direction = degrees_to_compass(dp_degrees) if dp_degrees else None
+            direction = degrees_to_compass(dp_degrees) if dp_degrees is not None else None
 
             # Classify wave energy
-            if hs_feet < 1:
-                energy = "calm"
-                energy_desc = "Calm seas"
-            elif hs_feet < 3:
-                energy = "light"
-                energy_desc = "Light chop"
-            elif hs_feet < 6:
-                energy = "moderate"
-                energy_desc = "Moderate swells"
-            elif hs_feet < 10:
-                energy = "rough"
-                energy_desc = "Rough seas"
-            else:
-                energy = "high"
-                energy_desc = "High seas"
-
-            # Build description
-            desc_parts = [f"{energy_desc} ({hs_feet:.1f} ft)"]
-            if tp_seconds:
-                desc_parts.append(f"{tp_seconds:.0f}s period")
-            if direction:
-                desc_parts.append(f"from {direction}")
+            energy, _ = _WAVE_CLASSES[bisect.bisect_right(_WAVE_EDGES, hs_feet)]
 
             return WaveContext(
                 significant_height_ft=round(hs_feet, 1),
@@ -397,7 +507,6 @@ class WaveWatchService:
                 direction=direction,
                 direction_degrees=dp_degrees,
                 energy_description=energy,
-                description=" - ".join(desc_parts),
             )
 
         except Exception as e:
@@ -406,13 +515,19 @@ class WaveWatchService:
 
     def format_for_story(self, context: WaveContext) -> str:
         """Format wave info for story context."""
-        if context.significant_height_ft is None:
-            return ""
+        return _format_waves(context)
+
+
+@functools.lru_cache(maxsize=256)
+def _format_waves(context: WaveContext) -> str:
+    """Format wave info for story context."""
+    if context.significant_height_ft is None:
+        return ""
 
-        lines = ["## Wave Conditions (NOAA WaveWatch III)"]
-        lines.append(f"- {context.description}")
+    lines = ["## Wave Conditions (NOAA WaveWatch III)"]
+    lines.append(f"- {context.description}")
 
-        return "\n".join(lines)
+    return "\n".join(lines)
 
 
 class HABForecastService:
@@ -424,7 +539,13 @@ class HABForecastService:
     """
 
     # HAB-prone months for Massachusetts (typically late summer/fall)
-    HAB_SEASON_MONTHS = [7, 8, 9, 10]
+    HAB_SEASON_MONTHS = frozenset({7, 8, 9, 10})
+
+    # Shared (immutable) result for the eight months outside HAB season
+    _OFF_SEASON_CTX = HABContext(
+        status="none",
+        description="Outside typical HAB season for Massachusetts waters",
+    )
 
     # Known HAB species in Massachusetts waters
     HAB_SPECIES = {
@@ -442,14 +563,14 @@ class HABForecastService:
         Returns:
             HABContext with bloom status and any advisories
         """
-        month = datetime.now().month
+        return await self._get_status_for_month(datetime.now().month)
 
+    @async_ttl_cache(HAB_CACHE_TTL)
+    async def _get_status_for_month(self, month: int) -> HABContext:
+        """Get HAB status for a month; the month is part of the cache key."""
         # Outside HAB season
         if month not in self.HAB_SEASON_MONTHS:
-            return HABContext(
-                status="none",
-                description="Outside typical HAB season for Massachusetts waters",
-            )
+            return self._OFF_SEASON_CTX
 
         # During HAB season, provide cautionary context
         # In a production system, this would scrape MA DMF or NOAA bulletins
@@ -481,13 +602,19 @@ class HABForecastService:
 
     def format_for_story(self, context: HABContext) -> str:
         """Format HAB info for story context."""
-        if context.status == "none":
-            return ""
+        return _format_hab(context)
+
+
+@functools.lru_cache(maxsize=256)
+def _format_hab(context: HABContext) -> str:
+    """Format HAB info for story context."""
+    if context.status == "none":
+        return ""
 
-        lines = ["## Harmful Algal Bloom Status"]
-        lines.append(f"- Status: {context.status.upper()}")
-        if context.species:
-            lines.append(f"- Species of concern: {context.species}")
-        lines.append(f"- {context.description}")
+    lines = ["## Harmful Algal Bloom Status"]
+    lines.append(f"- Status: {context.status.upper()}")
+    if context.species:
+        lines.append(f"- Species of concern: {context.species}")
+    lines.append(f"- {context.description}")
 
-        return "\n".join(lines)
+    return "\n".join(lines)
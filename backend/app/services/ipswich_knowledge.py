@@ -5,17 +5,167 @@ This module contains factual information about Ipswich geography, history,
 ecology, and culture to ground story generation in authentic detail.
 """
 
-from dataclasses import dataclass
-from typing import List, Dict
-
-
-@dataclass
+import difflib
+import functools
+import heapq
+import math
+import random
+import re
+import sys
+from array import array
+from dataclasses import dataclass, fields
+from datetime import date
+from enum import IntEnum
+from types import MappingProxyType
+from typing import Dict, Final, List, Mapping, Optional, Tuple
+
+
+def _one_line(text: str) -> str:
+    """Collapse the hard line breaks of a triple-quoted literal into single spaces."""
+    return " ".join(text.split())
+
+
+@dataclass(frozen=True, slots=True)
 class Location:
     """A notable location in Ipswich."""
     name: str
     description: str
     category: str  # 'natural', 'historic', 'neighborhood', 'waterway'
-    seasonal_notes: Dict[str, str]  # season -> observation
+    seasonal_notes: Mapping[str, str]  # season -> observation
+
+    def __post_init__(self):
+        # Read-only view so shared Location instances can't be altered
+        object.__setattr__(self, "seasonal_notes", MappingProxyType(self.seasonal_notes))
+        object.__setattr__(self, "description", _one_line(self.description))
+
+
+@dataclass(frozen=True, slots=True)
+class HistoricalFigure:
+    """A notable person from Ipswich history."""
+    name: str
+    dates: str
+    significance: str
+    story: str
+    location: Optional[str] = None
+    memorial: Optional[str] = None
+    work: Optional[str] = None
+    founded: Optional[str] = None
+    legacy: Optional[str] = None
+
+    def __post_init__(self):
+        object.__setattr__(self, "story", _one_line(self.story))
+
+
+@dataclass(frozen=True, slots=True)
+class Legend:
+    """A local legend or folk tale."""
+    name: str
+    type: str
+    story: str
+    location: Optional[str] = None
+    locations: Tuple[str, ...] = ()
+
+    def __post_init__(self):
+        object.__setattr__(self, "story", _one_line(self.story))
+
+
+@dataclass(frozen=True, slots=True)
+class Business:
+    """A local business or landmark."""
+    name: str
+    address: str
+    type: str
+    description: str
+    established: Optional[int | str] = None  # year, or a note like "Building from 1678"
+    seasonal_activities: Optional[Mapping[str, str]] = None
+
+    def __post_init__(self):
+        object.__setattr__(self, "description", _one_line(self.description))
+        if self.seasonal_activities is not None:
+            object.__setattr__(self, "seasonal_activities", MappingProxyType(self.seasonal_activities))
+
+
+@dataclass(frozen=True, slots=True)
+class School:
+    """A school in the Ipswich district."""
+    name: str
+    address: str
+    type: str
+    grades: str
+    description: str
+    mascot: Optional[str] = None
+
+    def __post_init__(self):
+        object.__setattr__(self, "description", _one_line(self.description))
+
+
+@dataclass(frozen=True, slots=True)
+class FirstPeriodHouse:
+    """A surviving First Period (pre-1725) house."""
+    name: str
+    address: str
+    built: int | str  # year, or a note like "c. 1690" / "1663-1750"
+    description: str
+
+    def __post_init__(self):
+        object.__setattr__(self, "description", _one_line(self.description))
+
+
+@dataclass(frozen=True, slots=True)
+class TrailOverview:
+    """Size, access and parking for a trail network."""
+    size: str
+    towns: Tuple[str, ...]
+    trail_miles: int
+    parking: Tuple[str, ...]
+    access: str
+
+
+@dataclass(frozen=True, slots=True)
+class StateForest:
+    """A state forest with its named areas and seasonal uses."""
+    overview: TrailOverview
+    areas: Mapping[str, Mapping[str, object]]  # area key -> details
+    habitat: str
+    seasonal_activities: Mapping[str, str]  # season -> activities
+
+    def __post_init__(self):
+        object.__setattr__(self, "areas", _freeze(self.areas))
+        object.__setattr__(self, "seasonal_activities", MappingProxyType(self.seasonal_activities))
+
+
+@dataclass(frozen=True, slots=True)
+class Bridge:
+    """A historic bridge."""
+    built: int
+    location: str
+    significance: str
+    specifications: Mapping[str, str]
+    named_for: str
+    legend: str
+    designations: Tuple[str, ...]
+    previous_bridges: str
+
+    def __post_init__(self):
+        object.__setattr__(self, "specifications", MappingProxyType(self.specifications))
+
+
+@dataclass(frozen=True, slots=True)
+class HistoricalFact:
+    """A short piece of Ipswich history."""
+    topic: str
+    content: str
+
+
+def _freeze(value):
+    """Recursively make a literal table read-only and unwrap multi-line strings."""
+    if isinstance(value, str):
+        return _one_line(value) if "\n" in value else value
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
 
 
 # =============================================================================
@@ -78,7 +228,7 @@ MARSH AREA: Jeffrey's Neck, Essex Road Corridor, Great Marsh
 # GEOGRAPHY - Neighborhoods and Areas
 # =============================================================================
 
-NEIGHBORHOODS = [
+NEIGHBORHOODS: Final[Tuple[Location, ...]] = (
     Location(
         name="Downtown Ipswich",
         description="The historic heart of town, centered on the intersection of "
@@ -230,13 +380,15 @@ NEIGHBORHOODS = [
             "winter": "The road is quiet, the antique shops keeping shorter hours."
         }
     ),
-]
+)
+
+NEIGHBORHOODS_BY_NAME: Dict[str, Location] = {loc.name: loc for loc in NEIGHBORHOODS}
 
 # =============================================================================
 # GEOGRAPHY - Natural Features
 # =============================================================================
 
-NATURAL_FEATURES = [
+NATURAL_FEATURES: Final[Tuple[Location, ...]] = (
     Location(
         name="Crane Beach",
         description="Over four miles of barrier beach with towering dunes, "
@@ -384,13 +536,25 @@ NATURAL_FEATURES = [
             "winter": "The island stands quiet, its paths empty of visitors."
         }
     ),
-]
+)
+
+NATURAL_FEATURES_BY_NAME: Dict[str, Location] = {loc.name: loc for loc in NATURAL_FEATURES}
+
+# Neighborhoods followed by natural features; row i here is row i of SEASONAL_NOTES
+ALL_LOCATIONS: Final[Tuple[Location, ...]] = NEIGHBORHOODS + NATURAL_FEATURES
+
+# Lowercased name -> location, for exact-match lookups. Derived strings built
+# at import (lowercased names, index tokens, season names) are interned so
+# equal strings across the lookup tables share one object.
+_LOCATIONS_BY_LOWER_NAME: Dict[str, Location] = {
+    sys.intern(loc.name.lower()): loc for loc in ALL_LOCATIONS
+}
 
 # =============================================================================
 # IPSWICH RIVER - Enhanced Ecological Data
 # =============================================================================
 
-IPSWICH_RIVER_ECOLOGY = {
+IPSWICH_RIVER_ECOLOGY: Final[Mapping[str, object]] = _freeze({
     "overview": {
         "length": "35-45 miles from Burlington/Wilmington headwaters to Ipswich Bay",
         "character": "Flows through town, under the Choate Bridge, then through salt marshes to the sea",
@@ -455,317 +619,344 @@ IPSWICH_RIVER_ECOLOGY = {
         "volunteer_counts": "Conducted since 1999",
         "historical_note": "Runs dramatically reduced due to dams; restoration ongoing",
     },
+})
+
+# Quantities from IPSWICH_RIVER_ECOLOGY as typed values, so comparisons and
+# logic don't have to re-parse the prose above
+IPSWICH_RIVER_NUMERIC = {
+    "length_min_miles": 35,
+    "length_max_miles": 45,
+    "peak_flow_cfs": 700,
+    "summer_flow_reduction_pct": 99,
+    "restoration_funding_usd": 2_500_000,
+    "volunteer_counts_since": 1999,
+    "herring_run_start_month": 3,
+    "herring_run_end_month": 6,
+    "herring_run_peak_months": (4, 5),
+    "striped_bass_max_length_in": 40,
 }
 
+# Spawning/run timing for IPSWICH_RIVER_ECOLOGY["fish_species"] as day-of-year
+# columns: (key, first day, last day, preferred flow)
+FISH_TIMING = (
+    ("alewife", 85, 135, "slow"),
+    ("blueback_herring", 145, 170, "fast"),
+    ("american_eel", 1, 366, "any"),
+    ("striped_bass", 120, 170, "tidal"),
+)
+FISH_KEYS: Tuple[str, ...] = tuple(key for key, _, _, _ in FISH_TIMING)
+FISH_DOY_START = array("h", (start for _, start, _, _ in FISH_TIMING))
+FISH_DOY_END = array("h", (end for _, _, end, _ in FISH_TIMING))
+
 # =============================================================================
 # HISTORICAL FIGURES - Deep biographical knowledge
 # =============================================================================
 
-HISTORICAL_FIGURES = {
-    "jenny_slew": {
-        "name": "Jenny Slew",
-        "dates": "c. 1719 - after 1765",
-        "significance": "First enslaved person in Massachusetts to win freedom through jury trial",
-        "story": """In January 1762, Jenny Slew—a free woman born to a white mother—was
+HISTORICAL_FIGURES: Final[Mapping[str, HistoricalFigure]] = MappingProxyType({
+    "jenny_slew": HistoricalFigure(
+        name="Jenny Slew",
+        dates="c. 1719 - after 1765",
+        significance="First enslaved person in Massachusetts to win freedom through jury trial",
+        story="""In January 1762, Jenny Slew—a free woman born to a white mother—was
 kidnapped from her Ipswich home and illegally enslaved by John Whipple Jr. She fought back
 through the courts. In November 1766, before an all-white male jury in Salem, she won her
 freedom. Judge Oliver declared: 'This is a contest between liberty and property—both of
 great consequence, but liberty of most importance of the two.' John Adams attended the
 trial and took notes. Her victory inspired subsequent freedom suits that helped end
 slavery in Massachusetts.""",
-        "memorial": "Depicted on the EBSCO Riverwalk Mural receiving payment from Whipple",
-    },
-    "masconomet": {
-        "name": "Masconomet (Sagamore of the Agawam)",
-        "dates": "Unknown - March 6, 1658",
-        "significance": "Last great leader of the Agawam people",
-        "story": """Masconomet—whose Pawtucket name meant 'He who vanquished a black bear'—led
+        memorial="Depicted on the EBSCO Riverwalk Mural receiving payment from Whipple",
+    ),
+    "masconomet": HistoricalFigure(
+        name="Masconomet (Sagamore of the Agawam)",
+        dates="Unknown - March 6, 1658",
+        significance="Last great leader of the Agawam people",
+        story="""Masconomet—whose Pawtucket name meant 'He who vanquished a black bear'—led
 the Agawam people when English colonists arrived. His tribe had been decimated by plague,
 losing 90% of their population. Fearing attacks from the Abenaki, he invited the English
 to settle on tribal lands for mutual protection, selling land to John Winthrop Jr. for £20.
 He spent winters at Wamesit (modern Lowell) and summers at Agawam. He died in 1658 and was
 buried on Sagamore Hill with his gun and tomahawk. A stone monument now marks his grave.""",
-        "location": "Sagamore Hill (now Hamilton)",
-    },
-    "anne_bradstreet": {
-        "name": "Anne Bradstreet",
-        "dates": "March 8, 1612 - September 16, 1672",
-        "significance": "First published poet in England's North American colonies",
-        "story": """Anne Bradstreet arrived in Salem aboard the Arbella in 1630, eventually
+        location="Sagamore Hill (now Hamilton)",
+    ),
+    "anne_bradstreet": HistoricalFigure(
+        name="Anne Bradstreet",
+        dates="March 8, 1612 - September 16, 1672",
+        significance="First published poet in England's North American colonies",
+        story="""Anne Bradstreet arrived in Salem aboard the Arbella in 1630, eventually
 settling in Ipswich in the late 1630s with her husband Simon (later governor of Massachusetts).
 Here, despite demanding domestic responsibilities and frontier hardships, she began writing
 poetry in earnest. The town's educated residents—with their large libraries and love of the
 written word—nurtured her talent. She knew John Winthrop Jr. and Nathaniel Ward. A bronze
 plaque marks the site of her Ipswich home. Her husband became governor of Massachusetts.""",
-        "location": "Downtown Ipswich (plaque marks home site)",
-    },
-    "arthur_wesley_dow": {
-        "name": "Arthur Wesley Dow",
-        "dates": "1857-1922",
-        "significance": "Influential artist and educator who shaped American modernism",
-        "story": """Born in Ipswich, Dow found endless inspiration in the flat coastal landscape
+        location="Downtown Ipswich (plaque marks home site)",
+    ),
+    "arthur_wesley_dow": HistoricalFigure(
+        name="Arthur Wesley Dow",
+        dates="1857-1922",
+        significance="Influential artist and educator who shaped American modernism",
+        story="""Born in Ipswich, Dow found endless inspiration in the flat coastal landscape
 and subtly shifting light of the marshes. After studying in Paris and discovering Japanese
 woodblock prints at the Boston Public Library, he remarked: 'One evening with Hokusai gave me
 more light on composition and decorative effect than years of study of pictures.' He founded
 the Ipswich Summer School of Art and later headed Columbia's art department. His students
 included Georgia O'Keeffe and Charles Sheeler. The Ipswich Museum holds the largest
 collection of his works.""",
-        "location": "Ipswich Museum holds the Dow Collection",
-    },
-    "nathaniel_ward": {
-        "name": "Nathaniel Ward",
-        "dates": "c. 1578-1652",
-        "significance": "Author of Massachusetts' first code of laws",
-        "story": """A Cambridge-educated lawyer who became a Puritan minister, Ward was relieved
+        location="Ipswich Museum holds the Dow Collection",
+    ),
+    "nathaniel_ward": HistoricalFigure(
+        name="Nathaniel Ward",
+        dates="c. 1578-1652",
+        significance="Author of Massachusetts' first code of laws",
+        story="""A Cambridge-educated lawyer who became a Puritan minister, Ward was relieved
 of his church duties in England for his beliefs. He immigrated in 1634 and served as Ipswich's
 minister. His legal background led the General Court to select him to write 'The Body of
 Liberties'—the first code of laws for the colonies. In 1647, he published 'The Simple Cobbler
 of Aggawam' under a pseudonym, a satiric essay attacking religious tolerance and modes of
 fashion. He returned to England and died there in 1652.""",
-        "work": "The Body of Liberties (1641), The Simple Cobbler of Aggawam (1647)",
-    },
-    "john_winthrop_jr": {
-        "name": "John Winthrop Jr.",
-        "dates": "February 12, 1606 - April 6, 1676",
-        "significance": "Founder of Ipswich, Fellow of the Royal Society",
-        "story": """The son of Massachusetts' first governor arrived with 12 men in March 1633
+        work="The Body of Liberties (1641), The Simple Cobbler of Aggawam (1647)",
+    ),
+    "john_winthrop_jr": HistoricalFigure(
+        name="John Winthrop Jr.",
+        dates="February 12, 1606 - April 6, 1676",
+        significance="Founder of Ipswich, Fellow of the Royal Society",
+        story="""The son of Massachusetts' first governor arrived with 12 men in March 1633
 to establish Agawam (later Ipswich). Sagamore Masconomet signed over the land for £20 and a
 promise of protection from the Abenaki. Winthrop's wife Martha died here with their infant—
 the first settlers buried in Ipswich. He later moved to Connecticut, becoming governor, and
 obtained its royal charter. A physician, alchemist, and scientist, he was elected to the
 Royal Society in 1663—bringing international scientific credibility to the colonies.""",
-        "founded": "Ipswich (1633), Saybrook (1635), New London (1646)",
-    },
-    "reverend_john_wise": {
-        "name": "Reverend John Wise",
-        "dates": "1652-1725",
-        "significance": "Early advocate for taxation with representation",
-        "story": """In 1687, Wise led Ipswich citizens in protesting a tax imposed by Governor
+        founded="Ipswich (1633), Saybrook (1635), New London (1646)",
+    ),
+    "reverend_john_wise": HistoricalFigure(
+        name="Reverend John Wise",
+        dates="1652-1725",
+        significance="Early advocate for taxation with representation",
+        story="""In 1687, Wise led Ipswich citizens in protesting a tax imposed by Governor
 Edmund Andros, arguing that as Englishmen, taxation without representation was unacceptable.
 He was jailed for his defiance. When Andros was recalled to England, new sovereigns William
 and Mary issued a new charter. Wise's writings later influenced the Declaration of
 Independence. His rebellion earned Ipswich the title 'Birthplace of American Independence.'""",
-        "legacy": "Ipswich called 'Birthplace of American Independence'",
-    },
-}
+        legacy="Ipswich called 'Birthplace of American Independence'",
+    ),
+})
 
 # =============================================================================
 # LOCAL LEGENDS AND FOLKLORE
 # =============================================================================
 
-LOCAL_LEGENDS = {
-    "harry_maine": {
-        "name": "The Ghost of Harry Maine",
-        "type": "Ghost legend",
-        "story": """Harry Maine was a mooncusser—a land pirate who used false lights to lure
+LOCAL_LEGENDS: Final[Mapping[str, Legend]] = MappingProxyType({
+    "harry_maine": Legend(
+        name="The Ghost of Harry Maine",
+        type="Ghost legend",
+        story="""Harry Maine was a mooncusser—a land pirate who used false lights to lure
 ships onto the rocks, then plundered the wrecks. Legend says he was chained to Ipswich Bar
 as punishment, forced to shovel sand for eternity. During storms, locals say 'The Devil is
 raising Old Harry.' His ghost still wanders the Plum Island dunes on stormy nights. One tale
 tells of a man who dreamed of Harry's buried treasure three nights running—when he dug at
 the spot, an army of black cats with eyes of fire appeared, and icy water filled the hole.
 He escaped with only an iron bar, later fashioned into a door latch still in use in Ipswich.""",
-        "locations": ["Ipswich Bar", "Plum Island dunes"],
-    },
-    "devils_footprint": {
-        "name": "The Devil's Footprint",
-        "type": "Religious legend",
-        "story": """On the rocks at First Church on Meetinghouse Green, a faded mark is said
+        locations=("Ipswich Bar", "Plum Island dunes"),
+    ),
+    "devils_footprint": Legend(
+        name="The Devil's Footprint",
+        type="Religious legend",
+        story="""On the rocks at First Church on Meetinghouse Green, a faded mark is said
 to be the Devil's footprint. During the Great Awakening, the preacher George Whitefield
 wrestled with the Devil outside the church. When the Devil fled, he jumped down onto the
 rocks, leaving his footprint—still visible today beneath a spray-painted circle.""",
-        "location": "First Church, Meetinghouse Green",
-    },
-    "elizabeth_howe": {
-        "name": "The Witch of Linebrook",
-        "type": "Historical tragedy",
-        "story": """Elizabeth Howe was a successful farmer's wife who lived in outer Linebrook.
+        location="First Church, Meetinghouse Green",
+    ),
+    "elizabeth_howe": Legend(
+        name="The Witch of Linebrook",
+        type="Historical tragedy",
+        story="""Elizabeth Howe was a successful farmer's wife who lived in outer Linebrook.
 In 1692, neighbors accused her of witchcraft after a decade of suspicions. Though 13 people
 spoke in her defense—describing her as honest, faithful, and fair—24 accused her. She
 declared her innocence to the end but was hanged on July 19, 1692, at Proctor's Ledge near
 Salem, alongside Rebecca Nurse and four others. The EBSCO Mural depicts her arrest on
 Linebrook Road.""",
-        "location": "Linebrook Road",
-    },
-    "rachel_clinton": {
-        "name": "The Survivor of Hog Island",
-        "type": "Historical account",
-        "story": """Rachel Clinton went from one of Ipswich's wealthiest families to a
+        location="Linebrook Road",
+    ),
+    "rachel_clinton": Legend(
+        name="The Survivor of Hog Island",
+        type="Historical account",
+        story="""Rachel Clinton went from one of Ipswich's wealthiest families to a
 'sullen beggar' by 1692. Suspected of witchcraft for years, she was arrested and held
 in iron fetters for nine months. Unlike Elizabeth Howe, she survived—released when an
 unknown person paid her jail fees. She lived out her days alone in a small hut on Hog
 Island (now Choate Island), dying around 1695 with nothing.""",
-        "location": "Choate Island (formerly Hog Island)",
-    },
-}
+        location="Choate Island (formerly Hog Island)",
+    ),
+})
 
 # =============================================================================
 # LOCAL BUSINESSES AND LANDMARKS
 # =============================================================================
 
-LOCAL_BUSINESSES = {
-    "clam_box": {
-        "name": "The Clam Box",
-        "address": "246 High Street",
-        "type": "Restaurant",
-        "established": 1935,
-        "description": """Built in 1935, the Clam Box is an iconic piece of roadside architecture—
+LOCAL_BUSINESSES: Final[Mapping[str, Business]] = MappingProxyType({
+    "clam_box": Business(
+        name="The Clam Box",
+        address="246 High Street",
+        type="Restaurant",
+        established=1935,
+        description="""Built in 1935, the Clam Box is an iconic piece of roadside architecture—
 a tall, trapezoidal building designed to look like a giant fried clam takeout container with
 its flaps tipped open. Originally painted silver with red trim. On busy summer weekends,
 about 1,000 people dine here. Owned by the Aggelakis family since 1984. Celebrating its
 90th anniversary in 2025.""",
-    },
-    "zumis_coffee": {
-        "name": "Zumi's Coffee House",
-        "address": "2 Market Street",
-        "type": "Coffee shop",
-        "description": """A cozy downtown coffee house at the heart of Ipswich's Market Street,
+    ),
+    "zumis_coffee": Business(
+        name="Zumi's Coffee House",
+        address="2 Market Street",
+        type="Coffee shop",
+        description="""A cozy downtown coffee house at the heart of Ipswich's Market Street,
 serving specialty coffee, espresso drinks, pastries, and light fare. A popular gathering
 spot for locals before work and on weekend mornings.""",
-    },
-    "wolf_hill_garden_center": {
-        "name": "Wolf Hill Garden Center",
-        "address": "196 Linebrook Road",
-        "type": "Garden center",
-        "description": """Full-service garden center and nursery offering annuals, perennials,
+    ),
+    "wolf_hill_garden_center": Business(
+        name="Wolf Hill Garden Center",
+        address="196 Linebrook Road",
+        type="Garden center",
+        description="""Full-service garden center and nursery offering annuals, perennials,
 shrubs, trees, and gardening supplies. Popular spring destination for local gardeners
 preparing their beds.""",
-    },
-    "pomodori_pizzeria": {
-        "name": "Pomodori Pizzeria",
-        "address": "6 Central Street",
-        "type": "Restaurant",
-        "description": """Italian pizzeria in downtown Ipswich serving Neapolitan-style pizza,
+    ),
+    "pomodori_pizzeria": Business(
+        name="Pomodori Pizzeria",
+        address="6 Central Street",
+        type="Restaurant",
+        description="""Italian pizzeria in downtown Ipswich serving Neapolitan-style pizza,
 pasta, salads, and Italian specialties. A family-friendly spot in the heart of downtown.""",
-    },
-    "riverview_pizza": {
-        "name": "Riverview Pizza",
-        "address": "25 Hammatt Street",
-        "type": "Restaurant",
-        "description": """Local pizza shop near downtown serving pizza, subs, and Greek food.
+    ),
+    "riverview_pizza": Business(
+        name="Riverview Pizza",
+        address="25 Hammatt Street",
+        type="Restaurant",
+        description="""Local pizza shop near downtown serving pizza, subs, and Greek food.
 A casual, affordable spot popular with families and high school students.""",
-    },
-    "ticks_auto": {
-        "name": "Tick's Auto Shop",
-        "address": "61 Turnpike Road",
-        "type": "Auto repair",
-        "description": """Long-standing local auto repair shop serving Ipswich residents.
+    ),
+    "ticks_auto": Business(
+        name="Tick's Auto Shop",
+        address="61 Turnpike Road",
+        type="Auto repair",
+        description="""Long-standing local auto repair shop serving Ipswich residents.
 A trusted fixture in town for automotive service and repairs.""",
-    },
-    "1640_hart_house": {
-        "name": "1640 Hart House",
-        "address": "51 Linebrook Road",
-        "type": "Restaurant",
-        "established": "Building from 1678",
-        "description": """Fine dining in a historic 1670s farmhouse. The oldest parts date to
+    ),
+    "1640_hart_house": Business(
+        name="1640 Hart House",
+        address="51 Linebrook Road",
+        type="Restaurant",
+        established="Building from 1678",
+        description="""Fine dining in a historic 1670s farmhouse. The oldest parts date to
 1678-1680, built by Samuel Hart. Serves New American cuisine with fresh seafood, premium
 steaks, and famous lobster rolls and clam chowder.""",
-    },
-    "true_north_ale": {
-        "name": "True North Ale Company",
-        "address": "116 County Road",
-        "type": "Brewery",
-        "established": 2017,
-        "description": """15,000+ square foot brewery with taproom and patio. Voted Best
+    ),
+    "true_north_ale": Business(
+        name="True North Ale Company",
+        address="116 County Road",
+        type="Brewery",
+        established=2017,
+        description="""15,000+ square foot brewery with taproom and patio. Voted Best
 Brewery on North Shore for four consecutive years. BYOF (Bring Your Own Food) policy.
 Big Pig BBQ on patio Wednesday-Sunday.""",
-    },
-    "little_wolf_coffee": {
-        "name": "Little Wolf Coffee Roasters",
-        "address": "129 High Street",
-        "type": "Coffee shop",
-        "description": "Specialty micro-batch coffee roaster. Open Mon-Fri 7am-3pm, Sat-Sun 8am-3pm.",
-    },
-    "fox_creek_tavern": {
-        "name": "Fox Creek Tavern",
-        "address": "141 High Street",
-        "type": "Restaurant",
-        "description": """Artisan comfort food in an upscale environment with cozy fireplace
+    ),
+    "little_wolf_coffee": Business(
+        name="Little Wolf Coffee Roasters",
+        address="129 High Street",
+        type="Coffee shop",
+        description="Specialty micro-batch coffee roaster. Open Mon-Fri 7am-3pm, Sat-Sun 8am-3pm.",
+    ),
+    "fox_creek_tavern": Business(
+        name="Fox Creek Tavern",
+        address="141 High Street",
+        type="Restaurant",
+        description="""Artisan comfort food in an upscale environment with cozy fireplace
 and outdoor fire pit.""",
-    },
-    "russell_orchards": {
-        "name": "Russell Orchards",
-        "address": "143 Argilla Road",
-        "type": "Farm & Winery",
-        "established": 1920,
-        "description": """120-acre fruit and vegetable farm with retail store in an 1800s barn,
+    ),
+    "russell_orchards": Business(
+        name="Russell Orchards",
+        address="143 Argilla Road",
+        type="Farm & Winery",
+        established=1920,
+        description="""120-acre fruit and vegetable farm with retail store in an 1800s barn,
 scratch bakery, cider mill, winery with wine bar, and pick-your-own fields. Founded as
 Goodale Orchards when Dr. Joseph Goodale planted the first trees. Famous for homemade
 cider donuts from original family recipes. Wine bar serves 22 varieties produced on-site.""",
-        "seasonal_activities": {
+        seasonal_activities={
             "summer": "Pick-your-own strawberries, cherries, blueberries, raspberries",
             "fall": "Apple picking with hayrides, 'Make Your Own' apple pie events",
             "year_round": "Wine tastings, bakery, farm store",
         },
-    },
-    "marini_farm": {
-        "name": "Marini Farm",
-        "address": "259 Linebrook Road",
-        "type": "Farm",
-        "established": 1928,
-        "description": """Third-generation farm with greenhouses, farm stand, and seasonal
+    ),
+    "marini_farm": Business(
+        name="Marini Farm",
+        address="259 Linebrook Road",
+        type="Farm",
+        established=1928,
+        description="""Third-generation farm with greenhouses, farm stand, and seasonal
 activities. June: Strawberry Festival with 12 acres of strawberry production. Fall:
 10-acre maze park with 8-acre interactive corn maze, pumpkin patch, hayrides.
 Winter: Christmas trees and wreath decorating.""",
-    },
-    "wolf_hollow": {
-        "name": "Wolf Hollow",
-        "address": "114 Essex Road",
-        "type": "Wolf Sanctuary",
-        "established": 1988,
-        "description": """Non-profit wolf sanctuary founded by Paul C. Soffron. Home to eight
+    ),
+    "wolf_hollow": Business(
+        name="Wolf Hollow",
+        address="114 Essex Road",
+        type="Wolf Sanctuary",
+        established=1988,
+        description="""Non-profit wolf sanctuary founded by Paul C. Soffron. Home to eight
 animals: seven pure North American gray wolves and one wolf-dog hybrid. Offers educational
 tours on Saturdays and Sundays (reservations required), school field trips, photography
 sessions, and private tours. Mission: to change perceptions of wolves through education
 and exposure, dispelling myths and raising awareness of wolves' key role in ecosystems.""",
-    },
-}
+    ),
+})
 
 # =============================================================================
 # IPSWICH PUBLIC SCHOOLS
 # =============================================================================
 
-IPSWICH_SCHOOLS = {
-    "doyon_elementary": {
-        "name": "Paul F. Doyon Memorial School",
-        "address": "51 North Main Street",
-        "type": "Elementary School",
-        "grades": "Pre-K through 2",
-        "description": """Named after Paul F. Doyon, a longtime Ipswich educator. Serves the
+IPSWICH_SCHOOLS: Final[Mapping[str, School]] = MappingProxyType({
+    "doyon_elementary": School(
+        name="Paul F. Doyon Memorial School",
+        address="51 North Main Street",
+        type="Elementary School",
+        grades="Pre-K through 2",
+        description="""Named after Paul F. Doyon, a longtime Ipswich educator. Serves the
 youngest students in the district. Located near downtown on North Main Street.""",
-    },
-    "winthrop_elementary": {
-        "name": "Winthrop Elementary School",
-        "address": "201 High Street",
-        "type": "Elementary School",
-        "grades": "3 through 5",
-        "description": """Elementary school serving grades 3-5. Located on High Street in
+    ),
+    "winthrop_elementary": School(
+        name="Winthrop Elementary School",
+        address="201 High Street",
+        type="Elementary School",
+        grades="3 through 5",
+        description="""Elementary school serving grades 3-5. Located on High Street in
 the historic part of town. Named for the Winthrop family, early settlers of Massachusetts.""",
-    },
-    "ipswich_middle_school": {
-        "name": "Ipswich Middle School",
-        "address": "130 High Street",
-        "type": "Middle School",
-        "grades": "6 through 8",
-        "description": """Middle school serving the town's 6th through 8th graders. Part of
+    ),
+    "ipswich_middle_school": School(
+        name="Ipswich Middle School",
+        address="130 High Street",
+        type="Middle School",
+        grades="6 through 8",
+        description="""Middle school serving the town's 6th through 8th graders. Part of
 the High Street school campus alongside the elementary and high schools.""",
-    },
-    "ipswich_high_school": {
-        "name": "Ipswich High School",
-        "address": "134 High Street",
-        "type": "High School",
-        "grades": "9 through 12",
-        "mascot": "Tigers",
-        "description": """Home of the Ipswich Tigers. Competitive athletic programs, particularly
+    ),
+    "ipswich_high_school": School(
+        name="Ipswich High School",
+        address="134 High Street",
+        type="High School",
+        grades="9 through 12",
+        mascot="Tigers",
+        description="""Home of the Ipswich Tigers. Competitive athletic programs, particularly
 in wrestling, soccer, and cross country. Students graduate with strong connections to the
 community. The school's location on High Street makes it central to town life.""",
-    },
-}
+    ),
+})
 
 # =============================================================================
 # THE EBSCO MURAL
 # =============================================================================
 
-EBSCO_MURAL = {
+EBSCO_MURAL: Final[Mapping[str, object]] = _freeze({
     "year": 2005,
     "artist": "Alan Pearsall",
     "size": "2,700 square feet",
@@ -777,21 +968,21 @@ of damages after winning her freedom suit; and Richard Saltonstall, who built th
 first mill on this site and in 1645 denounced the kidnapping of two Africans as 'expressly
 contrary to the law of God and the law of the country.' Many local people modeled for the
 historical figures.""",
-}
+})
 
 # =============================================================================
 # WILLOWDALE STATE FOREST - Detailed Trail Information
 # =============================================================================
 
-WILLOWDALE_TRAILS = {
-    "overview": {
-        "size": "2,400 acres",
-        "towns": ["Hamilton", "Topsfield", "Boxford"],
-        "trail_miles": 40,
-        "parking": ["259 Linebrook Road (Ipswich)", "280 Ipswich Road (Topsfield)"],
-        "access": "Free, open sunrise to sunset year-round",
-    },
-    "areas": {
+WILLOWDALE_TRAILS: Final[StateForest] = StateForest(
+    overview=TrailOverview(
+        size="2,400 acres",
+        towns=("Hamilton", "Topsfield", "Boxford"),
+        trail_miles=40,
+        parking=("259 Linebrook Road (Ipswich)", "280 Ipswich Road (Topsfield)"),
+        access="Free, open sunrise to sunset year-round",
+    ),
+    areas={
         "pine_swamp": {
             "description": "Northern section with the best singletrack mountain biking trails",
             "character": "Mix of rolling, smooth, and rooted single and doubletrack with climbs, descents, and switchbacks",
@@ -799,7 +990,7 @@ WILLOWDALE_TRAILS = {
         },
         "hood_pond": {
             "size": "100 acres",
-            "activities": ["Canoeing", "Fishing"],
+            "activities": ("Canoeing", "Fishing"),
             "description": "Large pond in the western section where Ipswich, Boxford, and Topsfield meet",
             "trail": "Hood Pond Loop - 16.3 miles, moderately challenging, ~5.5 hours",
         },
@@ -810,228 +1001,228 @@ WILLOWDALE_TRAILS = {
             "connections": "Links Bradley Palmer State Park (south) with Cleveland Farm State Forest (west)",
         },
     },
-    "habitat": "Pine-oak-hickory upland, red maple swamp, hemlock stands, beaver marsh",
-    "seasonal_activities": {
+    habitat="Pine-oak-hickory upland, red maple swamp, hemlock stands, beaver marsh",
+    seasonal_activities={
         "spring": "Excellent birding for breeding birds, wildflower viewing",
         "summer": "Hiking, mountain biking, canoeing/kayaking on Hood Pond",
         "fall": "Peak foliage viewing, continued hiking/biking (mud season restrictions March 1-April 30)",
         "winter": "Cross-country skiing on 40 miles of trails, snowshoeing",
     },
-}
+)
 
 # =============================================================================
 # FIRST PERIOD HOUSES - Specific historic buildings
 # =============================================================================
 
-FIRST_PERIOD_HOUSES = [
-    {
-        "name": "Captain John Whipple House",
-        "address": "1 South Green / 53 South Main Street",
-        "built": 1677,
-        "description": """Built for Captain John Whipple, military officer and entrepreneur.
+FIRST_PERIOD_HOUSES: Final[Tuple[FirstPeriodHouse, ...]] = (
+    FirstPeriodHouse(
+        name="Captain John Whipple House",
+        address="1 South Green / 53 South Main Street",
+        built=1677,
+        description="""Built for Captain John Whipple, military officer and entrepreneur.
 Left half built 1677, expanded 1680-1690, enlarged 1710 with lean-tos. Originally on
 Saltonstall Street, moved over Choate Bridge in 1927. Now a museum, National Historic
 Landmark, filled with original architectural detail and early furniture.""",
-    },
-    {
-        "name": "Ross Tavern",
-        "address": "52 Jeffreys Neck Road",
-        "built": "c. 1690",
-        "description": """Built c. 1690 in downtown Ipswich, moved to current location in 1940.
+    ),
+    FirstPeriodHouse(
+        name="Ross Tavern",
+        address="52 Jeffreys Neck Road",
+        built="c. 1690",
+        description="""Built c. 1690 in downtown Ipswich, moved to current location in 1940.
 Features 17th-century fireplaces and 17th & 18th-century woodwork. The cyma molded
 overhanging girt and dentils represent Ipswich's 'distinctly elegant regional school'
 of architecture. Operated as an inn by Jeremiah Ross starting in 1809.""",
-    },
-    {
-        "name": "Thomas Lord House",
-        "address": "17 High Street",
-        "built": 1658,
-        "description": "Built by cordwainer Thomas Lord. One of the oldest houses on High Street.",
-    },
-    {
-        "name": "Philip Call House",
-        "address": "26 High Street",
-        "built": 1659,
-        "description": "Two-story timber-frame house built by cordwainer Philip Call.",
-    },
-    {
-        "name": "Thomas Dennis House",
-        "address": "7 County Street",
-        "built": "1663-1750",
-        "description": "Home of master joiner Thomas Dennis, known for his elaborate carved furniture.",
-    },
-    {
-        "name": "Hart House",
-        "address": "51 Linebrook Road",
-        "built": "1678-1680",
-        "description": "Oldest parts built 1678-1680 by Samuel Hart. Now the 1640 Hart House restaurant.",
-    },
-    {
-        "name": "Giddings-Burnham House",
-        "address": "43 Argilla Road",
-        "built": "c. 1640/1680",
-        "description": "Earliest section from mid-17th century by carpenter George Giddings.",
-    },
-]
+    ),
+    FirstPeriodHouse(
+        name="Thomas Lord House",
+        address="17 High Street",
+        built=1658,
+        description="Built by cordwainer Thomas Lord. One of the oldest houses on High Street.",
+    ),
+    FirstPeriodHouse(
+        name="Philip Call House",
+        address="26 High Street",
+        built=1659,
+        description="Two-story timber-frame house built by cordwainer Philip Call.",
+    ),
+    FirstPeriodHouse(
+        name="Thomas Dennis House",
+        address="7 County Street",
+        built="1663-1750",
+        description="Home of master joiner Thomas Dennis, known for his elaborate carved furniture.",
+    ),
+    FirstPeriodHouse(
+        name="Hart House",
+        address="51 Linebrook Road",
+        built="1678-1680",
+        description="Oldest parts built 1678-1680 by Samuel Hart. Now the 1640 Hart House restaurant.",
+    ),
+    FirstPeriodHouse(
+        name="Giddings-Burnham House",
+        address="43 Argilla Road",
+        built="c. 1640/1680",
+        description="Earliest section from mid-17th century by carpenter George Giddings.",
+    ),
+)
 
 # =============================================================================
 # CHOATE BRIDGE - Historic landmark details
 # =============================================================================
 
-CHOATE_BRIDGE = {
-    "built": 1764,
-    "location": "Route 1A/Route 133 (South Main Street) over Ipswich River",
-    "significance": "Oldest documented two-span masonry arch bridge in the United States",
-    "specifications": {
+CHOATE_BRIDGE: Final[Bridge] = Bridge(
+    built=1764,
+    location="Route 1A/Route 133 (South Main Street) over Ipswich River",
+    significance="Oldest documented two-span masonry arch bridge in the United States",
+    specifications={
         "total_length": "72 feet (22 m)",
         "arch_span": "30 feet 6 inches each",
         "material": "Roughly dressed granite",
         "original_width": "20 feet (1764)",
         "widened": "16 feet added in 1838 (single lane to two lanes)",
     },
-    "named_for": "Colonel John Choate, who supervised construction at no charge to the town",
-    "legend": "Colonel Choate was allegedly the first person to ride his horse over the bridge",
-    "designations": ["National Register of Historic Places (1972)", "National Historic Civil Engineering Landmark"],
-    "previous_bridges": "Timber bridges at this location since 1641, needing frequent repair",
-}
+    named_for="Colonel John Choate, who supervised construction at no charge to the town",
+    legend="Colonel Choate was allegedly the first person to ride his horse over the bridge",
+    designations=("National Register of Historic Places (1972)", "National Historic Civil Engineering Landmark"),
+    previous_bridges="Timber bridges at this location since 1641, needing frequent repair",
+)
 
 # =============================================================================
 # HISTORY - Expanded with research findings
 # =============================================================================
 
-HISTORICAL_FACTS = [
-    {
-        "topic": "Colonial Settlement",
-        "content": "Ipswich was settled in 1633 by John Winthrop the Younger, "
-                   "making it one of the oldest towns in Massachusetts. Named Agawam "
-                   "by the native Agawam people, the English renamed it for Ipswich, "
-                   "England. Within two decades, it was the second largest town in "
-                   "the Massachusetts Bay Colony."
-    },
-    {
-        "topic": "First Period Architecture",
-        "content": "Ipswich contains the greatest concentration of First Period "
-                   "(pre-1725) houses in North America. The Whipple House (c. 1655), "
-                   "the John Heard House (1795), and dozens of others preserve the "
-                   "building traditions of the first English settlers, with massive "
-                   "oak frames, steep rooflines, and central chimneys."
-    },
-    {
-        "topic": "The Choate Bridge",
-        "content": "Built in 1764, the Choate Bridge is the oldest double-arched "
-                   "stone bridge in America still in use. Its twin Roman arches of "
-                   "local granite have carried travelers across the Ipswich River "
-                   "for over 260 years, a testament to colonial engineering."
-    },
-    {
-        "topic": "Witchcraft Accusations",
-        "content": "In 1692, during the Salem witchcraft hysteria, several Ipswich "
-                   "residents were accused of witchcraft. The town's magistrates "
-                   "showed notable skepticism; no Ipswich resident was executed. "
-                   "The Reverend John Wise of Ipswich became an early voice against "
-                   "the trials' excesses."
-    },
-    {
-        "topic": "John Wise and Colonial Dissent",
-        "content": "The Reverend John Wise of Ipswich led the 1687 protest against "
-                   "Governor Andros's taxation without representation, anticipating "
-                   "the Revolution by nearly a century. Wise was briefly imprisoned "
-                   "for his defiance. His later writings influenced the Declaration "
-                   "of Independence."
-    },
-    {
-        "topic": "The Lace Industry",
-        "content": "From the 1820s through the early 1900s, Ipswich was a center "
-                   "of lace manufacturing in America. Mills along the river produced "
-                   "machine-made lace, employing hundreds of workers, many of them "
-                   "immigrant women. The industry shaped the town's economy and "
-                   "ethnic diversity for generations."
-    },
-    {
-        "topic": "Maritime Heritage",
-        "content": "Ipswich's economy was built on the sea. Fishing, shipbuilding, "
-                   "and coastal trade flourished from the colonial era through the "
-                   "nineteenth century. The clam flats and shellfish beds of the "
-                   "Great Marsh have been harvested for centuries, and Ipswich clams "
-                   "remain famous throughout New England."
-    },
-    {
-        "topic": "The Crane Family",
-        "content": "Richard T. Crane Jr., heir to the Chicago plumbing fortune, "
-                   "purchased Castle Hill in 1910 and built the Great House in 1928. "
-                   "His family donated the estate to The Trustees of Reservations "
-                   "in 1945, preserving Crane Beach and Castle Hill for the public "
-                   "in perpetuity."
-    },
-    {
-        "topic": "Revolutionary War",
-        "content": "Ipswich contributed men and supplies to the Revolutionary cause. "
-                   "Local militiamen marched to Lexington and Concord in April 1775. "
-                   "The town's seafaring tradition made it a target for British "
-                   "naval patrols; residents watched anxiously for enemy sails."
-    },
-    {
-        "topic": "Literary Connections",
-        "content": "John Greenleaf Whittier, the Quaker poet of Amesbury, wrote "
-                   "of Ipswich's beauty and history. Nathaniel Hawthorne visited "
-                   "the town and drew on its colonial past. The landscape has inspired "
-                   "writers for centuries with its blend of history and natural beauty."
-    },
-    {
-        "topic": "Jenny Slew's Freedom Suit",
-        "content": "In 1766, Jenny Slew became the first enslaved person in Massachusetts "
-                   "to win freedom through a jury trial. Kidnapped from Ipswich in 1762, "
-                   "she sued her enslaver John Whipple Jr. Judge Oliver declared: 'This is "
-                   "a contest between liberty and property—but liberty of most importance.' "
-                   "John Adams attended the trial. Her victory inspired subsequent freedom suits."
-    },
-    {
-        "topic": "The Invention of Fried Clams",
-        "content": "On July 3, 1916, Lawrence 'Chubby' Woodman and his wife Bessie "
-                   "invented the fried clam at their Essex concession stand. A fisherman "
-                   "named Tarr suggested they fry clams like their potato chips. They "
-                   "experimented with batters, settling on evaporated milk and corn flour. "
-                   "The Soffron Brothers later supplied Howard Johnson for 32 years."
-    },
-    {
-        "topic": "The Hosiery Industry",
-        "content": "In 1822, an English stocking machine was smuggled to Ipswich, buried "
-                   "in a ship's cargo of loose salt to evade British export penalties. By the "
-                   "turn of the 20th century, Ipswich Mills became the largest stocking mill "
-                   "in the country, attracting waves of immigrants—Irish, French Canadian, "
-                   "Polish, Greek. The mill buildings now house EBSCO Publishing."
-    },
-    {
-        "topic": "The EBSCO Mural",
-        "content": "In 2005, artist Alan Pearsall completed a 2,700 square-foot mural "
-                   "on the EBSCO building depicting Ipswich history. It shows Elizabeth Howe's "
-                   "arrest for witchcraft, Jenny Slew receiving payment after winning her freedom, "
-                   "and Richard Saltonstall who in 1645 denounced slavery as 'contrary to the law "
-                   "of God and the law of the country.'"
-    },
-    {
-        "topic": "Birthplace of American Independence",
-        "content": "In 1687, Reverend John Wise led Ipswich citizens in protesting "
-                   "Governor Andros's tax, arguing that taxation without representation was "
-                   "unacceptable. Wise was jailed but vindicated when Andros was recalled to "
-                   "England. Wise's writings influenced the Declaration of Independence, "
-                   "earning Ipswich the title 'Birthplace of American Independence.'"
-    },
-    {
-        "topic": "The Agawam People",
-        "content": "The Agawam tribe, led by Sagamore Masconomet, inhabited the region "
-                   "when English colonists arrived. Decimated by plague (90% loss), they "
-                   "invited the English to settle for mutual protection against the Abenaki. "
-                   "Masconomet sold the land to John Winthrop Jr. for £20 in 1638. 'Agawam' "
-                   "means 'low land' or 'marsh' in Algonquian."
-    },
-]
+HISTORICAL_FACTS: Final[Tuple[HistoricalFact, ...]] = (
+    HistoricalFact(
+        topic="Colonial Settlement",
+        content="Ipswich was settled in 1633 by John Winthrop the Younger, "
+                "making it one of the oldest towns in Massachusetts. Named Agawam "
+                "by the native Agawam people, the English renamed it for Ipswich, "
+                "England. Within two decades, it was the second largest town in "
+                "the Massachusetts Bay Colony.",
+    ),
+    HistoricalFact(
+        topic="First Period Architecture",
+        content="Ipswich contains the greatest concentration of First Period "
+                "(pre-1725) houses in North America. The Whipple House (c. 1655), "
+                "the John Heard House (1795), and dozens of others preserve the "
+                "building traditions of the first English settlers, with massive "
+                "oak frames, steep rooflines, and central chimneys.",
+    ),
+    HistoricalFact(
+        topic="The Choate Bridge",
+        content="Built in 1764, the Choate Bridge is the oldest double-arched "
+                "stone bridge in America still in use. Its twin Roman arches of "
+                "local granite have carried travelers across the Ipswich River "
+                "for over 260 years, a testament to colonial engineering.",
+    ),
+    HistoricalFact(
+        topic="Witchcraft Accusations",
+        content="In 1692, during the Salem witchcraft hysteria, several Ipswich "
+                "residents were accused of witchcraft. The town's magistrates "
+                "showed notable skepticism; no Ipswich resident was executed. "
+                "The Reverend John Wise of Ipswich became an early voice against "
+                "the trials' excesses.",
+    ),
+    HistoricalFact(
+        topic="John Wise and Colonial Dissent",
+        content="The Reverend John Wise of Ipswich led the 1687 protest against "
+                "Governor Andros's taxation without representation, anticipating "
+                "the Revolution by nearly a century. Wise was briefly imprisoned "
+                "for his defiance. His later writings influenced the Declaration "
+                "of Independence.",
+    ),
+    HistoricalFact(
+        topic="The Lace Industry",
+        content="From the 1820s through the early 1900s, Ipswich was a center "
+                "of lace manufacturing in America. Mills along the river produced "
+                "machine-made lace, employing hundreds of workers, many of them "
+                "immigrant women. The industry shaped the town's economy and "
+                "ethnic diversity for generations.",
+    ),
+    HistoricalFact(
+        topic="Maritime Heritage",
+        content="Ipswich's economy was built on the sea. Fishing, shipbuilding, "
+                "and coastal trade flourished from the colonial era through the "
+                "nineteenth century. The clam flats and shellfish beds of the "
+                "Great Marsh have been harvested for centuries, and Ipswich clams "
+                "remain famous throughout New England.",
+    ),
+    HistoricalFact(
+        topic="The Crane Family",
+        content="Richard T. Crane Jr., heir to the Chicago plumbing fortune, "
+                "purchased Castle Hill in 1910 and built the Great House in 1928. "
+                "His family donated the estate to The Trustees of Reservations "
+                "in 1945, preserving Crane Beach and Castle Hill for the public "
+                "in perpetuity.",
+    ),
+    HistoricalFact(
+        topic="Revolutionary War",
+        content="Ipswich contributed men and supplies to the Revolutionary cause. "
+                "Local militiamen marched to Lexington and Concord in April 1775. "
+                "The town's seafaring tradition made it a target for British "
+                "naval patrols; residents watched anxiously for enemy sails.",
+    ),
+    HistoricalFact(
+        topic="Literary Connections",
+        content="John Greenleaf Whittier, the Quaker poet of Amesbury, wrote "
+                "of Ipswich's beauty and history. Nathaniel Hawthorne visited "
+                "the town and drew on its colonial past. The landscape has inspired "
+                "writers for centuries with its blend of history and natural beauty.",
+    ),
+    HistoricalFact(
+        topic="Jenny Slew's Freedom Suit",
+        content="In 1766, Jenny Slew became the first enslaved person in Massachusetts "
+                "to win freedom through a jury trial. Kidnapped from Ipswich in 1762, "
+                "she sued her enslaver John Whipple Jr. Judge Oliver declared: 'This is "
+                "a contest between liberty and property—but liberty of most importance.' "
+                "John Adams attended the trial. Her victory inspired subsequent freedom suits.",
+    ),
+    HistoricalFact(
+        topic="The Invention of Fried Clams",
+        content="On July 3, 1916, Lawrence 'Chubby' Woodman and his wife Bessie "
+                "invented the fried clam at their Essex concession stand. A fisherman "
+                "named Tarr suggested they fry clams like their potato chips. They "
+                "experimented with batters, settling on evaporated milk and corn flour. "
+                "The Soffron Brothers later supplied Howard Johnson for 32 years.",
+    ),
+    HistoricalFact(
+        topic="The Hosiery Industry",
+        content="In 1822, an English stocking machine was smuggled to Ipswich, buried "
+                "in a ship's cargo of loose salt to evade British export penalties. By the "
+                "turn of the 20th century, Ipswich Mills became the largest stocking mill "
+                "in the country, attracting waves of immigrants—Irish, French Canadian, "
+                "Polish, Greek. The mill buildings now house EBSCO Publishing.",
+    ),
+    HistoricalFact(
+        topic="The EBSCO Mural",
+        content="In 2005, artist Alan Pearsall completed a 2,700 square-foot mural "
+                "on the EBSCO building depicting Ipswich history. It shows Elizabeth Howe's "
+                "arrest for witchcraft, Jenny Slew receiving payment after winning her freedom, "
+                "and Richard Saltonstall who in 1645 denounced slavery as 'contrary to the law "
+                "of God and the law of the country.'",
+    ),
+    HistoricalFact(
+        topic="Birthplace of American Independence",
+        content="In 1687, Reverend John Wise led Ipswich citizens in protesting "
+                "Governor Andros's tax, arguing that taxation without representation was "
+                "unacceptable. Wise was jailed but vindicated when Andros was recalled to "
+                "England. Wise's writings influenced the Declaration of Independence, "
+                "earning Ipswich the title 'Birthplace of American Independence.'",
+    ),
+    HistoricalFact(
+        topic="The Agawam People",
+        content="The Agawam tribe, led by Sagamore Masconomet, inhabited the region "
+                "when English colonists arrived. Decimated by plague (90% loss), they "
+                "invited the English to settle for mutual protection against the Abenaki. "
+                "Masconomet sold the land to John Winthrop Jr. for £20 in 1638. 'Agawam' "
+                "means 'low land' or 'marsh' in Algonquian.",
+    ),
+)
 
 # =============================================================================
 # CLAMMING CULTURE - The Ipswich Clam Industry
 # =============================================================================
 
-CLAMMING_CULTURE = {
+CLAMMING_CULTURE: Final[Mapping[str, object]] = _freeze({
     "overview": {
         "significance": "Ipswich is famous as the home of the 'Ipswich clam'",
         "industry_value": "$2.2 million (2018), nearly 1/3 of Massachusetts total",
@@ -1041,7 +1232,7 @@ less residual sediment. The unique combination of minerals, saltier water, and
 fluctuating ocean currents creates the distinctive taste.""",
     },
     "clam_flats": {
-        "locations": ["Ipswich River flats", "Eagle River", "Essex River", "Parker River"],
+        "locations": ("Ipswich River flats", "Eagle River", "Essex River", "Parker River"),
         "access": "Shellfish permits required from Town of Ipswich",
         "regulations": {
             "resident_permit": "$40/year plus $10 enhancement fee",
@@ -1077,14 +1268,14 @@ fluctuating ocean currents creates the distinctive taste.""",
 to Howard Johnson restaurants for 32 years. Thomas Soffron invented a patented device
 to tenderize tough surf clam meat for clam strips.""",
     },
-}
+})
 
 # =============================================================================
 # ECOLOGY AND WILDLIFE
 # =============================================================================
 
-WILDLIFE_BY_SEASON = {
-    "spring": [
+WILDLIFE_BY_SEASON: Final[Mapping[str, Tuple[str, ...]]] = _freeze({
+    "spring": (
         "Alewives run up the Ipswich River to spawn, their silver bodies flashing in the shallows.",
         "Piping plovers return to Crane Beach to nest in the sand.",
         "Ospreys rebuild their platform nests on poles along the marsh.",
@@ -1095,8 +1286,8 @@ WILDLIFE_BY_SEASON = {
         "Migrating warblers pause in the forest understory.",
         "Red-winged blackbirds stake out territories in the phragmites.",
         "Striped bass begin their northward migration through the sound.",
-    ],
-    "summer": [
+    ),
+    "summer": (
         "Greenhead flies emerge from the salt marsh to plague beachgoers in July.",
         "Terns dive for sand eels in the waters off Crane Beach.",
         "Harbor seals haul out on sandbars at low tide.",
@@ -1107,8 +1298,8 @@ WILDLIFE_BY_SEASON = {
         "Bluefish chase baitfish into the shallows, churning the water.",
         "Barn swallows raise second broods in the farm buildings.",
         "Diamondback terrapins nest in sandy areas near the marsh.",
-    ],
-    "autumn": [
+    ),
+    "autumn": (
         "Migrating hawks kettle over the dunes on northwest winds.",
         "Thousands of tree swallows gather in the marsh before heading south.",
         "White-tailed deer rut in the forest; bucks spar at dawn.",
@@ -1119,8 +1310,8 @@ WILDLIFE_BY_SEASON = {
         "Muskrats busy themselves building winter lodges.",
         "Cranberries float crimson in the harvested bogs.",
         "Late-season stripers make a final push through the sound.",
-    ],
-    "winter": [
+    ),
+    "winter": (
         "Harbor seals pup on the outer sandbars in January.",
         "Snowy owls sometimes visit from the Arctic, hunting the dunes.",
         "Sea ducks raft in the thousands on Plum Island Sound.",
@@ -1131,230 +1322,230 @@ WILDLIFE_BY_SEASON = {
         "Bald eagles patrol the open water, looking for weak fish.",
         "Harbor porpoises sometimes chase herring close to shore.",
         "Coyotes howl at night, their voices carrying over the frozen landscape.",
-    ],
-}
+    ),
+})
 
 # =============================================================================
 # BIRDS BY SEASON - Specific to Essex County / North Shore
 # =============================================================================
 
-BIRDS_BY_SEASON = {
+BIRDS_BY_SEASON: Final[Mapping[str, object]] = _freeze({
     "spring": {
-        "returning_migrants": [
+        "returning_migrants": (
             "Osprey return in late March, rebuilding nests on channel markers and platforms",
             "Tree swallows arrive early, competing for nest boxes at Appleton Farms",
             "Baltimore orioles appear when the apple trees bloom, weaving pendulous nests",
             "Ruby-throated hummingbirds return to feeders and beach plum blossoms",
             "Barn swallows sweep into the farm buildings of Linebrook",
             "Chimney swifts return to roost in old chimneys downtown",
-        ],
-        "shorebirds": [
+        ),
+        "shorebirds": (
             "Piping plovers establish territories at Crane Beach by late April",
             "Least terns begin their noisy colonies on the sandy upper beach",
             "American oystercatchers probe the mudflats with their orange bills",
             "Semipalmated plovers and sandpipers pause during northward migration",
             "Greater and lesser yellowlegs feed in the marsh pools",
-        ],
-        "warblers": [
+        ),
+        "warblers": (
             "Yellow warblers sing from the willows along the Riverwalk",
             "Yellow-rumped warblers pass through in waves during May",
             "Common yellowthroats call 'witchity-witchity' from the marsh edges",
             "Pine warblers trill from Willowdale's pine groves",
-        ],
+        ),
         "year_round_notes": "Great blue herons return to rookeries; red-tailed hawks circle over Appleton Farms",
     },
     "summer": {
-        "nesting": [
+        "nesting": (
             "Piping plover chicks run like cotton balls on the beach",
             "Least tern parents dive-bomb anyone who approaches their nests",
             "Osprey feed their growing young on fish from the sound",
             "Saltmarsh sparrows nest secretly in the cordgrass",
             "Willets stand sentinel on marsh hummocks, crying loudly at intruders",
-        ],
-        "herons_egrets": [
+        ),
+        "herons_egrets": (
             "Great egrets stalk the marsh creeks in elegant white",
             "Snowy egrets shuffle their yellow feet to stir up prey",
             "Black-crowned night herons emerge at dusk to hunt",
             "Green herons crouch motionless along the riverbanks",
             "Glossy ibis probe the mudflats with curved bills",
-        ],
-        "beach_birds": [
+        ),
+        "beach_birds": (
             "Common and least terns plunge for sand eels offshore",
             "Laughing gulls fill the summer air with their calls",
             "Double-crested cormorants dry their wings on channel markers",
-        ],
+        ),
         "year_round_notes": "Purple martins gather in pre-migration roosts; nighthawks appear over downtown at dusk",
     },
     "autumn": {
-        "hawk_migration": [
+        "hawk_migration": (
             "Sharp-shinned hawks stream over the dunes on northwest winds",
             "Cooper's hawks hunt the bird feeders of residential neighborhoods",
             "Broad-winged hawks kettle by the thousands in mid-September",
             "Merlins dash through flocks of shorebirds at the beach",
             "Northern harriers quarter low over the marsh, tilting side to side",
             "Peregrine falcons pause at Crane Beach during migration",
-        ],
-        "waterfowl_arriving": [
+        ),
+        "waterfowl_arriving": (
             "Green-winged teal gather in marsh pools",
             "Northern pintails arrive with their elegant long tails",
             "American black ducks increase as northern birds move south",
             "Buffleheads and goldeneyes appear on the river by November",
-        ],
-        "sparrows": [
+        ),
+        "sparrows": (
             "White-throated sparrows return with their plaintive 'Old Sam Peabody' song",
             "Song sparrows sing from every thicket",
             "Savannah sparrows feed in the marsh before heading south",
             "Nelson's sparrows skulk in the spartina during migration",
-        ],
+        ),
         "year_round_notes": "Tree swallows gather by the tens of thousands over the marsh before departing; monarch butterflies share their flyway",
     },
     "winter": {
-        "sea_ducks": [
+        "sea_ducks": (
             "Common eiders raft in huge flocks off Crane Beach",
             "White-winged, surf, and black scoters dive beyond the breakers",
             "Long-tailed ducks call their yodeling song from the sound",
             "Buffleheads bob like corks in the sheltered coves",
             "Red-breasted mergansers fish the tidal creeks",
             "Common goldeneyes whistle overhead with each wingbeat",
-        ],
-        "raptors": [
+        ),
+        "raptors": (
             "Snowy owls sometimes appear on the dunes, visitors from the Arctic",
             "Short-eared owls hunt the marsh at dusk, mothlike and silent",
             "Rough-legged hawks hover over the open fields",
             "Bald eagles patrol the open water where waterfowl concentrate",
             "Great horned owls begin courtship hooting in January",
-        ],
-        "winter_finches": [
+        ),
+        "winter_finches": (
             "Some years bring irruptions of pine siskins and redpolls from the north",
             "Purple finches visit feeders alongside house finches",
             "American goldfinches in drab winter plumage flock to thistle feeders",
             "Dark-eyed juncos scratch under feeders throughout the season",
-        ],
-        "specialties": [
+        ),
+        "specialties": (
             "Harlequin ducks sometimes appear on the rocky jetties",
             "King eiders occasionally mix with common eider flocks",
             "Barrow's goldeneye is a rare prize among the commons",
             "Iceland and glaucous gulls visit from the north",
-        ],
+        ),
         "year_round_notes": "Harbor seals pup on sandbars; great black-backed gulls dominate the beaches",
     },
-}
+})
 
 # =============================================================================
 # ASTRONOMY BY SEASON - Night sky from Ipswich latitude (42.7°N)
 # =============================================================================
 
-ASTRONOMY_BY_SEASON = {
+ASTRONOMY_BY_SEASON: Final[Mapping[str, object]] = _freeze({
     "spring": {
-        "constellations": [
+        "constellations": (
             "Leo the Lion dominates the southern sky, with bright Regulus marking his heart",
             "The Big Dipper stands high overhead, its pointer stars leading to Polaris",
             "Virgo rises in the east, her bright star Spica heralding warmer nights",
             "Boötes the Herdsman follows with orange Arcturus, the brightest star of spring",
-        ],
-        "planets_events": [
+        ),
+        "planets_events": (
             "The spring equinox brings equal day and night around March 20",
             "The Lyrid meteor shower peaks in late April",
             "Venus often shines as the evening star in western twilight",
-        ],
+        ),
         "moon_notes": "The full moon nearest the equinox is the Worm Moon or Sap Moon",
         "viewing_notes": "Spring nights can be hazy, but the lengthening evenings offer more stargazing time after dinner",
     },
     "summer": {
-        "constellations": [
+        "constellations": (
             "The Summer Triangle rises: Vega in Lyra, Deneb in Cygnus, Altair in Aquila",
             "Scorpius crawls low along the southern horizon, red Antares its heart",
             "The Milky Way arches overhead on moonless nights, from Sagittarius to Cassiopeia",
             "Cygnus the Swan flies along the river of stars",
-        ],
-        "planets_events": [
+        ),
+        "planets_events": (
             "The summer solstice brings the longest day around June 21",
             "The Perseid meteor shower peaks in mid-August, often the year's best",
             "Noctilucent clouds sometimes glow blue in the north after sunset",
             "Jupiter and Saturn often dominate the summer evening sky",
-        ],
+        ),
         "moon_notes": "The full Strawberry Moon in June; the Sturgeon Moon in August",
         "viewing_notes": "Warm nights make beach stargazing pleasant; the marsh provides dark skies away from town lights",
     },
     "autumn": {
-        "constellations": [
+        "constellations": (
             "The Great Square of Pegasus marks the autumn sky",
             "Andromeda stretches from Pegasus, her galaxy visible as a fuzzy patch to dark-adapted eyes",
             "Cassiopeia's W shape wheels higher in the north",
             "The Pleiades rise in the east, the Seven Sisters heralding winter",
             "Fomalhaut shines lonely and bright in the southern sky",
-        ],
-        "planets_events": [
+        ),
+        "planets_events": (
             "The autumn equinox brings equal day and night around September 22",
             "The Orionid meteors peak in late October",
             "The Leonid meteors peak in mid-November",
             "Mars, when in opposition, blazes red among the stars",
-        ],
+        ),
         "moon_notes": "The Harvest Moon rises near sunset for several nights; the Hunter's Moon follows in October",
         "viewing_notes": "Crisp autumn nights offer excellent seeing; the earlier darkness invites stargazing before bed",
     },
     "winter": {
-        "constellations": [
+        "constellations": (
             "Orion the Hunter strides across the southern sky, unmistakable with his belt of three stars",
             "Sirius, the brightest star, blazes below Orion in Canis Major",
             "The Winter Hexagon connects six bright stars: Sirius, Procyon, Pollux, Capella, Aldebaran, Rigel",
             "Taurus the Bull faces Orion, red Aldebaran his eye, the Pleiades on his shoulder",
             "Gemini's twins Castor and Pollux stand high in the east",
             "Auriga the Charioteer rides near the zenith, bright Capella his beacon",
-        ],
-        "planets_events": [
+        ),
+        "planets_events": (
             "The winter solstice brings the longest night around December 21",
             "The Geminid meteor shower in mid-December rivals the Perseids",
             "The Quadrantid meteors peak in early January",
             "Venus often appears as the morning star before dawn",
-        ],
+        ),
         "moon_notes": "The Cold Moon or Long Night Moon; the Wolf Moon in January",
         "viewing_notes": "Winter offers the clearest, steadiest skies, though cold limits viewing time; Orion is visible all night",
     },
-}
+})
 
 # =============================================================================
 # MARINE LIFE BY SEASON
 # =============================================================================
 
-MARINE_LIFE_BY_SEASON = {
-    "spring": [
+MARINE_LIFE_BY_SEASON: Final[Mapping[str, Tuple[str, ...]]] = _freeze({
+    "spring": (
         "Alewives and river herring run up the Ipswich River to spawn in ancestral ponds",
         "Striped bass arrive from the south, following the warming water",
         "Horseshoe crabs crawl onto beaches under May and June full moons to spawn",
         "Lobsters move inshore as waters warm",
         "Winter flounder spawn in the estuary before heading to deeper water",
-    ],
-    "summer": [
+    ),
+    "summer": (
         "Bluefish slash through schools of menhaden, driving them to the surface",
         "Harbor seals haul out on sandbars at low tide",
         "Moon jellyfish pulse through the warm shallows",
         "Blue crabs reach the northern edge of their range in warm years",
         "Squid move inshore to spawn, attracting striped bass",
         "Sand eels swarm, feeding terns and whales alike",
-    ],
-    "autumn": [
+    ),
+    "autumn": (
         "False albacore chase bait along the beaches in September",
         "Striped bass make their fall run, feeding heavily before heading south",
         "Gray seals return from Canadian waters, hauling out on outer bars",
         "Sea scallops are harvested from the deeper waters",
         "Cod move inshore as waters cool",
-    ],
-    "winter": [
+    ),
+    "winter": (
         "Harbor seals pup on remote sandbars in January and February",
         "Gray seals dominate the outer beaches, their numbers growing each year",
         "Harp seals occasionally wander south in cold winters",
         "Cod fishing peaks in the cold months",
         "Sea ducks dive for mussels and crabs in the frigid water",
         "Right whales sometimes pass offshore during their migration",
-    ],
-}
+    ),
+})
 
 # =============================================================================
 # SEASONAL CHARACTERISTICS
 # =============================================================================
 
-SEASONAL_CHARACTER = {
+SEASONAL_CHARACTER: Final[Mapping[str, Mapping[str, str]]] = _freeze({
     "spring": {
         "feel": "A time of patience and hope along the coast. The land thaws slowly; "
                 "the sea remains cold. The marsh greens up before the upland trees leaf out. "
@@ -1387,57 +1578,609 @@ SEASONAL_CHARACTER = {
         "sounds": "Wind in bare branches, surf on the winter beach, ice cracking at tide change.",
         "smells": "Wood smoke, cold salt air, snow.",
     },
+})
+
+# =============================================================================
+# COLUMN VIEWS - Field-oriented copies of the record collections
+# =============================================================================
+# Filters over a single field (category, type, a season's note) scan one
+# tuple instead of touching every record. Row i of each column belongs to the
+# same record; for the dict collections the "key" column holds its dict key.
+
+class Season(IntEnum):
+    """Column index into SEASONAL_NOTES."""
+    SPRING = 0
+    SUMMER = 1
+    AUTUMN = 2
+    WINTER = 3
+
+
+SEASONS = tuple(sys.intern(season.name.lower()) for season in Season)
+
+# Seasonal notes for ALL_LOCATIONS, one column per season:
+# SEASONAL_NOTES[Season.AUTUMN][i] is location i's autumn note ("" if none)
+SEASONAL_NOTES: Tuple[Tuple[str, ...], ...] = tuple(
+    tuple(loc.seasonal_notes.get(season, "") for loc in ALL_LOCATIONS)
+    for season in SEASONS
+)
+
+# Season-independent start of each "Notable Places" line in
+# build_knowledge_context: the first 12 locations (increased limit for richer
+# context) with their descriptions truncated once here
+_NOTABLE_PLACE_LINES: Tuple[str, ...] = tuple(
+    f"- **{loc.name}**: {loc.description[:200]}... " for loc in ALL_LOCATIONS[:12]
+)
+
+
+def _record_columns(collection: Mapping[str, object], record_type: type) -> Dict[str, tuple]:
+    """Build column tuples from a dict of dataclass records."""
+    columns = {"key": tuple(collection)}
+    for field in fields(record_type):
+        columns[field.name] = tuple(getattr(record, field.name) for record in collection.values())
+    return columns
+
+
+NATURAL_FEATURES_SOA: Dict[str, tuple] = {
+    "name": tuple(loc.name for loc in NATURAL_FEATURES),
+    "description": tuple(loc.description for loc in NATURAL_FEATURES),
+    "category": tuple(loc.category for loc in NATURAL_FEATURES),
+    **{
+        f"season_{season.name.lower()}": SEASONAL_NOTES[season][len(NEIGHBORHOODS):]
+        for season in Season
+    },
+}
+
+HISTORICAL_FIGURES_SOA = _record_columns(HISTORICAL_FIGURES, HistoricalFigure)
+LOCAL_LEGENDS_SOA = _record_columns(LOCAL_LEGENDS, Legend)
+LOCAL_BUSINESSES_SOA = _record_columns(LOCAL_BUSINESSES, Business)
+IPSWICH_SCHOOLS_SOA = _record_columns(IPSWICH_SCHOOLS, School)
+FIRST_PERIOD_HOUSES_SOA: Dict[str, tuple] = {
+    field.name: tuple(getattr(house, field.name) for house in FIRST_PERIOD_HOUSES)
+    for field in fields(FirstPeriodHouse)
+}
+
+# BIRDS_BY_SEASON and WILDLIFE_BY_SEASON bullets as one flat table; wildlife
+# rows use the category "wildlife" (bird "year_round_notes" strings are left out)
+_SIGHTINGS = (
+    *(
+        (season, category, item)
+        for season, categories in BIRDS_BY_SEASON.items()
+        for category, items in categories.items()
+        if isinstance(items, tuple)
+        for item in items
+    ),
+    *((season, "wildlife", item) for season, items in WILDLIFE_BY_SEASON.items() for item in items),
+)
+SIGHTINGS_SOA: Dict[str, tuple] = dict(zip(("season", "category", "text"), zip(*_SIGHTINGS)))
+
+_YEAR_RE = re.compile(r"\b(?:1[5-9]|20)\d\d\b")
+
+
+def _year_span(text) -> Tuple[Optional[int], Optional[int]]:
+    """Return the (earliest, latest) four-digit year in a value, if any."""
+    years = [int(year) for year in _YEAR_RE.findall(str(text or ""))]
+    return (min(years), max(years)) if years else (None, None)
+
+
+# Free-form dates parsed once into numeric year columns
+HISTORICAL_FIGURES_SOA["birth_year"], HISTORICAL_FIGURES_SOA["death_year"] = (
+    tuple(column) for column in zip(*map(_year_span, HISTORICAL_FIGURES_SOA["dates"]))
+)
+LOCAL_BUSINESSES_SOA["established_year"] = tuple(
+    _year_span(established)[0] for established in LOCAL_BUSINESSES_SOA["established"]
+)
+# Construction span as uint16 years; a house with no parseable year gets an
+# empty span (0xFFFF, 0) so it never matches a range
+_BUILT_SPANS = [_year_span(built) for built in FIRST_PERIOD_HOUSES_SOA["built"]]
+FIRST_PERIOD_HOUSES_SOA["built_min"] = array("H", (low or 0xFFFF for low, _ in _BUILT_SPANS))
+FIRST_PERIOD_HOUSES_SOA["built_max"] = array("H", (high or 0 for _, high in _BUILT_SPANS))
+
+
+def _build_business_indexes():
+    """Index LOCAL_BUSINESSES keys by lowercased address, street and type."""
+    by_address: Dict[str, str] = {}
+    by_street: Dict[str, Tuple[str, ...]] = {}
+    by_type: Dict[str, Tuple[str, ...]] = {}
+    for key, biz in LOCAL_BUSINESSES.items():
+        address = biz.address.lower()
+        number, _, street = address.partition(" ")
+        if not number.isdigit():
+            street = address
+        by_address[address] = key
+        by_street[street] = by_street.get(street, ()) + (key,)
+        by_type[biz.type.lower()] = by_type.get(biz.type.lower(), ()) + (key,)
+    return by_address, by_street, by_type
+
+
+BUSINESSES_BY_ADDRESS, BUSINESSES_BY_STREET, BUSINESSES_BY_TYPE = _build_business_indexes()
+
+# Lowercased house name / fact topic -> record
+HOUSES_BY_NAME: Dict[str, FirstPeriodHouse] = {
+    sys.intern(house.name.lower()): house for house in FIRST_PERIOD_HOUSES
+}
+FACTS_BY_TOPIC: Dict[str, HistoricalFact] = {
+    sys.intern(fact.topic.lower()): fact for fact in HISTORICAL_FACTS
+}
+
+
+def _bucket(pairs) -> Dict:
+    """Group (bucket, item) pairs into a dict of tuples, keeping first-seen order."""
+    buckets: Dict = {}
+    for bucket, item in pairs:
+        buckets.setdefault(bucket, []).append(item)
+    return {bucket: tuple(items) for bucket, items in buckets.items()}
+
+
+_GRADE_LEVELS = {"pre-k": -1, "k": 0}
+
+
+def _grade_range(grades: str) -> Tuple[int, int]:
+    """Parse a span like "Pre-K through 2" into (low, high); Pre-K is -1, K is 0."""
+    low, _, high = grades.lower().partition(" through ")
+    levels = [
+        _GRADE_LEVELS[grade] if grade in _GRADE_LEVELS else int(grade)
+        for grade in (low.strip(), (high or low).strip())
+    ]
+    return levels[0], levels[1]
+
+
+# Category/type buckets, computed once instead of scanning per query
+NATURAL_BY_CATEGORY: Dict[str, Tuple[int, ...]] = _bucket(
+    (category, i) for i, category in enumerate(NATURAL_FEATURES_SOA["category"])
+)
+LOCATIONS_BY_CATEGORY: Dict[str, Tuple[Location, ...]] = _bucket(
+    (loc.category, loc) for loc in ALL_LOCATIONS
+)
+LEGENDS_BY_TYPE: Dict[str, Tuple[str, ...]] = _bucket(
+    (legend.type, key) for key, legend in LOCAL_LEGENDS.items()
+)
+SCHOOLS_BY_GRADE_RANGE: Dict[Tuple[int, int], Tuple[str, ...]] = dict(
+    sorted(_bucket((_grade_range(school.grades), key) for key, school in IPSWICH_SCHOOLS.items()).items())
+)
+
+
+def _grade_bit(grade: int) -> int:
+    """Bit for a grade level: bit 0 = Pre-K, bit 1 = K, bit 2 = grade 1, ... bit 13 = grade 12."""
+    return 1 << (grade + 1)
+
+
+# Grades served by each school as a bitmask, aligned with IPSWICH_SCHOOLS_SOA["key"]
+IPSWICH_SCHOOLS_SOA["grades_mask"] = array(
+    "H",
+    (
+        sum(_grade_bit(grade) for grade in range(low, high + 1))
+        for low, high in map(_grade_range, IPSWICH_SCHOOLS_SOA["grades"])
+    ),
+)
+
+# Business seasonal activities flattened to (business key, season) -> text,
+# plus the businesses advertising something in each season
+BUSINESS_SEASONAL: Dict[Tuple[str, str], str] = {
+    (key, season): text
+    for key, biz in LOCAL_BUSINESSES.items()
+    for season, text in (biz.seasonal_activities or {}).items()
+}
+BUSINESSES_BY_SEASON: Dict[str, Tuple[str, ...]] = _bucket(
+    (season, key) for key, season in BUSINESS_SEASONAL
+)
+
+# Approximate coordinates (to ~0.005°) for point-like places, as float32
+# lat/lon columns aligned with COORDS_KEYS. Areas without a single fixed
+# point (the marsh, rivers, roads, neighborhoods) are left out.
+_PLACE_COORDS = (
+    ("Downtown Ipswich", 42.6792, -70.8417),
+    ("Town Hill", 42.6810, -70.8400),
+    ("Choate Bridge", 42.6787, -70.8382),
+    ("Crane Beach", 42.6835, -70.7662),
+    ("Castle Hill and the Crane Estate", 42.6786, -70.7758),
+    ("Appleton Farms", 42.6450, -70.8530),
+    ("Willowdale State Forest", 42.6640, -70.9000),
+    ("Choate Island", 42.6610, -70.7510),
+)
+COORDS_KEYS: Tuple[str, ...] = tuple(name for name, _, _ in _PLACE_COORDS)
+COORDS_LAT = array("f", (lat for _, lat, _ in _PLACE_COORDS))
+COORDS_LON = array("f", (lon for _, _, lon in _PLACE_COORDS))
+
+# =============================================================================
+# KEYWORD INDEX - Token -> record postings for text search
+# =============================================================================
+# Built once, on first use, so a search hashes a token instead of scanning
+# every description and story. Postings are compact integer ids into
+# RECORD_IDS. RECORD_IDS, KEYWORD_INDEX, BIGRAM_INDEX, PROPER_NOUN_RE and
+# SPECIES_INDEX are resolved lazily by the module __getattr__ below (PEP 562).
+
+_TOKEN_RE = re.compile(r"[A-Za-z][A-Za-z']+")
+
+
+def _tokenize(text: str) -> List[str]:
+    return [token.lower() for token in _TOKEN_RE.findall(text)]
+
+
+def _add_posting(index: Dict[str, array], term: str, record_id: int) -> None:
+    postings = index.setdefault(term, array("I"))
+    if not postings or postings[-1] != record_id:
+        postings.append(record_id)
+
+
+@functools.cache
+def _build_keyword_index():
+    """Index name/description/story text of the searchable collections."""
+    records = [("natural_features", loc.name, (loc.name, loc.description)) for loc in NATURAL_FEATURES]
+    for collection_name, collection in (
+        ("historical_figures", HISTORICAL_FIGURES),
+        ("local_legends", LOCAL_LEGENDS),
+        ("local_businesses", LOCAL_BUSINESSES),
+    ):
+        for key, record in collection.items():
+            texts = (getattr(record, field, "") for field in ("name", "description", "story"))
+            records.append((collection_name, key, tuple(texts)))
+
+    record_ids: List[Tuple[str, str]] = []
+    record_texts: List[Tuple[str, ...]] = []
+    keywords: Dict[str, array] = {}
+    bigrams: Dict[str, array] = {}
+    for record_id, (collection_name, key, texts) in enumerate(records):
+        record_ids.append((collection_name, key))
+        normalized = []
+        for text in texts:
+            tokens = _tokenize(text)
+            normalized.append(f" {' '.join(tokens)} ")
+            for token in tokens:
+                _add_posting(keywords, sys.intern(token), record_id)
+            for first, second in zip(tokens, tokens[1:]):
+                _add_posting(bigrams, sys.intern(f"{first} {second}"), record_id)
+        record_texts.append(tuple(normalized))
+
+    return tuple(record_ids), keywords, bigrams, tuple(record_texts)
+
+
+# Every proper noun in the knowledge base -> (collection, key) of its record.
+# One alternation (longest names first, so "Ipswich High School" beats a
+# shorter overlapping name) lets a single regex pass find all of them.
+PROPER_NOUNS: Dict[str, Tuple[str, str]] = {
+    **{loc.name: ("neighborhoods", loc.name) for loc in NEIGHBORHOODS},
+    **{loc.name: ("natural_features", loc.name) for loc in NATURAL_FEATURES},
+    **{
+        record.name: (collection_name, key)
+        for collection_name, collection in (
+            ("historical_figures", HISTORICAL_FIGURES),
+            ("local_legends", LOCAL_LEGENDS),
+            ("local_businesses", LOCAL_BUSINESSES),
+            ("ipswich_schools", IPSWICH_SCHOOLS),
+        )
+        for key, record in collection.items()
+    },
+}
+
+
+@functools.cache
+def _build_proper_noun_re() -> re.Pattern:
+    return re.compile(
+        r"(?<!\w)("
+        + "|".join(re.escape(name) for name in sorted(PROPER_NOUNS, key=len, reverse=True))
+        + r")(?!\w)"
+    )
+
+
+def _singular(token: str) -> str:
+    """Crude English singular for species words: "ospreys" -> "osprey", "finches" -> "finch"."""
+    if token.endswith("ies") and len(token) > 4:
+        return token[:-3] + "y"
+    if token.endswith(("ches", "shes", "xes")):
+        return token[:-2]
+    if token.endswith("s") and not token.endswith(("ss", "is", "us")) and len(token) > 3:
+        return token[:-1]
+    return token
+
+
+@functools.cache
+def _build_species_index() -> Dict[str, frozenset]:
+    """Index BIRDS_BY_SEASON and WILDLIFE_BY_SEASON bullets by singular word and word pair.
+
+    Values are frozensets of (season, category); WILDLIFE_BY_SEASON entries use
+    the category "wildlife".
+    """
+    index: Dict[str, set] = {}
+    for season, category, item in zip(
+        SIGHTINGS_SOA["season"], SIGHTINGS_SOA["category"], SIGHTINGS_SOA["text"]
+    ):
+        words = [_singular(token) for token in _tokenize(item)]
+        for term in (*words, *(f"{a} {b}" for a, b in zip(words, words[1:]))):
+            index.setdefault(sys.intern(term), set()).add((season, category))
+    return {term: frozenset(places) for term, places in index.items()}
+
+
+_LAZY_ATTRIBUTES = {
+    "RECORD_IDS": lambda: _build_keyword_index()[0],
+    "KEYWORD_INDEX": lambda: _build_keyword_index()[1],
+    "BIGRAM_INDEX": lambda: _build_keyword_index()[2],
+    "PROPER_NOUN_RE": _build_proper_noun_re,
+    "SPECIES_INDEX": _build_species_index,
+}
+
+
+def __getattr__(name: str):
+    """Build the text-search indexes the first time they are accessed."""
+    if name in _LAZY_ATTRIBUTES:
+        value = globals()[name] = _LAZY_ATTRIBUTES[name]()
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Lowercased place and business names -> display name, for fuzzy matching
+_CATALOG_NAMES: Dict[str, str] = {
+    sys.intern(name.lower()): name
+    for name in (
+        *(loc.name for loc in ALL_LOCATIONS),
+        *(biz.name for biz in LOCAL_BUSINESSES.values()),
+    )
 }
 
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
 
-def get_locations_by_category(category: str) -> List[Location]:
+def get_natural_feature(index: int) -> Location:
+    """Return the natural feature at a row index of NATURAL_FEATURES_SOA."""
+    return NATURAL_FEATURES[index]
+
+
+def features_by_category(category: str) -> Tuple[int, ...]:
+    """Return row indices of natural features in a given category."""
+    return NATURAL_BY_CATEGORY.get(category, ())
+
+
+def get_locations_by_category(category: str) -> Tuple[Location, ...]:
     """Return all locations of a given category."""
-    all_locations = NEIGHBORHOODS + NATURAL_FEATURES
-    return [loc for loc in all_locations if loc.category == category]
+    return LOCATIONS_BY_CATEGORY.get(category, ())
+
+
+@functools.lru_cache(maxsize=32)
+def seasonal_summary(season: str) -> Tuple[Tuple[str, str], ...]:
+    """Return (feature name, seasonal note) pairs for a season."""
+    notes = NATURAL_FEATURES_SOA.get(f"season_{season.lower()}", ())
+    return tuple(
+        (name, note) for name, note in zip(NATURAL_FEATURES_SOA["name"], notes) if note
+    )
+
+
+def businesses_by_type(business_type: str) -> Tuple[str, ...]:
+    """Return LOCAL_BUSINESSES keys of a given type (case-insensitive)."""
+    return BUSINESSES_BY_TYPE.get(business_type.lower(), ())
+
+
+def get_business_by_address(address: str) -> str | None:
+    """Return the LOCAL_BUSINESSES key at an address like "246 High Street"."""
+    return BUSINESSES_BY_ADDRESS.get(" ".join(address.lower().split()))
+
+
+def businesses_on_street(street: str) -> Tuple[str, ...]:
+    """Return LOCAL_BUSINESSES keys on a street like "High Street"."""
+    return BUSINESSES_BY_STREET.get(" ".join(street.lower().split()), ())
+
+
+@functools.lru_cache(maxsize=32)
+def historical_figures_by_era(start_year: int, end_year: int) -> Tuple[str, ...]:
+    """Return HISTORICAL_FIGURES keys whose recorded dates overlap a year range."""
+    return tuple(
+        key
+        for key, birth, death in zip(
+            HISTORICAL_FIGURES_SOA["key"],
+            HISTORICAL_FIGURES_SOA["birth_year"],
+            HISTORICAL_FIGURES_SOA["death_year"],
+        )
+        if birth is not None and birth <= end_year and death >= start_year
+    )
+
+
+def get_house(name: str) -> FirstPeriodHouse | None:
+    """Return the First Period house with a given name (case-insensitive)."""
+    return HOUSES_BY_NAME.get(name.lower())
+
+
+@functools.lru_cache(maxsize=32)
+def houses_built_before(year: int) -> Tuple[str, ...]:
+    """Return names of First Period houses whose earliest construction predates a year."""
+    return tuple(
+        name
+        for name, built in zip(FIRST_PERIOD_HOUSES_SOA["name"], FIRST_PERIOD_HOUSES_SOA["built_min"])
+        if built < year
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def houses_built_between(start_year: int, end_year: int) -> Tuple[str, ...]:
+    """Return names of First Period houses whose construction span overlaps a year range.
+
+    "1663-1750" or "c. 1640/1680" spans both years; a single year is a one-year span.
+    """
+    return tuple(
+        name
+        for name, low, high in zip(
+            FIRST_PERIOD_HOUSES_SOA["name"],
+            FIRST_PERIOD_HOUSES_SOA["built_min"],
+            FIRST_PERIOD_HOUSES_SOA["built_max"],
+        )
+        if low <= end_year and high >= start_year
+    )
 
 
 def get_location_by_name(name: str) -> Location | None:
     """Find a location by name (case-insensitive partial match)."""
-    all_locations = NEIGHBORHOODS + NATURAL_FEATURES
     name_lower = name.lower()
-    for loc in all_locations:
-        if name_lower in loc.name.lower():
+    exact = _LOCATIONS_BY_LOWER_NAME.get(name_lower)
+    if exact is not None:
+        return exact
+
+    for lower_name, loc in _LOCATIONS_BY_LOWER_NAME.items():
+        if name_lower in lower_name:
             return loc
     return None
 
 
-def get_seasonal_wildlife(season: str) -> List[str]:
+@functools.lru_cache(maxsize=8)
+def get_seasonal_wildlife(season: str) -> Tuple[str, ...]:
     """Return wildlife observations for a given season."""
-    return WILDLIFE_BY_SEASON.get(season.lower(), [])
+    return WILDLIFE_BY_SEASON.get(season.lower(), ())
 
 
-def get_seasonal_character(season: str) -> Dict[str, str]:
+@functools.lru_cache(maxsize=8)
+def get_seasonal_character(season: str) -> Mapping[str, str]:
     """Return the character/feel of a given season."""
     return SEASONAL_CHARACTER.get(season.lower(), {})
 
 
-def get_random_historical_fact() -> Dict[str, str]:
+def find_records(query: str) -> List[Tuple[str, str]]:
+    """Find records whose text contains a query word or phrase.
+
+    Multi-word queries match as contiguous phrases within one field, e.g.
+    "barrier beach". Matching ignores case and punctuation.
+
+    Returns:
+        (collection, key) pairs in collection order
+    """
+    record_ids, keyword_index, bigram_index, record_texts = _build_keyword_index()
+    tokens = _tokenize(query)
+    if len(tokens) >= 2:
+        terms, index = [f"{a} {b}" for a, b in zip(tokens, tokens[1:])], bigram_index
+    else:
+        terms, index = tokens, keyword_index
+    if not terms:
+        return []
+
+    matches = set(index.get(terms[0], ()))
+    for term in terms[1:]:
+        matches.intersection_update(index.get(term, ()))
+    if len(tokens) > 2:
+        # Shared bigrams don't guarantee adjacency; confirm the whole phrase
+        phrase = f" {' '.join(tokens)} "
+        matches = {
+            record_id for record_id in matches
+            if any(phrase in text for text in record_texts[record_id])
+        }
+    return [record_ids[record_id] for record_id in sorted(matches)]
+
+
+def find_years(text: str) -> List[int]:
+    """Return the years (1500-2099) mentioned in text, in order."""
+    return [int(year) for year in _YEAR_RE.findall(text)]
+
+
+def find_proper_nouns(text: str) -> List[Tuple[str, Tuple[str, str]]]:
+    """Return (name, (collection, key)) for each known proper noun in text, in order."""
+    pattern = _build_proper_noun_re()
+    return [(match.group(1), PROPER_NOUNS[match.group(1)]) for match in pattern.finditer(text)]
+
+
+@functools.lru_cache(maxsize=32)
+def sightings(season: Optional[str] = None, category: Optional[str] = None) -> Tuple[str, ...]:
+    """Return bird/wildlife notes, optionally filtered by season and category."""
+    return tuple(
+        text
+        for row_season, row_category, text in zip(
+            SIGHTINGS_SOA["season"], SIGHTINGS_SOA["category"], SIGHTINGS_SOA["text"]
+        )
+        if (season is None or row_season == season) and (category is None or row_category == category)
+    )
+
+
+def find_species(name: str) -> List[Tuple[str, str]]:
+    """Return (season, category) pairs whose bird/wildlife notes mention a species.
+
+    Matches one or two words, singular or plural: "osprey", "Snowy Owls".
+    """
+    term = " ".join(_singular(token) for token in _tokenize(name)[-2:])
+    return sorted(_build_species_index().get(term, ()))
+
+
+@functools.lru_cache(maxsize=256)
+def best_match(query: str, cutoff: float = 0.6) -> Optional[str]:
+    """Return the place or business name closest to a (possibly misspelled) query.
+
+    e.g. "clam boxx" -> "The Clam Box", "crane estat" -> "Castle Hill and the Crane Estate"
+    """
+    query = query.lower().strip()
+    if query in _CATALOG_NAMES:
+        return _CATALOG_NAMES[query]
+
+    # Prefer a name that contains the query, then fall back to edit similarity
+    for lower_name, name in _CATALOG_NAMES.items():
+        if query and query in lower_name:
+            return name
+    matches = difflib.get_close_matches(query, _CATALOG_NAMES, n=1, cutoff=cutoff)
+    return _CATALOG_NAMES[matches[0]] if matches else None
+
+
+def nearest(lat: float, lon: float, k: int = 5) -> List[Tuple[str, float]]:
+    """Return the k geolocated places closest to a point as (name, distance km)."""
+    lat_rad = math.radians(lat)
+    cos_lat = math.cos(lat_rad)
+    distances = []
+    for name, place_lat, place_lon in zip(COORDS_KEYS, COORDS_LAT, COORDS_LON):
+        # Haversine
+        d_lat = math.radians(place_lat) - lat_rad
+        d_lon = math.radians(place_lon - lon)
+        a = math.sin(d_lat / 2) ** 2 + cos_lat * math.cos(math.radians(place_lat)) * math.sin(d_lon / 2) ** 2
+        distances.append((name, 2 * 6371.0 * math.asin(math.sqrt(a))))
+    return heapq.nsmallest(k, distances, key=lambda item: item[1])
+
+
+@functools.lru_cache(maxsize=32)
+def schools_for_grade(grade: int | str) -> Tuple[str, ...]:
+    """Return IPSWICH_SCHOOLS keys serving a grade (an int, "K" or "Pre-K")."""
+    if isinstance(grade, str):
+        grade = _grade_range(grade)[0]
+    bit = _grade_bit(grade)
+    return tuple(
+        key
+        for key, mask in zip(IPSWICH_SCHOOLS_SOA["key"], IPSWICH_SCHOOLS_SOA["grades_mask"])
+        if mask & bit
+    )
+
+
+def fish_in_season(day_of_year: int) -> Tuple[str, ...]:
+    """Return fish_species keys active in the river on a given day of year."""
+    return tuple(
+        key
+        for key, start, end in zip(FISH_KEYS, FISH_DOY_START, FISH_DOY_END)
+        if start <= day_of_year <= end
+    )
+
+
+def get_random_historical_fact() -> HistoricalFact:
     """Return a random historical fact."""
-    import random
     return random.choice(HISTORICAL_FACTS)
 
 
-def get_historical_facts_by_topic(topic: str) -> List[Dict[str, str]]:
+def get_fact(topic: str) -> HistoricalFact | None:
+    """Return the historical fact with a given topic (case-insensitive)."""
+    return FACTS_BY_TOPIC.get(topic.lower())
+
+
+@functools.lru_cache(maxsize=64)
+def get_historical_facts_by_topic(topic: str) -> Tuple[HistoricalFact, ...]:
     """Return historical facts matching a topic keyword."""
     topic_lower = topic.lower()
-    return [f for f in HISTORICAL_FACTS if topic_lower in f["topic"].lower()]
+    return tuple(fact for lower_topic, fact in FACTS_BY_TOPIC.items() if topic_lower in lower_topic)
 
 
-def build_knowledge_context(season: str) -> str:
+def build_knowledge_context(season: str, rotation_seed: Optional[int] = None) -> str:
     """
     Build a comprehensive knowledge context string for story generation.
 
     This provides the LLM with deep background on Ipswich for a given season.
+    The rotating picks (landmarks, history, figure, legend) are drawn from
+    rotation_seed, which defaults to today's date, so repeat calls on the same
+    day return the same cached text.
     """
-    all_locations = NEIGHBORHOODS + NATURAL_FEATURES
+    if rotation_seed is None:
+        rotation_seed = date.today().toordinal()
+    return _build_knowledge_context(season, rotation_seed)
+
+
+@functools.lru_cache(maxsize=64)
+def _build_knowledge_context(season: str, rotation_seed: int) -> str:
+    rng = random.Random(rotation_seed)
     seasonal_char = get_seasonal_character(season)
     wildlife = get_seasonal_wildlife(season)
 
@@ -1454,10 +2197,11 @@ def build_knowledge_context(season: str) -> str:
 
     # Key locations with seasonal notes
     context_parts.append("\n## Notable Places")
-    for loc in all_locations[:12]:  # Increased limit for richer context
-        seasonal_note = loc.seasonal_notes.get(season.lower(), "")
-        context_parts.append(f"- **{loc.name}**: {loc.description[:200]}... "
-                           f"In {season}: {seasonal_note}")
+    season_key = season.upper()
+    season_notes = SEASONAL_NOTES[Season[season_key]] if season_key in Season.__members__ else ()
+    for i, place_line in enumerate(_NOTABLE_PLACE_LINES):
+        seasonal_note = season_notes[i] if season_notes else ""
+        context_parts.append(f"{place_line}In {season}: {seasonal_note}")
 
     # Wildlife
     context_parts.append("\n## Wildlife This Season")
@@ -1471,7 +2215,7 @@ def build_knowledge_context(season: str) -> str:
         context_parts.append("\n## Birds This Season")
         # Pick a few from each category
         for category, items in birds.items():
-            if isinstance(items, list) and items:
+            if isinstance(items, tuple) and items:
                 context_parts.append(f"- {items[0]}")  # First item from each category
         if "year_round_notes" in birds:
             context_parts.append(f"- {birds['year_round_notes']}")
@@ -1503,32 +2247,27 @@ def build_knowledge_context(season: str) -> str:
 
     # Local landmarks and businesses (rotating selection)
     context_parts.append("\n## Local Landmarks")
-    import random
-    businesses = list(LOCAL_BUSINESSES.values())
-    random.shuffle(businesses)
-    for biz in businesses[:3]:
-        context_parts.append(f"- **{biz['name']}** ({biz.get('address', '')}): {biz.get('description', '')[:100]}...")
+    businesses = tuple(LOCAL_BUSINESSES.values())
+    for biz in rng.sample(businesses, min(3, len(businesses))):
+        context_parts.append(f"- **{biz.name}** ({biz.address}): {biz.description[:100]}...")
 
     # Historical threads (expanded)
     context_parts.append("\n## Historical Threads")
-    random.shuffle(HISTORICAL_FACTS)
-    for fact in HISTORICAL_FACTS[:5]:
-        context_parts.append(f"- **{fact['topic']}**: {fact['content'][:150]}...")
+    for fact in rng.sample(HISTORICAL_FACTS, min(5, len(HISTORICAL_FACTS))):
+        context_parts.append(f"- **{fact.topic}**: {fact.content[:150]}...")
 
     # Add a historical figure or legend for narrative richness
-    figures = list(HISTORICAL_FIGURES.values())
-    random.shuffle(figures)
+    figures = tuple(HISTORICAL_FIGURES.values())
     if figures:
-        fig = figures[0]
-        context_parts.append(f"\n## Historical Figure: {fig['name']}")
-        context_parts.append(f"{fig.get('story', '')[:300]}...")
+        fig = rng.choice(figures)
+        context_parts.append(f"\n## Historical Figure: {fig.name}")
+        context_parts.append(f"{fig.story[:300]}...")
 
     # Add a local legend occasionally
-    legends = list(LOCAL_LEGENDS.values())
-    random.shuffle(legends)
-    if legends and random.random() > 0.5:  # 50% chance to include a legend
-        leg = legends[0]
-        context_parts.append(f"\n## Local Legend: {leg['name']}")
-        context_parts.append(f"{leg.get('story', '')[:250]}...")
+    legends = tuple(LOCAL_LEGENDS.values())
+    if legends and rng.random() > 0.5:  # 50% chance to include a legend
+        leg = rng.choice(legends)
+        context_parts.append(f"\n## Local Legend: {leg.name}")
+        context_parts.append(f"{leg.story[:250]}...")
 
     return "\n".join(context_parts)
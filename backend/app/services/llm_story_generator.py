@@ -5,14 +5,15 @@ This generator uses Claude to produce contemplative, literary stories
 in the tradition of classic New England nature writing.
 """
 
+import asyncio
 import logging
 import re
 from typing import Protocol, Tuple, List, Optional
-import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 import httpx
 
+from app.core.config import get_settings
 from app.services.ipswich_knowledge import (
     build_knowledge_context,
     get_seasonal_wildlife,
@@ -22,6 +23,7 @@ from app.services.ipswich_knowledge import (
     HISTORICAL_FACTS,
 )
 from app.services.additional_sources import gather_additional_context
+from app.services.environmental.base import get_http_client
 from app.services.environmental.aggregator import (
     gather_environmental_context,
     format_environmental_context,
@@ -30,14 +32,14 @@ from app.services.environmental.aggregator import (
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NewsItem:
     """Simplified news item for story generation."""
     headline: str
     summary: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RecentStory:
     """Summary of a recent story for anti-repetition."""
     date: str
@@ -46,7 +48,7 @@ class RecentStory:
     key_phrases: List[str]  # Distinctive phrases to avoid
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StoryInput:
     """All inputs needed for story generation."""
     date: str
@@ -60,8 +62,8 @@ class StoryInput:
     tide_state: str
     tide_height: Optional[float]
     news_items: List[NewsItem]
-    recent_stories: List[RecentStory] = None
-    banned_phrases: List[str] = None  # Explicit phrases to never use
+    recent_stories: List[RecentStory] = field(default_factory=list)
+    banned_phrases: List[str] = field(default_factory=list)  # Explicit phrases to never use
 
 
 # =============================================================================
@@ -222,6 +224,20 @@ BODY:
 IMPORTANT: The title must be YOUR OWN creative title, NOT the news headline or any part of it."""
 
 
+# Story generation can take most of a minute
+LLM_TIMEOUT = 60.0
+
+# The usual response shape: a TITLE line, optional blank lines, then a BODY
+# line followed by the story. Labels may be bolded ("**TITLE:**") or any case.
+_RESPONSE_RE = re.compile(
+    r"\s*((?:TITLE:|\*\*TITLE)[^\n]*)\n\s*(?:BODY:|\*\*BODY)[^\n]*\n(.*)",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Sentence boundary: whitespace following terminal punctuation
+_SENTENCE_BREAK_RE = re.compile(r"(?<=[.!?])\s+")
+
+
 class LLMStoryGenerator:
     """
     Story generator that uses Claude to produce literary narratives
@@ -268,23 +284,27 @@ class LLMStoryGenerator:
         knowledge_context = build_knowledge_context(story_input.season)
 
         # Gather additional live data (bird sightings, river conditions, etc.)
-        try:
-            additional_context = await gather_additional_context(ebird_api_key)
-            if additional_context:
-                knowledge_context += "\n\n" + additional_context
-        except Exception as e:
-            logger.warning(f"Failed to gather additional context: {e}")
+        # and environmental context (ocean, atmosphere, land, astronomy)
+        # concurrently; the two share no data
+        additional_context, env_context = await asyncio.gather(
+            gather_additional_context(ebird_api_key),
+            gather_environmental_context(airnow_api_key=airnow_api_key),
+            return_exceptions=True,
+        )
+
+        if isinstance(additional_context, BaseException):
+            logger.warning(f"Failed to gather additional context: {additional_context}")
+        elif additional_context:
+            knowledge_context = f"{knowledge_context}\n\n{additional_context}"
 
-        # Gather environmental context (ocean, atmosphere, land, astronomy)
         ocean_conditions = ""
         atmosphere_conditions = ""
         land_conditions = ""
         astronomy_conditions = ""
 
         try:
-            env_context = await gather_environmental_context(
-                airnow_api_key=airnow_api_key,
-            )
+            if isinstance(env_context, BaseException):
+                raise env_context
 
             # Format ocean conditions
             ocean_parts = []
@@ -369,10 +389,10 @@ class LLMStoryGenerator:
 
         # Format recent stories section
         if story_input.recent_stories:
-            recent_lines = []
-            for story in story_input.recent_stories:
-                recent_lines.append(f"- **{story.date}** \"{story.title}\": {story.opening_lines}")
-            recent_stories_section = "\n".join(recent_lines)
+            recent_stories_section = "\n".join([
+                f"- **{story.date}** \"{story.title}\": {story.opening_lines}"
+                for story in story_input.recent_stories
+            ])
         else:
             recent_stories_section = "(No recent stories - this is the first chapter)"
 
@@ -411,31 +431,31 @@ class LLMStoryGenerator:
 
         # Call the API
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(
-                    self.api_url,
-                    headers={
-                        "x-api-key": self.api_key,
-                        "anthropic-version": "2023-06-01",
-                        "content-type": "application/json",
-                    },
-                    json={
-                        "model": self.model,
-                        "max_tokens": self.max_tokens,
-                        "system": SYSTEM_PROMPT,
-                        "messages": [
-                            {"role": "user", "content": user_prompt}
-                        ],
-                    },
-                )
-                response.raise_for_status()
-                result = response.json()
+            response = await get_http_client().post(
+                self.api_url,
+                headers={
+                    "x-api-key": self.api_key,
+                    "anthropic-version": "2023-06-01",
+                    "content-type": "application/json",
+                },
+                json={
+                    "model": self.model,
+                    "max_tokens": self.max_tokens,
+                    "system": SYSTEM_PROMPT,
+                    "messages": [
+                        {"role": "user", "content": user_prompt}
+                    ],
+                },
+                timeout=LLM_TIMEOUT,
+            )
+            response.raise_for_status()
+            result = response.json()
 
-                # Extract the text content
-                content = result["content"][0]["text"]
+            # Extract the text content
+            content = result["content"][0]["text"]
 
-                # Parse title and body
-                return self._parse_response(content)
+            # Parse title and body
+            return self._parse_response(content)
 
         except httpx.HTTPStatusError as e:
             logger.error(f"HTTP error calling LLM API: {e}")
@@ -451,6 +471,13 @@ class LLMStoryGenerator:
     def _parse_response(self, content: str) -> Tuple[str, str]:
         """Parse the LLM response into title and body."""
         logger.info(f"Parsing LLM response, first 500 chars: {content[:500]}")
+        match = _RESPONSE_RE.match(content)
+        if match and match.group(2).strip():
+            title = match.group(1).split(":", 1)[-1].strip().strip("*").strip()
+            body = match.group(2).strip()
+            logger.info(f"Final title: {title}, body length: {len(body)}")
+            return title, body
+
         lines = content.strip().split("\n")
 
         title = "A Day in Ipswich"
@@ -580,8 +607,9 @@ class LLMStoryGeneratorWithFallback:
 
                 if recent_chapters:
                     for ch in recent_chapters[:5]:  # Last 5 stories
-                        # Get first 2-3 sentences for opening context
-                        sentences = re.split(r'(?<=[.!?])\s+', ch.body.strip()) if ch.body else []
+                        # Get first 2-3 sentences for opening context; stop
+                        # splitting once those are found
+                        sentences = _SENTENCE_BREAK_RE.split(ch.body.strip(), maxsplit=3) if ch.body else []
                         opening_lines = ' '.join(sentences[:3])[:300] if sentences else ""
 
                         # Extract key phrases from full body
@@ -618,14 +646,12 @@ class LLMStoryGeneratorWithFallback:
                     banned_phrases=unique_banned,
                 )
 
-                # Get API keys from environment
-                ebird_api_key = os.environ.get("EBIRD_API_KEY")
-                airnow_api_key = os.environ.get("AIRNOW_API_KEY")
-
+                # API keys come from the cached settings (read from the environment once)
+                settings = get_settings()
                 title, body = await self.llm_generator.generate(
                     story_input,
-                    ebird_api_key=ebird_api_key,
-                    airnow_api_key=airnow_api_key,
+                    ebird_api_key=settings.ebird_api_key,
+                    airnow_api_key=settings.airnow_api_key,
                 )
                 logger.info("Story generated successfully with LLM")
                 return title, body
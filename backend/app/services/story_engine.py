@@ -6,6 +6,8 @@ When an Anthropic API key is configured, it uses Claude for literary story gener
 in the tradition of classic New England nature writing.
 """
 
+import asyncio
+import inspect
 import random
 from datetime import date
 from typing import Optional, Protocol
@@ -23,6 +25,24 @@ from app.services.ipswich_knowledge import (
     get_seasonal_character,
 )
 
+# Substrings of a weather condition and the template key they map to, checked in order
+_WEATHER_KEY_TABLE: tuple[tuple[str, str], ...] = (
+    ("clear", "Clear"),
+    ("sunny", "Clear"),
+    ("clouds", "Clouds"),
+    ("overcast", "Clouds"),
+    ("partly", "Clouds"),
+    ("rain", "Rain"),
+    ("drizzle", "Rain"),
+    ("shower", "Rain"),
+    ("snow", "Snow"),
+    ("flurr", "Snow"),
+    ("thunderstorm", "Rain"),
+    ("fog", "Fog"),
+    ("mist", "Fog"),
+    ("haze", "Fog"),
+)
+
 
 class StoryGenerator(Protocol):
     """Protocol for story generation implementations."""
@@ -50,7 +70,7 @@ class TemplateStoryGenerator:
 
     # Openings grounded in specific Ipswich locations and seasonal character
     SEASONAL_OPENINGS = {
-        "Winter": [
+        "Winter": (
             "The cold settled over the Great Marsh this morning, "
             "turning the spartina to silver and the tidal creeks to dark mirrors beneath a skin of ice.",
             "Frost etched patterns on the diamond-paned windows along High Street, "
@@ -61,8 +81,8 @@ class TemplateStoryGenerator:
             "white against the gray, the Grand Allee a sweep of dormant grass descending to the frozen marsh.",
             "The bare branches of the elms at Lord Square traced their patient calligraphy "
             "against skies the color of old pewter.",
-        ],
-        "Spring": [
+        ),
+        "Spring": (
             "The first warmth crept through Ipswich, and at the Choate Bridge—that twin-arched "
             "stone passage built in 1764—the river ran high with snowmelt and the promise of alewives.",
             "Mud season arrived with its particular poetry. Along Argilla Road, "
@@ -74,8 +94,8 @@ class TemplateStoryGenerator:
             "those weathered sentinels that have watched generations pass.",
             "At Appleton Farms, the oldest continuously operating farm in America, "
             "the pastures greened and the cattle moved slowly through morning mist.",
-        ],
-        "Summer": [
+        ),
+        "Summer": (
             "The sun hung generous over Crane Beach, blessing the dunes with golden light. "
             "The barrier beach stretched for miles, its white sand and cold Atlantic waters "
             "drawing thousands to this preserved shore.",
@@ -89,8 +109,8 @@ class TemplateStoryGenerator:
             "At Castle Hill, picnickers spread blankets on the lawn for the evening concert, "
             "the Stuart-style Great House rising behind them, a monument to a Chicago fortune "
             "spent in love of this coast.",
-        ],
-        "Autumn": [
+        ),
+        "Autumn": (
             "The maples blazed their brief glory along County Road, and in Willowdale State Forest, "
             "the hardwoods burned crimson and gold against the dark evergreens.",
             "Autumn came to Ipswich carrying the scent of fallen leaves and wood smoke. "
@@ -101,73 +121,73 @@ class TemplateStoryGenerator:
             "the beaches were empty; Ipswich belonged again to those who stay.",
             "In Linebrook, the orchards bent with fruit, and the sweet smell of cider "
             "drifted across the farmland that has fed this town for centuries.",
-        ],
+        ),
     }
 
     # Weather fragments with New England literary sensibility
     WEATHER_FRAGMENTS = {
-        "Clear": [
+        "Clear": (
             "Under a sky of extraordinary clarity, the town went about its rhythms, "
             "each familiar errand touched by uncommon light.",
             "The air held that particular New England clarity that makes distances seem "
             "negotiable and time less urgent.",
-        ],
-        "Clouds": [
+        ),
+        "Clouds": (
             "Clouds gathered like thoughts above the rooftops, promising nothing, "
             "withholding nothing.",
             "A canopy of gray settled over the town, softening the edges of things, "
             "inviting contemplation.",
-        ],
-        "Rain": [
+        ),
+        "Rain": (
             "The rain fell steady, drumming its ancient rhythm on the marshes, "
             "filling the creeks, darkening the old clapboards.",
             "Rain traced its patient calligraphy on the windows of the First Church, "
             "that white-spired sentinel watching over the green.",
-        ],
-        "Snow": [
+        ),
+        "Snow": (
             "Snow transformed familiar streets into something from a story older than memory, "
             "the town hushed beneath its white quilt.",
             "The snow fell thick over Ipswich, softening the rooflines of the ancient houses, "
             "filling the cart paths of old.",
-        ],
-        "Fog": [
+        ),
+        "Fog": (
             "Fog drifted in from Ipswich Bay, wrapping the town in the sea's own mystery, "
             "muffling sound, dissolving distances.",
             "The morning fog rose from the river like departed spirits, "
             "and the town emerged slowly, piece by piece, from the gray.",
-        ],
+        ),
     }
 
     # Tide fragments with ecological awareness
     TIDE_FRAGMENTS = {
-        "high": [
+        "high": (
             "At high tide, the marsh became a mirror reflecting sky, "
             "the land and water indistinguishable at their margins.",
             "The tide stood full in the creeks, and the boats at the town landing "
             "rode high on their painters, patient as the herons.",
-        ],
-        "low": [
+        ),
+        "low": (
             "The low tide revealed the marsh's secret geography—mudflats, channels, "
             "the patient architecture of fiddler crab burrows.",
             "With the tide out, clammers waded the flats off Jeffrey's Neck, "
             "raking the mud as generations have, harvesting the marsh's quiet bounty.",
-        ],
-        "rising": [
+        ),
+        "rising": (
             "The tide crept in through the maze of creeks, filling channels, "
             "lifting eelgrass, returning the marsh to the sea's dominion.",
             "As the tide rose, the great blue herons retreated to higher ground, "
             "their patience infinite but their limits known.",
-        ],
-        "falling": [
+        ),
+        "falling": (
             "As the tide ebbed, the marsh revealed itself—mudflats gleaming, "
             "creeks narrowing, the land asserting its temporary claim.",
             "The falling tide drew the water down the creeks toward the sound, "
             "and shorebirds arrived to probe the exposed flats.",
-        ],
+        ),
     }
 
     # Middle sections connecting to Ipswich history and character
-    MIDDLE_SECTIONS = [
+    MIDDLE_SECTIONS = (
         "Near the Choate Bridge, where the oldest stone arches in America have carried "
         "travelers across the Ipswich River since 1764, history felt close enough to touch.",
         "Along the Riverwalk, where willows dip their branches toward the tidal estuary, "
@@ -182,10 +202,10 @@ class TemplateStoryGenerator:
         "rolled over the Choate Bridge.",
         "At Heard's Village, where the mill workers once lived in the era of Ipswich lace, "
         "the brick buildings kept their own memories of looms and labor.",
-    ]
+    )
 
     # Endings with the contemplative quality of New England nature writing
-    ENDINGS = [
+    ENDINGS = (
         "And so the day turned toward evening, the light slanting low across the marsh, "
         "the town settling into the rhythms that have sustained it for nearly four hundred years.",
         "Tomorrow would come as it always had, carrying its own weather and tides, "
@@ -196,10 +216,10 @@ class TemplateStoryGenerator:
         "in houses that have sheltered such lights for generations.",
         "Night came to Ipswich as it comes to all New England towns: slowly in summer, "
         "swiftly in winter, but always with that particular quality of ending that is also beginning.",
-    ]
+    )
 
     # News integration with literary sensibility
-    NEWS_TEMPLATES = [
+    NEWS_TEMPLATES = (
         "The town turned its attention to {topic}—the daily news woven into the larger fabric "
         "of coastal life, another thread in the ongoing story.",
         "Word traveled through the village of {topic}, carried from porch to porch, "
@@ -208,7 +228,28 @@ class TemplateStoryGenerator:
         "between the larger rhythms of tide and season.",
         "The community took note: {topic}. In Ipswich, news has always moved at the pace "
         "of people meeting on sidewalks, pausing to talk.",
-    ]
+    )
+
+    # Titles: Ipswich places first, then seasonal; placeholders are filled per story
+    TITLE_TEMPLATES = (
+        "From Castle Hill",
+        "The Great Marsh at {tide}",
+        "Along the Riverwalk",
+        "High Street in {season}",
+        "Crane Beach",
+        "Where River Meets Sea",
+        "Appleton Farms",
+        "The Choate Bridge",
+        "A {day_of_week} in {month_name}",
+        "{season} Light on the Marsh",
+        "{month_name} Morning",
+        "Under {season} Skies",
+        "The {tide_title} Tide",
+    )
+
+    def __init__(self):
+        # Per-instance generator, so template picks don't share the global random state
+        self._rng = random.Random()
 
     async def generate(self, context: StoryContext) -> tuple[str, str]:
         """Generate a story using templates and deep Ipswich knowledge."""
@@ -219,26 +260,26 @@ class TemplateStoryGenerator:
         season_openings = self.SEASONAL_OPENINGS.get(
             season, self.SEASONAL_OPENINGS["Summer"]
         )
-        parts.append(random.choice(season_openings))
+        parts.append(self._rng.choice(season_openings))
 
         # Weather influence
         weather_key = self._get_weather_key(context.weather.condition)
-        weather_fragments = self.WEATHER_FRAGMENTS.get(weather_key, [])
+        weather_fragments = self.WEATHER_FRAGMENTS.get(weather_key, ())
         if weather_fragments:
-            parts.append(random.choice(weather_fragments))
+            parts.append(self._rng.choice(weather_fragments))
 
         # Tide state with ecological awareness
-        tide_fragments = self.TIDE_FRAGMENTS.get(context.tide.state, [])
+        tide_fragments = self.TIDE_FRAGMENTS.get(context.tide.state, ())
         if tide_fragments:
-            parts.append(random.choice(tide_fragments))
+            parts.append(self._rng.choice(tide_fragments))
 
         # Add seasonal wildlife observation
         wildlife = get_seasonal_wildlife(season)
         if wildlife:
-            parts.append(random.choice(wildlife))
+            parts.append(self._rng.choice(wildlife))
 
         # Middle section connecting to history
-        parts.append(random.choice(self.MIDDLE_SECTIONS))
+        parts.append(self._rng.choice(self.MIDDLE_SECTIONS))
 
         # Weave in news items if present
         if context.news_items:
@@ -246,7 +287,7 @@ class TemplateStoryGenerator:
             parts.append(news_section)
 
         # Contemplative ending
-        parts.append(random.choice(self.ENDINGS))
+        parts.append(self._rng.choice(self.ENDINGS))
 
         body = "\n\n".join(parts)
         title = self._generate_title(context)
@@ -259,24 +300,7 @@ class TemplateStoryGenerator:
             return "Clear"
 
         condition_lower = condition.lower()
-        mappings = {
-            "clear": "Clear",
-            "sunny": "Clear",
-            "clouds": "Clouds",
-            "overcast": "Clouds",
-            "partly": "Clouds",
-            "rain": "Rain",
-            "drizzle": "Rain",
-            "shower": "Rain",
-            "snow": "Snow",
-            "flurr": "Snow",
-            "thunderstorm": "Rain",
-            "fog": "Fog",
-            "mist": "Fog",
-            "haze": "Fog",
-        }
-
-        for key, value in mappings.items():
+        for key, value in _WEATHER_KEY_TABLE:
             if key in condition_lower:
                 return value
 
@@ -293,51 +317,50 @@ class TemplateStoryGenerator:
             headline = news.headline.rstrip(".")
 
             if i == 0:
-                template = random.choice(self.NEWS_TEMPLATES)
+                template = self._rng.choice(self.NEWS_TEMPLATES)
                 fragments.append(template.format(topic=headline.lower()))
             else:
                 secondary = [
                     f"There was also talk of {headline.lower()}—another strand in the day's weaving.",
                     f"And {headline.lower()}, a note in the ongoing conversation of community.",
                 ]
-                fragments.append(random.choice(secondary))
+                fragments.append(self._rng.choice(secondary))
 
         return " ".join(fragments)
 
     def _generate_title(self, context: StoryContext) -> str:
         """Generate a title in keeping with the literary tone."""
         # Never use news headlines as titles - always use evocative literary titles
-
-        # Ipswich-specific titles
-        location_titles = [
-            "From Castle Hill",
-            "The Great Marsh at {tide}",
-            "Along the Riverwalk",
-            "High Street in {season}",
-            "Crane Beach",
-            "Where River Meets Sea",
-            "Appleton Farms",
-            "The Choate Bridge",
-        ]
-
-        seasonal_titles = [
-            f"A {context.season.day_of_week} in {context.season.month_name}",
-            f"{context.season.season} Light on the Marsh",
-            f"{context.season.month_name} Morning",
-            f"Under {context.season.season} Skies",
-            f"The {context.tide.state.title()} Tide",
-        ]
-
-        all_titles = location_titles + seasonal_titles
-        title = random.choice(all_titles)
+        title = self._rng.choice(self.TITLE_TEMPLATES)
+        if "{" not in title:
+            return title
 
         # Replace placeholders
-        title = title.format(
+        return title.format(
             tide=context.tide.state,
-            season=context.season.season
+            tide_title=context.tide.state.title(),
+            season=context.season.season,
+            month_name=context.season.month_name,
+            day_of_week=context.season.day_of_week,
         )
 
-        return title
+# Stories generated at once by StoryEngine.generate_stories_for_dates; keeps a
+# long LLM backfill from opening hundreds of requests against the shared pool
+BATCH_GENERATION_CONCURRENCY = 4
+
+
+def _news_item_ids(context: StoryContext) -> Optional[list[int]]:
+    """IDs of the news items woven into a story, or None if there were none."""
+    return [n.id for n in context.news_items] if context.news_items else None
+
+
+def _accepts_recent_chapters(generator) -> bool:
+    """Whether a generator's generate() takes a recent_chapters argument."""
+    try:
+        return "recent_chapters" in inspect.signature(generator.generate).parameters
+    except (AttributeError, TypeError, ValueError):
+        # No generate(), or a callable whose signature can't be inspected
+        return False
 
 
 class StoryEngine:
@@ -357,6 +380,8 @@ class StoryEngine:
         """
         self.db = db
         self.generator = generator or TemplateStoryGenerator()
+        # Whether the generator accepts recent chapters for anti-repetition
+        self._generator_takes_recent = _accepts_recent_chapters(self.generator)
 
     async def generate_story_for_date(
         self,
@@ -374,60 +399,130 @@ class StoryEngine:
         Returns:
             The created or updated StoryChapter
         """
-        # Check for existing chapter
-        existing = await self._get_existing_chapter(target_date)
+        # Fetch recent chapters for anti-repetition. Chapter dates are unique,
+        # so when the target date falls within this window (the usual case of
+        # generating today's chapter) the same rows answer whether it exists.
+        recent_chapters = await self._get_recent_chapters(limit=5)
+        existing = next(
+            (ch for ch in recent_chapters if ch.chapter_date == target_date), None
+        )
+        if (
+            existing is None
+            and len(recent_chapters) == 5
+            and target_date < recent_chapters[-1].chapter_date
+        ):
+            # Older date than the window covers; look it up directly
+            existing = await self._get_existing_chapter(target_date)
         if existing and not force_regenerate:
             return existing
 
-        # Fetch recent chapters for anti-repetition
-        recent_chapters = await self._get_recent_chapters(limit=5)
-
         # Generate the story (pass recent chapters if generator supports it)
-        if hasattr(self.generator, 'generate') and 'recent_chapters' in str(self.generator.generate.__code__.co_varnames):
-            title, body = await self.generator.generate(context, recent_chapters=recent_chapters)
-        else:
-            title, body = await self.generator.generate(context)
-
-        # Create weather summary
-        weather_summary = context.weather.summary
-
-        # Get news item IDs
-        used_news_item_ids = (
-            [n.id for n in context.news_items] if context.news_items else None
-        )
+        title, body = await self._generate(context, recent_chapters)
 
         if existing and force_regenerate:
             # Update existing chapter
-            existing.title = title
-            existing.body = body
-            existing.weather_summary = weather_summary
-            existing.tide_state = context.tide.state
-            existing.season = context.season.season
-            existing.month_name = context.season.month_name
-            existing.day_of_week = context.season.day_of_week
-            existing.used_news_item_ids = used_news_item_ids
-            existing.generation_context = context.model_dump(mode="json")
+            self._fill_chapter(existing, context, title, body)
             await self.db.flush()
             return existing
 
         # Create new chapter
-        chapter = StoryChapter(
-            chapter_date=target_date,
-            title=title,
-            body=body,
-            weather_summary=weather_summary,
-            tide_state=context.tide.state,
-            season=context.season.season,
-            month_name=context.season.month_name,
-            day_of_week=context.season.day_of_week,
-            used_news_item_ids=used_news_item_ids,
-            generation_context=context.model_dump(mode="json"),
+        chapter = self._fill_chapter(
+            StoryChapter(chapter_date=target_date), context, title, body
         )
-
         self.db.add(chapter)
         await self.db.flush()
         return chapter
 
+    async def generate_stories_for_dates(
+        self,
+        contexts: list[tuple[StoryContext, date]],
+        force_regenerate: bool = False,
+    ) -> list[StoryChapter]:
+        """Generate and store chapters for several dates at once (backfills).
+
+        Existing chapters are looked up in one query. Stories are generated
+        in date order, at most BATCH_GENERATION_CONCURRENCY at a time, and
+        each group joins the anti-repetition window seen by the next one.
+        New chapters are inserted with a single flush at the end.
+
+        Args:
+            contexts: (context, target_date) pairs, one per chapter
+            force_regenerate: If True, regenerate chapters that already exist
+
+        Returns:
+            The chapters in the same order as contexts
+        """
+        if not contexts:
+            return []
+
+        result = await self.db.execute(
+            select(StoryChapter).where(
+                StoryChapter.chapter_date.in_([d for _, d in contexts])
+            )
+        )
+        by_date = {ch.chapter_date: ch for ch in result.scalars()}
+
+        # First context wins if a date is listed twice
+        pending: dict[date, StoryContext] = {}
+        for ctx, d in contexts:
+            if force_regenerate or d not in by_date:
+                pending.setdefault(d, ctx)
+
+        if pending:
+            recent_chapters = (
+                await self._get_recent_chapters(limit=5)
+                if self._generator_takes_recent else []
+            )
+            new_chapters = []
+            dates = sorted(pending)
+            for start in range(0, len(dates), BATCH_GENERATION_CONCURRENCY):
+                group = dates[start:start + BATCH_GENERATION_CONCURRENCY]
+                stories = await asyncio.gather(*(
+                    self._generate(pending[d], recent_chapters) for d in group
+                ))
+
+                written = []
+                for d, (title, body) in zip(group, stories):
+                    chapter = by_date.get(d)
+                    if chapter is None:
+                        chapter = by_date[d] = StoryChapter(chapter_date=d)
+                        new_chapters.append(chapter)
+                    written.append(self._fill_chapter(chapter, pending[d], title, body))
+
+                # The chapters just written are the freshest ones to avoid repeating
+                written.reverse()
+                recent_chapters = (
+                    written + [ch for ch in recent_chapters if ch not in written]
+                )[:5]
+
+            self.db.add_all(new_chapters)
+            await self.db.flush()
+
+        return [by_date[d] for _, d in contexts]
+
+    async def _generate(
+        self, context: StoryContext, recent_chapters: list[StoryChapter]
+    ) -> tuple[str, str]:
+        """Run the generator, passing recent chapters if it accepts them."""
+        if self._generator_takes_recent:
+            return await self.generator.generate(context, recent_chapters=recent_chapters)
+        return await self.generator.generate(context)
+
+    def _fill_chapter(
+        self, chapter: StoryChapter, context: StoryContext, title: str, body: str
+    ) -> StoryChapter:
+        """Set a chapter's story and context fields from a generated story."""
+        chapter.title = title
+        chapter.body = body
+        chapter.weather_summary = context.weather.summary
+        chapter.tide_state = context.tide.state
+        chapter.season = context.season.season
+        chapter.month_name = context.season.month_name
+        chapter.day_of_week = context.season.day_of_week
+        chapter.used_news_item_ids = _news_item_ids(context)
+        chapter.generation_context = context.model_dump(mode="json")
+        return chapter
+
     async def _get_existing_chapter(
         self, target_date: date
     ) -> Optional[StoryChapter]:
@@ -9,10 +9,17 @@ import httpx
 
 from app.core.config import get_settings
 from app.schemas.story import TideContext
+from app.services.environmental.base import async_ttl_cache, get_http_client
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# NOAA predictions for a given date are fixed; refresh a few times a day anyway
+TIDE_CACHE_TTL = 6 * 3600
+# Empty or failed fetches are remembered briefly so an outage doesn't cost
+# a 10s NOAA timeout on every call
+TIDE_NEGATIVE_CACHE_TTL = 60
+
 
 class TideService:
     """Service for tide information for Ipswich Bay area.
@@ -35,72 +42,74 @@ class TideService:
         # Fall back to simulated tides
         return self._simulate_tide(target_date)
 
+    @async_ttl_cache(TIDE_CACHE_TTL, cache_if=bool, negative_ttl=TIDE_NEGATIVE_CACHE_TTL)
+    async def _get_predictions(self, station_id: str, target_date: date) -> list[dict]:
+        """Fetch the high/low tide predictions for a station and date from NOAA.
+
+        Predictions for a date never change, so they are cached across
+        service instances; the state relative to now is derived per call.
+        The station is an argument so it is part of the cache key.
+
+        Returns:
+            NOAA prediction records, empty if none or the request failed
+        """
+        begin_date = target_date.strftime("%Y%m%d")
+        end_date = (target_date + timedelta(days=1)).strftime("%Y%m%d")
+
+        # Shared pooled client keeps the NOAA connection alive between calls
+        try:
+            response = await get_http_client().get(
+                self.base_url,
+                params={
+                    "begin_date": begin_date,
+                    "end_date": end_date,
+                    "station": station_id,
+                    "product": "predictions",
+                    "datum": "MLLW",
+                    "units": "english",
+                    "time_zone": "lst_ldt",
+                    "format": "json",
+                    "interval": "hilo",
+                },
+                timeout=10.0,
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.warning(f"Failed to fetch tide data: {e}")
+            return []
+        return response.json().get("predictions", [])
+
     async def _fetch_tide_predictions(self, target_date: date) -> Optional[TideContext]:
         """Fetch tide predictions from NOAA API."""
         try:
-            begin_date = target_date.strftime("%Y%m%d")
-            end_date = (target_date + timedelta(days=1)).strftime("%Y%m%d")
-
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    self.base_url,
-                    params={
-                        "begin_date": begin_date,
-                        "end_date": end_date,
-                        "station": self.station_id,
-                        "product": "predictions",
-                        "datum": "MLLW",
-                        "units": "english",
-                        "time_zone": "lst_ldt",
-                        "format": "json",
-                        "interval": "hilo",
-                    },
-                    timeout=10.0,
-                )
-                response.raise_for_status()
-                data = response.json()
-
-            predictions = data.get("predictions", [])
+            predictions = await self._get_predictions(self.station_id, target_date)
             if not predictions:
                 return None
 
-            # Find the most relevant tide event
+            # Find the tide event closest to the current time. NOAA's
+            # "YYYY-MM-DD HH:MM" stamps are parsed once each, with
+            # fromisoformat (much cheaper than strptime).
             now = datetime.now()
-            current_time = now.time()
-
-            # Find closest tide event to current time
-            closest_event = None
-            min_diff = float("inf")
-
-            for pred in predictions:
-                pred_time = datetime.strptime(pred["t"], "%Y-%m-%d %H:%M")
-                diff = abs((pred_time - now).total_seconds())
-                if diff < min_diff:
-                    min_diff = diff
-                    closest_event = pred
-
-            if closest_event:
-                tide_type = closest_event.get("type", "").upper()
-                height = float(closest_event.get("v", 0))
-                event_time = datetime.strptime(closest_event["t"], "%Y-%m-%d %H:%M")
-
-                # Determine state based on whether we're before or after the event
-                if event_time > now:
-                    state = "rising" if tide_type == "H" else "falling"
-                else:
-                    state = "falling" if tide_type == "H" else "rising"
-
-                return TideContext(
-                    state=state,
-                    time_of_next=event_time,
-                    height=height,
-                )
-
-            return None
+            event_time, closest_event = min(
+                ((datetime.fromisoformat(pred["t"]), pred) for pred in predictions),
+                key=lambda event: abs(event[0] - now),
+            )
+
+            tide_type = closest_event.get("type", "").upper()
+            height = float(closest_event.get("v", 0))
+
+            # Determine state based on whether we're before or after the event
+            if event_time > now:
+                state = "rising" if tide_type == "H" else "falling"
+            else:
+                state = "falling" if tide_type == "H" else "rising"
+
+            return TideContext(
+                state=state,
+                time_of_next=event_time,
+                height=height,
+            )
 
-        except httpx.HTTPError as e:
-            logger.warning(f"Failed to fetch tide data: {e}")
-            return None
         except Exception as e:
             logger.warning(f"Error processing tide data: {e}")
             return None
@@ -0,0 +1,520 @@
+"""Tests for environmental services and their API schemas."""
+
+import math
+import time
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional
+
+import httpx
+import pytest
+
+from app.schemas.environmental import environmental_context_to_schema
+from app.services.environmental import base, land_services
+from app.services.environmental.aggregator import EnvironmentalContext
+from app.services.environmental.base import (
+    ERDDAPClient,
+    PersistentCache,
+    ResponseTooLargeError,
+    async_ttl_cache,
+    clear_ttl_cache,
+    degrees_to_compass,
+    fetch_limited_text,
+    parse_griddap_csv,
+    persistent_daily_cache,
+)
+from app.services.environmental.land_services import (
+    DroughtContext,
+    DroughtMonitorService,
+    _parse_drought_record,
+    _parse_map_date,
+)
+from app.services.environmental.ocean_services import (
+    HABContext,
+    HABForecastService,
+    OceanColorContext,
+    SeaSurfaceTempContext,
+    WaveContext,
+)
+
+
+class TestEnvironmentalSchema:
+    """Tests for converting environmental contexts to API schemas."""
+
+    def test_round_trip_keeps_computed_descriptions(self):
+        """Test that property-based descriptions reach the schema."""
+        context = EnvironmentalContext(
+            waves=WaveContext(
+                significant_height_ft=2.5,
+                peak_period_seconds=8.0,
+                direction="NE",
+                energy_description="light",
+            ),
+            sst=SeaSurfaceTempContext(
+                temp_fahrenheit=60.2,
+                temp_celsius=15.7,
+                anomaly="normal",
+                anomaly_degrees=0.2,
+            ),
+            ocean_color=OceanColorContext(chlorophyll_mg_m3=1.25, bloom_status="normal"),
+            hab=HABContext(status="watch", description="HAB season active"),
+        )
+
+        schema = environmental_context_to_schema(context)
+
+        assert schema.waves.description == context.waves.description
+        assert schema.waves.description == "Light chop (2.5 ft) - 8s period - from NE"
+        assert schema.waves.significant_height_ft == 2.5
+        assert schema.sst.description == context.sst.description
+        assert "60.2°F" in schema.sst.description
+        assert schema.ocean_color.description == context.ocean_color.description
+        assert "unavailable" not in schema.ocean_color.description
+        assert schema.hab.description == "HAB season active"
+
+    def test_missing_contexts_stay_none(self):
+        """Test that absent contexts convert to None."""
+        schema = environmental_context_to_schema(EnvironmentalContext())
+
+        assert schema.waves is None
+        assert schema.sst is None
+        assert schema.ocean_color is None
+
+
+class TestAsyncTTLCache:
+    """Tests for the in-memory TTL cache shared by environmental services."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_cache(self, monkeypatch):
+        clear_ttl_cache()
+        self.now = 1000.0
+        monkeypatch.setattr(base.time, "monotonic", lambda: self.now)
+        yield
+        clear_ttl_cache()
+
+    def make_service(self, cache_if=None, negative_ttl=None):
+        class CountingService:
+            calls = 0
+
+            @async_ttl_cache(60, cache_if=cache_if, negative_ttl=negative_ttl)
+            async def fetch(self, value):
+                CountingService.calls += 1
+                return value
+
+        return CountingService
+
+    @pytest.mark.asyncio
+    async def test_hit_within_ttl(self):
+        """Test that a repeat call within the TTL is served from the cache."""
+        service_cls = self.make_service()
+
+        assert await service_cls().fetch(1) == 1
+        self.now += 59
+        assert await service_cls().fetch(1) == 1
+        assert service_cls.calls == 1
+
+        # Different arguments are cached separately
+        assert await service_cls().fetch(2) == 2
+        assert service_cls.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_expiry_refetches_and_prunes(self):
+        """Test that expired entries are refetched and dropped on write."""
+        service_cls = self.make_service()
+
+        await service_cls().fetch(1)
+        await service_cls().fetch(2)
+        self.now += 61
+        await service_cls().fetch(1)
+
+        assert service_cls.calls == 3
+        assert len(base._ttl_cache) == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_if_skips_rejected_results(self):
+        """Test that results failing cache_if are returned but not stored."""
+        service_cls = self.make_service(cache_if=lambda value: value is not None)
+
+        assert await service_cls().fetch(None) is None
+        assert await service_cls().fetch(None) is None
+        assert service_cls.calls == 2
+        assert not base._ttl_cache
+
+    @pytest.mark.asyncio
+    async def test_negative_ttl_caches_rejected_results_briefly(self):
+        """Test that results failing cache_if are stored for negative_ttl only."""
+        service_cls = self.make_service(cache_if=lambda value: value is not None, negative_ttl=10)
+
+        assert await service_cls().fetch(None) is None
+        self.now += 9
+        assert await service_cls().fetch(None) is None
+        assert service_cls.calls == 1
+
+        self.now += 2
+        await service_cls().fetch(None)
+        assert service_cls.calls == 2
+
+        # Accepted results still get the full TTL
+        await service_cls().fetch(1)
+        self.now += 59
+        await service_cls().fetch(1)
+        assert service_cls.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_hab_status_keyed_by_month(self):
+        """Test that a cached off-season HAB status isn't served in season."""
+        service = HABForecastService()
+
+        off_season = await service._get_status_for_month(6)
+        in_season = await service._get_status_for_month(7)
+
+        assert off_season.status == "none"
+        assert in_season.status == "watch"
+
+
+@dataclass(frozen=True)
+class SampleContext:
+    """Stand-in context for persistent cache tests."""
+    value: Optional[float] = None
+
+
+class TestPersistentDailyCache:
+    """Tests for the SQLite-backed daily cache."""
+
+    @pytest.fixture(autouse=True)
+    def temp_cache(self, tmp_path, monkeypatch):
+        self.cache = PersistentCache(str(tmp_path / "cache.sqlite3"))
+        monkeypatch.setattr(base, "_persistent_cache", self.cache)
+
+    def make_service(self):
+        class DailyService:
+            DATASET_ID = "sample"
+            VARIABLE = "value"
+            calls = 0
+
+            @persistent_daily_cache(3600, SampleContext, cache_if=lambda ctx: ctx.value is not None)
+            async def fetch(self, value=None):
+                DailyService.calls += 1
+                return SampleContext(value=value)
+
+        return DailyService
+
+    def test_get_set_round_trip(self):
+        """Test that stored values come back unchanged."""
+        self.cache.set("key", {"value": 1.5, "label": "x"}, ttl_seconds=60)
+        assert self.cache.get("key") == {"value": 1.5, "label": "x"}
+        assert self.cache.get("missing") is None
+
+    def test_expired_entries_are_misses(self, monkeypatch):
+        """Test that entries past their TTL read as missing."""
+        self.cache.set("key", {"value": 1.0}, ttl_seconds=60)
+        later = time.time() + 61
+        monkeypatch.setattr(base.time, "time", lambda: later)
+        assert self.cache.get("key") is None
+
+    @pytest.mark.asyncio
+    async def test_decorator_rebuilds_stored_context(self):
+        """Test that a stored result is served without calling the service."""
+        service_cls = self.make_service()
+
+        assert await service_cls().fetch(12.5) == SampleContext(value=12.5)
+        assert await service_cls().fetch(99.0) == SampleContext(value=12.5)
+        assert service_cls.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_decorator_skips_results_failing_cache_if(self):
+        """Test that unavailable results are not persisted."""
+        service_cls = self.make_service()
+
+        await service_cls().fetch(None)
+        await service_cls().fetch(None)
+        assert service_cls.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_layout_is_refetched(self):
+        """Test that a value stored under old field names is ignored."""
+        key = f"sample:value:{date.today().isoformat()}"
+        self.cache.set(key, {"old_field": 1.0}, ttl_seconds=3600)
+        service_cls = self.make_service()
+
+        assert await service_cls().fetch(3.0) == SampleContext(value=3.0)
+        assert service_cls.calls == 1
+        assert self.cache.get(key) == {"value": 3.0}
+
+
+def mock_client(handler) -> httpx.AsyncClient:
+    """HTTP client whose requests are answered by handler."""
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+class TestFetchLimitedText:
+    """Tests for the size-capped response reader."""
+
+    @pytest.mark.asyncio
+    async def test_returns_body_under_limit(self):
+        """Test that a small body is returned as text."""
+        async with mock_client(lambda request: httpx.Response(200, text="a,b\n1,2")) as client:
+            assert await fetch_limited_text(client, "https://example.com", max_bytes=100) == "a,b\n1,2"
+
+    @pytest.mark.asyncio
+    async def test_rejects_oversized_content_length(self):
+        """Test that a declared size over the cap is refused up front."""
+        def handler(request):
+            return httpx.Response(200, headers={"content-length": "1000"}, content=b"x" * 1000)
+
+        async with mock_client(handler) as client:
+            with pytest.raises(ResponseTooLargeError, match="Content-Length"):
+                await fetch_limited_text(client, "https://example.com", max_bytes=100)
+
+    @pytest.mark.asyncio
+    async def test_rejects_overflow_while_streaming(self):
+        """Test that an undeclared body is cut off once it passes the cap."""
+        chunks_sent = []
+
+        class Body(httpx.AsyncByteStream):
+            async def __aiter__(self):
+                for _ in range(10):
+                    chunks_sent.append(1)
+                    yield b"x" * 40
+
+        async with mock_client(lambda request: httpx.Response(200, stream=Body())) as client:
+            with pytest.raises(ResponseTooLargeError, match="exceeds 100 bytes"):
+                await fetch_limited_text(client, "https://example.com", max_bytes=100)
+
+        assert len(chunks_sent) == 3
+
+    @pytest.mark.asyncio
+    async def test_raises_on_http_error(self):
+        """Test that error statuses surface as HTTPStatusError."""
+        async with mock_client(lambda request: httpx.Response(404)) as client:
+            with pytest.raises(httpx.HTTPStatusError):
+                await fetch_limited_text(client, "https://example.com")
+
+
+GRIDDAP_CSV = """time,latitude,longitude,analysed_sst
+UTC,degrees_north,degrees_east,degree_C
+2024-07-16T09:00:00Z,42.6,-70.9,NaN
+2024-07-16T09:00:00Z,42.6,-70.8,18.5
+2024-07-16T09:00:00Z,42.7,-70.9,19.25
+"""
+
+
+class TestParseGriddapCsv:
+    """Tests for the ERDDAP griddap CSV parser."""
+
+    def test_skips_units_row(self):
+        """Test that the units row is not parsed as data."""
+        columns = parse_griddap_csv(GRIDDAP_CSV)
+        assert columns["latitude"] == [42.6, 42.6, 42.7]
+        assert "degrees_north" not in columns["latitude"]
+
+    def test_drops_missing_values_by_default(self):
+        """Test that NaN cells are dropped from numeric columns."""
+        columns = parse_griddap_csv(GRIDDAP_CSV)
+        assert columns["analysed_sst"] == [18.5, 19.25]
+
+    def test_keeps_missing_values_aligned(self):
+        """Test that drop_missing=False keeps NaN so rows stay aligned."""
+        columns = parse_griddap_csv(GRIDDAP_CSV, drop_missing=False)
+        sst = columns["analysed_sst"]
+        assert len(sst) == len(columns["longitude"]) == 3
+        assert math.isnan(sst[0])
+        assert sst[1:] == [18.5, 19.25]
+
+    def test_string_columns_stay_strings(self):
+        """Test that non-numeric columns such as time are kept as text."""
+        columns = parse_griddap_csv(GRIDDAP_CSV)
+        assert columns["time"] == ["2024-07-16T09:00:00Z"] * 3
+
+    def test_empty_and_header_only_input(self):
+        """Test that missing data rows produce empty columns, not errors."""
+        assert parse_griddap_csv("") == {}
+        assert parse_griddap_csv("time,chlor_a\nUTC,mg m-3\n") == {"time": [], "chlor_a": []}
+
+    def test_skips_truncated_rows(self):
+        """Test that a short or blank row doesn't truncate other columns."""
+        text = "latitude,chlor_a\ndegrees_north,mg m-3\n42.6,1.5\n42.7\n\n42.8,2.5\n"
+        assert parse_griddap_csv(text) == {"latitude": [42.6, 42.8], "chlor_a": [1.5, 2.5]}
+
+
+class TestERDDAPValuesAt:
+    """Tests for multi-point lookups against a single ERDDAP grid."""
+
+    GRID_CSV = (
+        "time,latitude,longitude,analysed_sst\n"
+        "UTC,degrees_north,degrees_east,degree_C\n"
+        "2024-07-16T09:00:00Z,42.6,-70.9,15.0\n"
+        "2024-07-16T09:00:00Z,42.6,-70.8,16.0\n"
+        "2024-07-16T09:00:00Z,42.7,-70.9,NaN\n"
+        "2024-07-16T09:00:00Z,42.7,-70.8,18.0\n"
+    )
+
+    @pytest.mark.asyncio
+    async def test_points_resolve_to_nearest_cell_with_data(self):
+        """Test each point's cell, skipping NaN (land/cloud) cells."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, text=self.GRID_CSV)
+
+        points = [
+            (42.61, -70.89),  # next to (42.6, -70.9)
+            (42.62, -70.81),  # next to (42.6, -70.8)
+            (42.69, -70.79),  # next to (42.7, -70.8)
+            (42.70, -70.91),  # nearest cell is NaN; next nearest is (42.6, -70.9)
+        ]
+        async with mock_client(handler) as client:
+            erddap = ERDDAPClient(base_url="https://erddap.test/erddap", client=client)
+            values = await erddap.get_values_at("jplMURSST41", "analysed_sst", points)
+
+        assert values == {
+            (42.61, -70.89): 15.0,
+            (42.62, -70.81): 16.0,
+            (42.69, -70.79): 18.0,
+            (42.70, -70.91): 15.0,
+        }
+        assert len(requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_no_points_makes_no_request(self):
+        """Test that an empty point list returns without querying."""
+        async with mock_client(lambda request: pytest.fail("unexpected request")) as client:
+            erddap = ERDDAPClient(client=client)
+            assert await erddap.get_values_at("jplMURSST41", "analysed_sst", []) == {}
+
+    @pytest.mark.asyncio
+    async def test_all_missing_returns_none(self):
+        """Test that points map to None when the grid has no data."""
+        text = "latitude,longitude,analysed_sst\ndegrees_north,degrees_east,degree_C\n42.6,-70.9,NaN\n"
+        async with mock_client(lambda request: httpx.Response(200, text=text)) as client:
+            erddap = ERDDAPClient(client=client)
+            values = await erddap.get_values_at("jplMURSST41", "analysed_sst", [(42.6, -70.9)])
+
+        assert values == {(42.6, -70.9): None}
+
+
+class TestDegreesToCompass:
+    """Tests for bearing-to-compass conversion."""
+
+    def test_cardinal_and_intercardinal_points(self):
+        """Test exact bearings for each point."""
+        assert degrees_to_compass(0) == "N"
+        assert degrees_to_compass(45) == "NE"
+        assert degrees_to_compass(202.5) == "SSW"
+        assert degrees_to_compass(337.5) == "NNW"
+        assert degrees_to_compass(360) == "N"
+
+    def test_half_sector_ties_round_half_to_even(self):
+        """Test that bearings exactly between two points use round()'s half-to-even rule."""
+        assert degrees_to_compass(11.25) == "N"  # 0.5 sectors -> 0
+        assert degrees_to_compass(33.75) == "NE"  # 1.5 sectors -> 2
+        assert degrees_to_compass(56.25) == "NE"  # 2.5 sectors -> 2
+
+    def test_negative_bearings_wrap(self):
+        """Test that negative bearings wrap around to the west side."""
+        assert degrees_to_compass(-10) == "N"
+        assert degrees_to_compass(-30) == "NNW"
+        assert degrees_to_compass(-90) == "W"
+
+
+class TestDroughtParsing:
+    """Tests for USDM record parsing."""
+
+    def test_parse_map_date_formats(self):
+        """Test compact, ISO and timestamp map dates."""
+        assert _parse_map_date("20240102") == date(2024, 1, 2)
+        assert _parse_map_date(20240102) == date(2024, 1, 2)
+        assert _parse_map_date("2024-01-02T00:00:00") == date(2024, 1, 2)
+
+    def test_parse_map_date_rejects_garbage(self):
+        """Test that empty or unparseable values give None."""
+        assert _parse_map_date(None) is None
+        assert _parse_map_date("") is None
+        assert _parse_map_date("Jan 2") is None
+
+    def test_worst_covered_level_wins(self):
+        """Test that the most severe level with any coverage is reported."""
+        context = _parse_drought_record({"D0": "100.0", "D1": "42.5", "D2": "0.0"})
+
+        assert context.severity == "D1"
+        assert context.severity_name == "Moderate Drought"
+        assert context.percent_area_affected == 42.5
+        assert "42.5% of Essex County" in context.description
+
+    def test_no_coverage_is_no_drought(self):
+        """Test that a record with zero coverage everywhere means no drought."""
+        assert _parse_drought_record({"None": "100.0", "D0": "0"}) == DroughtContext()
+
+
+class TestDroughtRange:
+    """Tests for the batched USDM range lookup."""
+
+    @pytest.fixture(autouse=True)
+    def usdm(self, monkeypatch):
+        """Answer USDM requests from self.payload and record each request."""
+        self.payload = []
+        self.requests = []
+
+        def handler(request):
+            self.requests.append(request)
+            return httpx.Response(200, json=self.payload)
+
+        transport = httpx.MockTransport(handler)
+        real_client = httpx.AsyncClient
+        monkeypatch.setattr(
+            land_services.httpx, "AsyncClient",
+            lambda **kwargs: real_client(transport=transport, **kwargs),
+        )
+
+    @pytest.mark.asyncio
+    async def test_range_keys_results_by_map_date(self):
+        """Test that one request returns a context per weekly map."""
+        self.payload = [
+            {"MapDate": "20240102", "D0": "10.0"},
+            {"MapDate": "20240109", "D2": "5.0"},
+        ]
+        service = DroughtMonitorService()
+
+        results = await service.get_drought_range(date(2024, 1, 1), date(2024, 1, 10))
+
+        assert len(self.requests) == 1
+        assert self.requests[0].url.params["startdate"] == "2024-01-01"
+        assert self.requests[0].url.params["enddate"] == "2024-01-10"
+        assert {d: c.severity for d, c in results.items()} == {
+            date(2024, 1, 2): "D0",
+            date(2024, 1, 9): "D2",
+        }
+
+    @pytest.mark.asyncio
+    async def test_range_fills_single_date_cache(self):
+        """Test that map dates fetched by range are served without a request."""
+        self.payload = [{"MapDate": "20240102", "D1": "20.0"}]
+        service = DroughtMonitorService()
+        await service.get_drought_range(date(2024, 1, 1), date(2024, 1, 7))
+
+        context = await service.get_drought_status(date(2024, 1, 2))
+
+        assert context.severity == "D1"
+        assert len(self.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_empty_response_gives_empty_range(self):
+        """Test that an empty USDM payload returns no contexts."""
+        service = DroughtMonitorService()
+
+        assert await service.get_drought_range(date(2024, 1, 1), date(2024, 1, 7)) == {}
+
+    @pytest.mark.asyncio
+    async def test_cache_is_capped(self, monkeypatch):
+        """Test that the oldest cached maps are evicted past the cap."""
+        monkeypatch.setattr(land_services, "DROUGHT_CACHE_MAX_ENTRIES", 2)
+        self.payload = [
+            {"MapDate": "20240102", "D0": "1.0"},
+            {"MapDate": "20240109", "D0": "1.0"},
+            {"MapDate": "20240116", "D0": "1.0"},
+        ]
+        service = DroughtMonitorService()
+
+        await service.get_drought_range(date(2024, 1, 1), date(2024, 1, 20))
+
+        assert list(service._drought_cache) == [date(2024, 1, 9), date(2024, 1, 16)]
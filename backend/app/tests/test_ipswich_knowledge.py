@@ -0,0 +1,296 @@
+"""Tests for the Ipswich knowledge base lookup helpers."""
+
+from app.services.ipswich_knowledge import (
+    BIRDS_BY_SEASON,
+    COORDS_KEYS,
+    SIGHTINGS_SOA,
+    WILDLIFE_BY_SEASON,
+    best_match,
+    businesses_by_type,
+    businesses_on_street,
+    find_proper_nouns,
+    find_records,
+    find_species,
+    find_years,
+    fish_in_season,
+    get_business_by_address,
+    get_fact,
+    get_house,
+    historical_figures_by_era,
+    houses_built_before,
+    houses_built_between,
+    nearest,
+    schools_for_grade,
+    seasonal_summary,
+    sightings,
+)
+
+
+class TestFindRecords:
+    """Tests for keyword and phrase search over the knowledge base."""
+
+    def test_single_word_matches_any_field(self):
+        """Test that a one-word query matches names and descriptions."""
+        results = find_records("Crane")
+
+        assert ("natural_features", "Crane Beach") in results
+        assert ("natural_features", "Castle Hill and the Crane Estate") in results
+
+    def test_query_ignores_case_and_punctuation(self):
+        """Test that queries are tokenized like the indexed text."""
+        assert find_records("GREAT, marsh!") == find_records("great marsh")
+
+    def test_two_word_phrase(self):
+        """Test that a two-word query matches the phrase, not the words apart."""
+        assert find_records("great marsh") == [("natural_features", "The Great Marsh")]
+        assert ("natural_features", "Crane Beach") in find_records("barrier beach")
+
+    def test_longer_phrase_must_be_contiguous(self):
+        """Test that sharing every bigram of a query is not enough."""
+        # Crane Beach has "towering dunes" and "the dunes rise" but never
+        # "towering dunes rise"
+        assert find_records("towering dunes rise") == []
+        assert ("natural_features", "Crane Beach") in find_records("the dunes rise sixty feet")
+
+    def test_unknown_and_empty_queries(self):
+        """Test that unmatched or wordless queries return nothing."""
+        assert find_records("zeppelin") == []
+        assert find_records("") == []
+        assert find_records("1634") == []
+
+
+class TestDerivedLookups:
+    """Tests for the memoized era, season and business type lookups."""
+
+    def test_figures_by_era_overlap(self):
+        """Test that figures whose lifetimes overlap the range are returned."""
+        assert historical_figures_by_era(1700, 1720) == ("jenny_slew", "reverend_john_wise")
+        assert "arthur_wesley_dow" in historical_figures_by_era(1900, 1900)
+        assert historical_figures_by_era(1950, 2000) == ()
+
+    def test_seasonal_summary_pairs_names_with_notes(self):
+        """Test that each feature's note for the season is paired with its name."""
+        summary = dict(seasonal_summary("Winter"))
+
+        assert summary["Crane Beach"].startswith("Storm surf")
+        assert all(summary.values())
+        assert seasonal_summary("monsoon") == ()
+
+    def test_businesses_by_type_ignores_case(self):
+        """Test that business types are matched case-insensitively."""
+        assert businesses_by_type("coffee SHOP") == ("zumis_coffee", "little_wolf_coffee")
+        assert businesses_by_type("bakery") == ()
+
+
+class TestBestMatch:
+    """Tests for fuzzy place and business name matching."""
+
+    def test_exact_name_ignores_case_and_whitespace(self):
+        """Test that an exact name is returned in its display form."""
+        assert best_match("  CRANE BEACH ") == "Crane Beach"
+
+    def test_substring_and_misspelling(self):
+        """Test that partial and misspelled names resolve to the closest name."""
+        assert best_match("crane estat") == "Castle Hill and the Crane Estate"
+        assert best_match("clam boxx") == "The Clam Box"
+
+    def test_no_close_name(self):
+        """Test that an unrelated query returns None."""
+        assert best_match("qqqqzz") is None
+
+
+class TestFindProperNouns:
+    """Tests for the single-pass proper noun scan."""
+
+    def test_names_found_in_order_with_records(self):
+        """Test that each known name maps to its collection and key."""
+        text = "From Ipswich High School we walked to Crane Beach and The Great Marsh."
+
+        assert find_proper_nouns(text) == [
+            ("Ipswich High School", ("ipswich_schools", "ipswich_high_school")),
+            ("Crane Beach", ("natural_features", "Crane Beach")),
+            ("The Great Marsh", ("natural_features", "The Great Marsh")),
+        ]
+
+    def test_longest_overlapping_name_wins(self):
+        """Test that a long name is not split into a shorter one it contains."""
+        found = find_proper_nouns("Tours of Castle Hill and the Crane Estate run daily.")
+
+        assert [name for name, _ in found] == ["Castle Hill and the Crane Estate"]
+
+    def test_matching_is_case_sensitive(self):
+        """Test that lowercase mentions are not treated as proper nouns."""
+        assert find_proper_nouns("a crane on the beach") == []
+
+
+class TestBusinessAddressIndex:
+    """Tests for business lookup by address and street."""
+
+    def test_address_normalizes_case_and_spacing(self):
+        """Test that addresses match regardless of case and extra spaces."""
+        assert get_business_by_address("246 High Street") == "clam_box"
+        assert get_business_by_address("  246  high   STREET ") == "clam_box"
+        assert get_business_by_address("1 Nowhere Lane") is None
+
+    def test_street_lists_every_business_in_order(self):
+        """Test that a street returns all businesses on it, in catalog order."""
+        assert businesses_on_street("High Street") == ("clam_box", "little_wolf_coffee", "fox_creek_tavern")
+        assert businesses_on_street("linebrook road") == ("wolf_hill_garden_center", "1640_hart_house", "marini_farm")
+        assert businesses_on_street("Nowhere Lane") == ()
+
+
+class TestNearest:
+    """Tests for nearest-place lookup over the float32 coordinate columns."""
+
+    def test_closest_places_sorted_by_distance(self):
+        """Test that results are the k closest places, nearest first."""
+        results = nearest(42.6835, -70.7662, k=2)
+
+        assert [name for name, _ in results] == ["Crane Beach", "Castle Hill and the Crane Estate"]
+        assert results[0][1] < 0.01
+        assert 0.9 < results[1][1] < 1.0
+
+    def test_k_larger_than_catalog(self):
+        """Test that asking for more places than exist returns them all."""
+        assert len(nearest(42.68, -70.84, k=100)) == len(COORDS_KEYS)
+
+
+class TestFishInSeason:
+    """Tests for river fish run lookup by day of year."""
+
+    def test_runs_include_both_endpoints(self):
+        """Test that a run's first and last days count as in season."""
+        assert "alewife" in fish_in_season(85)
+        assert "alewife" in fish_in_season(135)
+        assert "alewife" not in fish_in_season(136)
+
+    def test_overlapping_runs(self):
+        """Test that every run covering a day is returned in catalog order."""
+        assert fish_in_season(150) == ("blueback_herring", "american_eel", "striped_bass")
+        assert fish_in_season(1) == ("american_eel",)
+
+
+class TestSchoolsForGrade:
+    """Tests for school lookup by grade bitmask."""
+
+    def test_numeric_grades(self):
+        """Test that each grade maps to the school whose span covers it."""
+        assert schools_for_grade(2) == ("doyon_elementary",)
+        assert schools_for_grade(3) == ("winthrop_elementary",)
+        assert schools_for_grade(8) == ("ipswich_middle_school",)
+        assert schools_for_grade(12) == ("ipswich_high_school",)
+
+    def test_named_grades(self):
+        """Test that "K" and "Pre-K" resolve like their numeric levels."""
+        assert schools_for_grade("K") == schools_for_grade(0) == ("doyon_elementary",)
+        assert schools_for_grade("Pre-K") == ("doyon_elementary",)
+
+    def test_grade_outside_every_span(self):
+        """Test that a grade no school serves returns nothing."""
+        assert schools_for_grade(13) == ()
+
+
+class TestHousesBuiltBefore:
+    """Tests for the First Period construction-year filter."""
+
+    def test_uses_earliest_year_of_each_span(self):
+        """Test that ranges and alternate dates compare by their earliest year."""
+        assert houses_built_before(1659) == ("Thomas Lord House", "Giddings-Burnham House")
+
+    def test_cutoff_year_is_exclusive(self):
+        """Test that a house built in the cutoff year is not included."""
+        assert "Thomas Lord House" not in houses_built_before(1658)
+        assert houses_built_before(1600) == ()
+
+
+class TestFindSpecies:
+    """Tests for the species index over bird and wildlife notes."""
+
+    def test_single_word_species(self):
+        """Test that a species is found in every season and category mentioning it."""
+        assert find_species("osprey") == [
+            ("spring", "returning_migrants"),
+            ("spring", "wildlife"),
+            ("summer", "nesting"),
+        ]
+
+    def test_two_word_plural_name(self):
+        """Test that a capitalized plural two-word name matches its singular."""
+        assert find_species("Snowy Owls") == find_species("snowy owl") == [
+            ("winter", "raptors"),
+            ("winter", "wildlife"),
+        ]
+
+    def test_unknown_species(self):
+        """Test that an unmentioned species returns an empty list."""
+        assert find_species("dragon") == []
+
+
+class TestHouseAndFactIndexes:
+    """Tests for First Period house and historical fact lookup by name."""
+
+    def test_get_house_ignores_case(self):
+        """Test that a house is found by its name in any case."""
+        house = get_house("thomas DENNIS house")
+
+        assert house is not None
+        assert house.name == "Thomas Dennis House"
+        assert get_house("Paul Revere House") is None
+
+    def test_get_fact_ignores_case(self):
+        """Test that a fact is found by its exact topic in any case."""
+        fact = get_fact("the choate bridge")
+
+        assert fact is not None
+        assert fact.topic == "The Choate Bridge"
+        assert get_fact("Choate") is None
+
+
+class TestFindYears:
+    """Tests for year extraction from free text."""
+
+    def test_years_in_range_in_order(self):
+        """Test that four-digit years from 1500 to 2099 are returned in order."""
+        assert find_years("Built c. 1640/1680, restored 1999.") == [1640, 1680, 1999]
+
+    def test_out_of_range_and_embedded_digits(self):
+        """Test that other numbers and digits inside longer numbers are skipped."""
+        assert find_years("1499, 2100, 12345 and 246 High Street") == []
+
+
+class TestSightings:
+    """Tests for the flattened bird and wildlife sightings table."""
+
+    def test_filter_by_season_and_category(self):
+        """Test that both filters narrow to the matching source bullets."""
+        assert sightings("winter", "raptors") == BIRDS_BY_SEASON["winter"]["raptors"]
+        assert sightings("summer", "wildlife") == WILDLIFE_BY_SEASON["summer"]
+
+    def test_no_filters_returns_every_row(self):
+        """Test that unfiltered sightings cover the whole table."""
+        assert len(sightings()) == len(SIGHTINGS_SOA["text"])
+        assert set(sightings("winter")) <= set(sightings())
+
+    def test_year_round_notes_are_left_out(self):
+        """Test that the string-valued year_round_notes are not split into rows."""
+        assert sightings(category="year_round_notes") == ()
+
+
+class TestHousesBuiltBetween:
+    """Tests for the packed First Period construction-span filter."""
+
+    def test_spans_overlapping_the_range(self):
+        """Test that a house matches when any part of its span falls in the range."""
+        assert houses_built_between(1700, 1720) == ("Thomas Dennis House",)
+        assert houses_built_between(1679, 1679) == (
+            "Thomas Dennis House", "Hart House", "Giddings-Burnham House",
+        )
+
+    def test_single_year_span(self):
+        """Test that a single construction year is a one-year span."""
+        assert "Captain John Whipple House" in houses_built_between(1677, 1677)
+        assert "Captain John Whipple House" not in houses_built_between(1678, 1700)
+
+    def test_range_before_any_house(self):
+        """Test that a range with no construction returns nothing."""
+        assert houses_built_between(1500, 1600) == ()
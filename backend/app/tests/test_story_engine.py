@@ -1,7 +1,12 @@
 """Tests for the story engine and context building."""
 
+import asyncio
+import functools
 from datetime import date
+from types import SimpleNamespace
+from unittest.mock import Mock
 
+import httpx
 import pytest
 
 from app.schemas.story import (
@@ -11,8 +16,87 @@ from app.schemas.story import (
     TideContext,
     WeatherContext,
 )
-from app.services.story_engine import TemplateStoryGenerator
-from app.services.tide_service import TideService
+from app.models.story import StoryChapter
+from app.services.story_engine import StoryEngine, TemplateStoryGenerator
+from app.services import tide_service
+from app.services.environmental import base
+from app.services.environmental.base import clear_ttl_cache
+from app.services.tide_service import TIDE_NEGATIVE_CACHE_TTL, TideService
+
+
+def make_context(target_date: date) -> StoryContext:
+    """Build a minimal story context for a date."""
+    return StoryContext(
+        weather=WeatherContext(condition="Clear", summary="Clear sky."),
+        tide=TideContext(state="rising", height=5.5),
+        season=SeasonContext(
+            season="Summer",
+            month_name="July",
+            day_of_week="Tuesday",
+            day_length="long",
+            date=target_date,
+        ),
+        news_items=[],
+        location="Ipswich, MA",
+    )
+
+
+class FakeScalars:
+    """Stand-in for SQLAlchemy's ScalarResult."""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def all(self):
+        return list(self.rows)
+
+
+class FakeResult:
+    """Stand-in for SQLAlchemy's Result."""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def scalars(self):
+        return FakeScalars(self.rows)
+
+
+class FakeSession:
+    """Records adds and flushes; answers each execute() with the next canned rows."""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.executed = 0
+        self.added = []
+        self.flushes = 0
+
+    async def execute(self, statement):
+        self.executed += 1
+        return FakeResult(self.results.pop(0))
+
+    def add(self, obj):
+        self.added.append(obj)
+
+    def add_all(self, objs):
+        self.added.extend(objs)
+
+    async def flush(self):
+        self.flushes += 1
+
+
+class RecordingGenerator:
+    """Generator that accepts recent chapters and records what it was given."""
+
+    def __init__(self):
+        self.seen = {}
+
+    async def generate(self, context, recent_chapters=None):
+        target_date = context.season.date
+        self.seen[target_date] = [ch.chapter_date for ch in recent_chapters or []]
+        return f"Title {target_date}", f"Body for {target_date}."
 
 
 class TestSeasonContext:
@@ -93,6 +177,67 @@ class TestTideService:
         assert "low" in desc.lower() or "out" in desc.lower()
 
 
+class TestTidePredictionCache:
+    """Tests for caching of NOAA tide predictions."""
+
+    @pytest.fixture(autouse=True)
+    def noaa(self, monkeypatch):
+        """Answer NOAA requests from self.handler on a frozen clock."""
+        clear_ttl_cache()
+        self.now = 1000.0
+        self.requests = []
+        self.handler = lambda request: httpx.Response(200, json={"predictions": []})
+
+        def handler(request):
+            self.requests.append(request)
+            return self.handler(request)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(tide_service, "get_http_client", lambda: client)
+        monkeypatch.setattr(base.time, "monotonic", lambda: self.now)
+        yield
+        clear_ttl_cache()
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_is_cached_briefly(self):
+        """Test that an outage is retried only after the negative TTL."""
+        self.handler = lambda request: httpx.Response(503)
+        service = TideService()
+
+        assert await service._get_predictions("8440452", date(2024, 6, 15)) == []
+        self.now += TIDE_NEGATIVE_CACHE_TTL - 1
+        assert await service._get_predictions("8440452", date(2024, 6, 15)) == []
+        assert len(self.requests) == 1
+
+        self.now += 2
+        await service._get_predictions("8440452", date(2024, 6, 15))
+        assert len(self.requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_falls_back_to_simulation(self):
+        """Test that a NOAA error still yields a simulated tide."""
+        self.handler = lambda request: httpx.Response(503)
+        service = TideService()
+
+        tide = await service.get_tide_for_date(date(2024, 6, 15))
+
+        assert tide == service._simulate_tide(date(2024, 6, 15))
+
+    @pytest.mark.asyncio
+    async def test_stations_are_cached_separately(self):
+        """Test that predictions for one station are not served for another."""
+        self.handler = lambda request: httpx.Response(200, json={"predictions": [
+            {"t": "2024-06-15 04:12", "v": "9.1", "type": "H"},
+        ]})
+        service = TideService()
+
+        await service._get_predictions("8440452", date(2024, 6, 15))
+        await service._get_predictions("8440452", date(2024, 6, 15))
+        await service._get_predictions("8443970", date(2024, 6, 15))
+
+        assert [request.url.params["station"] for request in self.requests] == ["8440452", "8443970"]
+
+
 class TestTemplateStoryGenerator:
     """Tests for the template-based story generator."""
 
@@ -232,3 +377,119 @@ class TestNewsWeaving:
         """Test handling empty news items list."""
         result = generator._weave_news([])
         assert result == ""
+
+
+class TestStoryEngineInit:
+    """Tests for detecting whether a generator takes recent chapters."""
+
+    def test_detects_recent_chapters_parameter(self):
+        """Test that a generate() with recent_chapters is detected."""
+        assert StoryEngine(FakeSession(), generator=RecordingGenerator())._generator_takes_recent
+        assert not StoryEngine(FakeSession())._generator_takes_recent
+
+    def test_uninspectable_generators_default_to_false(self):
+        """Test that mocks, partials and odd generators don't break construction."""
+        async def generate(context, recent_chapters=None):
+            return "Title", "Body."
+
+        partial_generator = SimpleNamespace(generate=functools.partial(generate))
+        assert StoryEngine(FakeSession(), generator=partial_generator)._generator_takes_recent
+
+        assert not StoryEngine(FakeSession(), generator=Mock())._generator_takes_recent
+        assert not StoryEngine(FakeSession(), generator=SimpleNamespace(generate=len))._generator_takes_recent
+        assert not StoryEngine(FakeSession(), generator=SimpleNamespace())._generator_takes_recent
+
+
+class TestStoryEngineBatch:
+    """Tests for generating chapters for several dates at once."""
+
+    @pytest.mark.asyncio
+    async def test_splits_existing_and_missing(self):
+        """Test that existing chapters are kept and only missing ones generated."""
+        existing = StoryChapter(chapter_date=date(2024, 7, 2), title="Kept", body="Old.")
+        db = FakeSession([existing])
+        engine = StoryEngine(db)
+
+        dates = [date(2024, 7, 1), date(2024, 7, 2), date(2024, 7, 3)]
+        chapters = await engine.generate_stories_for_dates(
+            [(make_context(d), d) for d in dates]
+        )
+
+        assert [ch.chapter_date for ch in chapters] == dates
+        assert chapters[1] is existing
+        assert existing.title == "Kept"
+        assert [ch.chapter_date for ch in db.added] == [date(2024, 7, 1), date(2024, 7, 3)]
+        assert all(ch.title and ch.body for ch in db.added)
+        assert db.executed == 1
+        assert db.flushes == 1
+
+    @pytest.mark.asyncio
+    async def test_force_regenerate_updates_existing(self):
+        """Test that force_regenerate rewrites existing chapters in place."""
+        existing = StoryChapter(chapter_date=date(2024, 7, 2), title="Old", body="Old.")
+        db = FakeSession([existing])
+        engine = StoryEngine(db)
+
+        dates = [date(2024, 7, 2), date(2024, 7, 3)]
+        chapters = await engine.generate_stories_for_dates(
+            [(make_context(d), d) for d in dates],
+            force_regenerate=True,
+        )
+
+        assert chapters[0] is existing
+        assert existing.title != "Old"
+        assert existing.generation_context["season"]["season"] == "Summer"
+        assert db.added == [chapters[1]]
+        assert db.flushes == 1
+
+    @pytest.mark.asyncio
+    async def test_empty_batch_touches_nothing(self):
+        """Test that an empty batch makes no queries."""
+        db = FakeSession()
+        assert await StoryEngine(db).generate_stories_for_dates([]) == []
+        assert db.executed == 0
+        assert db.flushes == 0
+
+    @pytest.mark.asyncio
+    async def test_batch_chapters_feed_recent_window(self, monkeypatch):
+        """Test that later groups see earlier chapters from the same batch."""
+        monkeypatch.setattr("app.services.story_engine.BATCH_GENERATION_CONCURRENCY", 2)
+        older = StoryChapter(chapter_date=date(2024, 6, 1), title="Older", body="Old.")
+        db = FakeSession([], [older])
+        generator = RecordingGenerator()
+        engine = StoryEngine(db, generator=generator)
+
+        dates = [date(2024, 7, d) for d in range(1, 6)]
+        await engine.generate_stories_for_dates([(make_context(d), d) for d in dates])
+
+        assert generator.seen[date(2024, 7, 1)] == [date(2024, 6, 1)]
+        assert generator.seen[date(2024, 7, 2)] == [date(2024, 6, 1)]
+        assert generator.seen[date(2024, 7, 3)] == [
+            date(2024, 7, 2), date(2024, 7, 1), date(2024, 6, 1),
+        ]
+        assert generator.seen[date(2024, 7, 5)][:2] == [date(2024, 7, 4), date(2024, 7, 3)]
+        assert db.flushes == 1
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrent_generation(self, monkeypatch):
+        """Test that no more than the configured number of stories run at once."""
+        monkeypatch.setattr("app.services.story_engine.BATCH_GENERATION_CONCURRENCY", 3)
+        running = peak = 0
+
+        class SlowGenerator:
+            async def generate(self, context):
+                nonlocal running, peak
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0)
+                running -= 1
+                return "Title", "Body."
+
+        db = FakeSession([])
+        dates = [date(2024, 7, d) for d in range(1, 11)]
+        await StoryEngine(db, generator=SlowGenerator()).generate_stories_for_dates(
+            [(make_context(d), d) for d in dates]
+        )
+
+        assert peak == 3
+        assert len(db.added) == 10